@@ -21,6 +21,7 @@ type_map = {
 # --- Protocol Constants ---
 PROTOCOL_VERSION = 1  # Major version; can extend later
 MAX_PACKET_SIZE = 220  # Total packet size (bytes)
+MAX_PAYLOAD_SIZE = 205  # Largest message payload (bytes)
 HEADER_SIZE = 15
 SYNC_BYTE = 0xFF  
 
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# Speed measurements for the low level packet format, run: python3 benchmarks.py
+import time
+from base import *
+from message_structure import Messages
+from test_protocol import *
+from routing import AddressTrie
+from schemas import count_compositions, iter_compositions, optimize_schema
+
+def timeit(func, n=100000):
+    start = time.perf_counter()
+    for _ in range(n):
+        func()
+    return n / (time.perf_counter() - start)
+
+def encode_speed():
+    flags = BinaryFlag.ACK_REQUEST
+    msg = Messages.Command.Mission.SET_MISSION
+    buffer = bytearray(MAX_PACKET_SIZE)
+    for name, routing, schema, src, dst in (
+        ("schema", RoutingFlag.ROUTE_SCHEMA, 2, [3, 7, 1], [255, 15, 15]),
+        ("simple", RoutingFlag(0), 0, [5], [1048575]),
+    ):
+        payload = b"\x05"
+        rate = timeit(lambda: encode_packet(flags, routing, schema, src, dst, msg, payload))
+        print(f"encode_packet ({name}): {rate:,.0f} packets/s")
+        rate = timeit(lambda: encode_packet_into(buffer, flags, routing, schema, src, dst, msg, payload))
+        print(f"encode_packet_into ({name}): {rate:,.0f} packets/s")
+        src_id = pack_address(src, schema)
+        dst_id = pack_address(dst, schema)
+        msg_id = encoded_message_id(msg)
+        payload = bytes(MAX_PAYLOAD_SIZE)
+        rate = timeit(lambda: encode_packet_into(buffer, flags, routing, schema, src_id, dst_id, msg_id, payload))
+        print(f"encode_packet_into ({name}, encoded ids, {len(payload)} B payload): {rate:,.0f} packets/s")
+
+def decode_speed():
+    packet = encode_packet(BinaryFlag.ACK_REQUEST, RoutingFlag.ROUTE_SCHEMA | 0x30, 2, [3, 7, 1], [255, 15, 15],
+                           Messages.Command.Mission.SET_MISSION, b"\x05")
+    print(f"decode_packet (dict): {timeit(lambda: decode_packet(packet)):,.0f} packets/s")
+    print(f"parse_packet: {timeit(lambda: parse_packet(packet)):,.0f} packets/s")
+
+    def forward():
+        # What a relay needs: TTL and destination
+        record = parse_packet(packet)
+        return record.ttl, record.dest_int
+    print(f"parse_packet, TTL + destination: {timeit(forward):,.0f} packets/s")
+    print(f"parse_packet, all fields: {timeit(lambda: parse_packet(packet).to_dict()):,.0f} packets/s")
+
+def payload_speed():
+    msg = Messages.Command.Mission.NAVIGATE_TO
+    buffer = bytearray(MAX_PACKET_SIZE)
+    args = (BinaryFlag.ACK_REQUEST, RoutingFlag.ROUTE_SCHEMA, 2, [3, 7, 1], [255, 15, 15])
+    fmt = "<" + "".join(type_map[field["datatype"]] for field in msg.payload)
+    rate = timeit(lambda: encode_packet(*args, msg, struct.pack(fmt, 158334550, -73000000)))
+    print(f"struct.pack + encode_packet: {rate:,.0f} packets/s")
+    rate = timeit(lambda: encode_message_into(buffer, *args, msg, 158334550, -73000000))
+    print(f"encode_message_into: {rate:,.0f} packets/s")
+    packet = encode_message(*args, msg, 158334550, -73000000)
+    print(f"parse_packet + values: {timeit(lambda: parse_packet(packet).values):,.0f} packets/s")
+    print(f"parse_packet + fields: {timeit(lambda: parse_packet(packet).fields):,.0f} packets/s")
+
+def address_speed(n=1000000):
+    print(f"pack_address [8, 4, 4]: {timeit(lambda: pack_address((3, 7, 1), 2)):,.0f} addresses/s")
+    print(f"unpack_address [8, 4, 4]: {timeit(lambda: unpack_address(0x0371, 2)):,.0f} addresses/s")
+    print(f"Address.from_int (interned): {timeit(lambda: Address.from_int(0x0371, 2)):,.0f} addresses/s")
+    if np is None:
+        print("numpy not installed, skipping bulk conversion")
+        return
+    addresses = np.random.default_rng(1).integers(0, 1 << 16, n, dtype=np.uint32)
+    start = time.perf_counter()
+    segments = decode_addresses(addresses, 17)
+    decode_rate = n / (time.perf_counter() - start)
+    start = time.perf_counter()
+    encoded = encode_addresses(segments, 17)
+    encode_rate = n / (time.perf_counter() - start)
+    assert (encoded == addresses).all()
+    print(f"decode_addresses [4, 4, 4, 4]: {decode_rate:,.0f} addresses/s")
+    print(f"encode_addresses [4, 4, 4, 4]: {encode_rate:,.0f} addresses/s")
+
+def capture_decode(n_frames=100000):
+    """A capture of n_frames NAVIGATE_TO/GPS frames, bulk decoded vs per frame."""
+    try:
+        from captures import decode_capture, index_frames
+    except ImportError:
+        print("numpy not installed, skipping capture decoding")
+        return
+    capture = bytearray()
+    for i in range(n_frames):
+        if i % 2:
+            capture += encode_message(0, RoutingFlag.ROUTE_SCHEMA | 0x30, 17, [1 + i % 15, 2, 3, 4], [15, 15, 1, 1 + i % 15],
+                                      Messages.Command.Mission.NAVIGATE_TO, 158334550 + i, -73000000)
+        else:
+            capture += encode_message(0, 0x30, 0, [i], [7], Messages.System.Status.GPS, 12)
+    capture = bytes(capture)
+    start = time.perf_counter()
+    packets = decode_capture(capture)
+    elapsed = time.perf_counter() - start
+    assert len(packets) == n_frames and packets["crc_ok"].all()
+    print(f"decode_capture: {n_frames / elapsed:,.0f} frames/s ({len(capture) / elapsed / 1e6:.1f} MB/s)")
+    offsets, sizes, _ = index_frames(capture)
+    frames = [capture[offset:offset + size] for offset, size in zip(offsets.tolist(), sizes.tolist())]
+    start = time.perf_counter()
+    for frame in frames:
+        decode_packet(frame)
+    print(f"decode_packet per frame: {n_frames / (time.perf_counter() - start):,.0f} frames/s")
+    start = time.perf_counter()
+    for frame in frames:
+        parse_packet(frame)
+    print(f"parse_packet per frame: {n_frames / (time.perf_counter() - start):,.0f} frames/s")
+
+def segments_match(address, destination):
+    return all(a == d or a == 0 or d == 0 for a, d in zip(address, destination))
+
+def routing_match(schema_index=17):
+    """Every address of a schema in an AddressTrie (50,625 nodes for [4, 4, 4, 4])."""
+    import itertools
+    nodes = list(itertools.product(*(range(1, 1 << bits) for bits in RouteSchemas[schema_index])))
+    trie = AddressTrie(schema_index)
+    start = time.perf_counter()
+    for node in nodes:
+        trie.insert(node, node)
+    insert_rate = len(nodes) / (time.perf_counter() - start)
+    print(f"{len(nodes):,} nodes, insert: {insert_rate:,.0f} nodes/s")
+    for destination in ((15, 3, 7, 1), (15, 3, 7, 0), (15, 3, 0, 0), (15, 0, 0, 0), (15, 0, 0, 1)):
+        matched = trie.match(destination)
+        assert matched == {node for node in nodes if segments_match(node, destination)}
+        rate = timeit(lambda: trie.match(destination), n=2000)
+        scan = timeit(lambda: [node for node in nodes if segments_match(node, destination)], n=2)
+        name = ".".join(map(str, destination))
+        print(f"match {name} ({len(matched):,} nodes): {rate:,.0f} lookups/s, linear scan {scan:,.1f} lookups/s")
+    start = time.perf_counter()
+    for node in nodes:
+        trie.remove(node, node)
+    print(f"remove: {len(nodes) / (time.perf_counter() - start):,.0f} nodes/s")
+    assert len(trie) == 0 and not trie.root.children
+
+def schema_search():
+    for width in (16, 24, 32):
+        start = time.perf_counter()
+        count = count_compositions(width, range(1, width + 1))
+        print(f"{width} bit: {count:,} schemas counted in {(time.perf_counter() - start) * 1000:.2f} ms")
+    start = time.perf_counter()
+    count = sum(1 for _ in iter_compositions(20, range(1, 21)))
+    print(f"20 bit: {count:,} schemas enumerated in {time.perf_counter() - start:.2f} s")
+    for levels in ([3, 3, 30], [200, 60, 900], [15, 3, 7, 100], [1000, 1000, 1000]):
+        start = time.perf_counter()
+        result = optimize_schema(levels)
+        print(f"optimize_schema({levels}): {result['schema']} ({result['width']} bit) in {(time.perf_counter() - start) * 1000:.2f} ms")
+    # Deep hierarchies, where enumerating the compositions of a width explodes
+    for depth in (8, 16):
+        start = time.perf_counter()
+        result = optimize_schema([1] * depth, widths=(32,))
+        print(f"optimize_schema([1] * {depth}, 32 bit): {result['schema']} in {(time.perf_counter() - start) * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    print("#" * 16, "Packet encode")
+    encode_speed()
+    print()
+    print("#" * 16, "Packet decode")
+    decode_speed()
+    print()
+    print("#" * 16, "Typed payloads")
+    payload_speed()
+    print()
+    print("#" * 16, "Capture decoding")
+    capture_decode()
+    print()
+    print("#" * 16, "Address conversion")
+    address_speed()
+    print()
+    print("#" * 16, "Destination matching")
+    routing_match()
+    print()
+    print("#" * 16, "Schema search")
+    schema_search()
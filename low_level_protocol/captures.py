@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# Bulk decoding of captured packet logs (concatenated frames, as received on
+# the link) into columnar NumPy arrays, for post-flight analysis.
+import numpy as np
+from base import PROTOCOL_VERSION, MAX_PACKET_SIZE, SYNC_BYTE, RoutingFlag
+
+MIN_FRAME_SIZE = 14  # 12 byte header + CRC
+
+# Raw 12 byte header, schema form. In the simple form bytes 5-9 are the two
+# 20-bit addresses and are rebuilt from schema/src/dst.
+HEADER_DTYPE = np.dtype([
+    ("start", "u1"), ("length", "u1"), ("version", "u1"), ("flags", "u1"), ("routing", "u1"),
+    ("schema", "u1"), ("src", "<u2"), ("dst", "<u2"), ("message_id", "<u2"),
+])
+
+# One row per frame
+CAPTURE_DTYPE = np.dtype([
+    ("offset", "u8"),  # frame start in the capture
+    ("size", "u1"),  # whole frame, header to CRC
+    ("flags", "u1"),
+    ("ttl", "u1"),
+    ("routing_flags", "u1"),
+    ("schema", "u1"),  # RouteSchemas index, 0 for simple 20-bit addressing
+    ("src", "<u4"),
+    ("dst", "<u4"),
+    ("message_id", "<u2"),
+    ("category", "u1"),
+    ("type", "u1"),
+    ("subtype", "u1"),
+    ("crc_ok", "?"),
+])
+
+def _crc_table() -> np.ndarray:
+    # CRC-16/CCITT-FALSE, same as crc16() in test_protocol.py
+    table = np.zeros(256, dtype=np.uint16)
+    for i in range(256):
+        crc = i << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else crc << 1
+        table[i] = crc & 0xFFFF
+    return table
+
+CRC_TABLE = _crc_table()
+
+def as_buffer(data) -> np.ndarray:
+    """uint8 array over bytes, bytearray, memoryview or an existing array, without copying."""
+    if isinstance(data, np.ndarray):
+        return data.view(np.uint8).ravel()
+    return np.frombuffer(data, dtype=np.uint8)
+
+def open_capture(path: str) -> np.ndarray:
+    """Memory-mapped capture file."""
+    return np.memmap(path, dtype=np.uint8, mode="r")
+
+def batch_crc16(data, starts, lengths) -> np.ndarray:
+    """CRC-16 of data[start:start + length] for every pair, one table step per byte position over all frames."""
+    buf = as_buffer(data)
+    starts = np.asarray(starts, dtype=np.int64)
+    lengths = np.asarray(lengths, dtype=np.int64)
+    # Longest first, so the frames still running at byte j are a prefix
+    order = np.argsort(-lengths, kind="stable")
+    positions = starts[order]
+    remaining = np.searchsorted(-lengths[order], -np.arange(lengths.max(initial=0)), side="left")
+    crc = np.full(len(starts), 0xFFFF, dtype=np.uint16)
+    for j, count in enumerate(remaining.tolist()):
+        active = crc[:count]
+        active[:] = (active << 8) ^ CRC_TABLE[(active >> 8) ^ buf[positions[:count] + j]]
+    result = np.empty_like(crc)
+    result[order] = crc
+    return result
+
+def index_frames(data) -> tuple:
+    """
+    (offsets, sizes, crc_ok) of the frames in a capture. Candidates are
+    SYNC_BYTE positions with a valid version and Length, all CRC checked at
+    once. A candidate is trusted if its CRC is good or, for a corrupted frame,
+    if its Length lands exactly on another candidate or the end of the
+    capture; from each frame the next one is the first trusted candidate at
+    or after its end. Noise that happens to look like a header is skipped
+    instead of swallowing the frames behind it.
+    """
+    buf = as_buffer(data)
+    candidates = np.flatnonzero(buf[:len(buf) - MIN_FRAME_SIZE + 1] == SYNC_BYTE)
+    sizes = buf[candidates + 1].astype(np.int64) + 3
+    ok = (buf[candidates + 2] == PROTOCOL_VERSION) & (sizes >= MIN_FRAME_SIZE) & (sizes <= MAX_PACKET_SIZE)
+    ok &= candidates + sizes <= len(buf)
+    candidates, sizes = candidates[ok], sizes[ok]
+    ends = candidates + sizes
+    received = buf[ends - 2].astype(np.uint16) | (buf[ends - 1].astype(np.uint16) << 8)
+    crc_ok = batch_crc16(buf, candidates + 3, sizes - 5) == received
+
+    n = len(candidates)
+    at_candidate = np.append(candidates, -1)[np.searchsorted(candidates, ends)] == ends
+    trusted = np.append(np.flatnonzero(crc_ok | at_candidate | (ends == len(buf))), n)  # n ends the chain
+    following = trusted[np.searchsorted(candidates[trusted[:-1]], ends)].tolist()
+    chosen = []
+    i = int(trusted[0])
+    while i < n:
+        chosen.append(i)
+        i = following[i]
+    chosen = np.array(chosen, dtype=np.int64)
+    return candidates[chosen], sizes[chosen], crc_ok[chosen]
+
+def decode_capture(data) -> np.ndarray:
+    """
+    Decode every frame in a capture (bytes-like, array or open_capture()) into
+    a CAPTURE_DTYPE structured array. Frames failing the CRC are kept with
+    crc_ok False, filter with packets[packets["crc_ok"]].
+    """
+    buf = as_buffer(data)
+    offsets, sizes, crc_ok = index_frames(buf)
+    headers = buf[offsets[:, None] + np.arange(HEADER_DTYPE.itemsize)].view(HEADER_DTYPE).ravel()
+
+    packets = np.zeros(len(offsets), dtype=CAPTURE_DTYPE)
+    packets["offset"] = offsets
+    packets["size"] = sizes
+    packets["flags"] = headers["flags"]
+    packets["ttl"] = headers["routing"] >> 4
+    packets["routing_flags"] = headers["routing"] & 0xF
+    message_id = headers["message_id"]
+    packets["message_id"] = message_id
+    packets["category"] = message_id >> 12
+    packets["type"] = (message_id >> 6) & 0x3F
+    packets["subtype"] = message_id & 0x3F
+
+    schema = (headers["routing"] & RoutingFlag.ROUTE_SCHEMA) != 0
+    packets["schema"] = np.where(schema, headers["schema"], 0)
+    combined = (headers["schema"].astype(np.uint64) | (headers["src"].astype(np.uint64) << 8)
+                | (headers["dst"].astype(np.uint64) << 24))
+    packets["src"] = np.where(schema, headers["src"], combined >> 20)
+    packets["dst"] = np.where(schema, headers["dst"], combined & 0xFFFFF)
+    packets["crc_ok"] = crc_ok
+    return packets
+
+def payloads(data, packets: np.ndarray) -> list:
+    """Payload bytes of each decoded frame."""
+    buf = as_buffer(data)
+    return [buf[offset + 12:offset + size - 2].tobytes() for offset, size in zip(packets["offset"].tolist(), packets["size"].tolist())]
+
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    from message_structure import Messages
+    from test_protocol import encode_message, unpack_address
+
+    # A capture with some line noise and a corrupted frame
+    capture = bytearray()
+    for i in range(1000):
+        if i % 100 == 0:
+            capture += bytes(random.randrange(256) for _ in range(random.randrange(1, 30)))
+        frame = bytearray(encode_message(0, RoutingFlag.ROUTE_SCHEMA | 0x30, 2, [3, 7, 1], [i % 200 + 1, 1 + i % 15, 1],
+                                         Messages.Command.Mission.NAVIGATE_TO, 158334550 + i, -73000000))
+        if i == 500:
+            frame[-3] ^= 0xFF
+        capture += frame
+    path = os.path.join(tempfile.mkdtemp(), "capture.bin")
+    with open(path, "wb") as f:
+        f.write(capture)
+
+    data = open_capture(path)
+    packets = decode_capture(data)
+    print(f"{len(packets)} frames, {np.count_nonzero(~packets['crc_ok'])} bad CRC")
+    good = packets[packets["crc_ok"]]
+    to_group = good[good["dst"] >> 8 == 12]
+    print(f"{len(to_group)} frames to 12.*.*, first:", unpack_address(int(to_group["dst"][0]), 2), payloads(data, to_group[:1]))
+    os.remove(path)
@@ -1,6 +1,20 @@
 from typing import List, Dict
 import csv
 import json
+import struct
+from base import type_map, MAX_PAYLOAD_SIZE
+
+def payload_format(message: str, payload: List[Dict]) -> str:
+    """struct format of a message payload, checked against MAX_PAYLOAD_SIZE."""
+    fmt = "<"
+    for field in payload:
+        if field["datatype"] not in type_map:
+            raise ValueError(f"{message}: unknown datatype {field['datatype']!r} for field {field['name']!r}")
+        fmt += type_map[field["datatype"]]
+    size = struct.calcsize(fmt)
+    if size > MAX_PAYLOAD_SIZE:
+        raise ValueError(f"{message}: payload of {size} bytes exceeds the {MAX_PAYLOAD_SIZE} byte limit")
+    return fmt
 
 def generate_enums_file(message_dict):
     # Existing code for categories
@@ -37,10 +51,13 @@ def generate_enums_file(message_dict):
         for subcategory in message_dict[category]:
             for message in message_dict[category][subcategory]:
                 payload = message_dict[category][subcategory][message]
+                fmt = payload_format(f"{category}.{subcategory}.{message}", payload)
                 payload_code += f"Messages.{category}.{subcategory}.{message}.payload = {repr(payload)}\n"
+                payload_code += f"Messages.{category}.{subcategory}.{message}.payload_struct = struct.Struct({fmt!r})\n"
+                payload_code += f"Messages.{category}.{subcategory}.{message}.payload_fields = {tuple(field['name'] for field in payload)!r}\n"
 
     # Combine all parts
-    code = "from enum import Enum, auto\n\n"
+    code = "import struct\nfrom enum import Enum, auto\n\n"
     code += category_code + "\n"
     code += messages_code
     code += values_code
@@ -1,3 +1,4 @@
+import struct
 from enum import Enum, auto
 
 # This file is auto generated, refer to definitions.py
@@ -34,8 +35,20 @@ Messages.System.str = 'System'
 Messages.Command.value = 2
 Messages.Command.str = 'Command'
 Messages.System.Status.HEARTBEAT.payload = []
+Messages.System.Status.HEARTBEAT.payload_struct = struct.Struct('<')
+Messages.System.Status.HEARTBEAT.payload_fields = ()
 Messages.System.Status.GPS.payload = [{'name': 'sats', 'datatype': 'uint8_t', 'bitmask': False}]
+Messages.System.Status.GPS.payload_struct = struct.Struct('<B')
+Messages.System.Status.GPS.payload_fields = ('sats',)
 Messages.System.Test.TEST_RADIO.payload = []
+Messages.System.Test.TEST_RADIO.payload_struct = struct.Struct('<')
+Messages.System.Test.TEST_RADIO.payload_fields = ()
 Messages.Command.Mission.SET_MISSION.payload = [{'name': 'mission_index', 'datatype': 'uint8_t', 'bitmask': False}]
+Messages.Command.Mission.SET_MISSION.payload_struct = struct.Struct('<B')
+Messages.Command.Mission.SET_MISSION.payload_fields = ('mission_index',)
 Messages.Command.Mission.NAVIGATE_TO.payload = [{'name': 'lattitude', 'datatype': 'int32_t', 'bitmask': False}, {'name': 'longitude', 'datatype': 'int32_t', 'bitmask': False}]
+Messages.Command.Mission.NAVIGATE_TO.payload_struct = struct.Struct('<ii')
+Messages.Command.Mission.NAVIGATE_TO.payload_fields = ('lattitude', 'longitude')
 Messages.Command.Report.TEST.payload = []
+Messages.Command.Report.TEST.payload_struct = struct.Struct('<')
+Messages.Command.Report.TEST.payload_fields = ()
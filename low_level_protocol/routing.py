@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# Destination matching for hierarchical addresses. A 0 segment is the
+# "broadcast/all" wildcard: 63.10.0 = 63.10.*, 63.0.5 = 63.*.5.
+from typing import Any
+from base import RouteSchemas
+from test_protocol import Address, pack_address, unpack_address
+
+class _TrieNode:
+    __slots__ = ("children", "values", "members")
+
+    def __init__(self):
+        self.children = {}  # segment -> _TrieNode, 0 holds entries registered with a wildcard
+        self.values = set()  # entries registered at exactly this address
+        self.members = {}  # value -> number of entries in this subtree
+
+class AddressTrie:
+    """
+    Index of local subscribers or next hops by address for one route schema,
+    one trie level per address segment.
+
+    match(destination) returns every value whose address matches it, with 0
+    segments matching anything on either side: a destination of 63.10.0
+    reaches all of 63.10.*, and an entry inserted as 63.10.0 (a group
+    representative) receives everything sent to 63.10.x. Exact and trailing
+    wildcard destinations take one step per segment, the group's values are
+    kept per subtree; only a wildcard followed by a concrete segment
+    (63.0.5) visits every child at that level.
+    """
+    def __init__(self, schema_index: int):
+        if schema_index < 0 or schema_index >= len(RouteSchemas):
+            raise ValueError("Invalid schema index.")
+        self.schema_index = schema_index
+        self.root = _TrieNode()
+        self.size = 0
+
+    def _segments(self, address) -> tuple:
+        if isinstance(address, int):
+            return unpack_address(address, self.schema_index)
+        if isinstance(address, Address):
+            if address.schema_index != self.schema_index:
+                raise ValueError(f"Address schema {address.schema_index} does not match trie schema {self.schema_index}.")
+            return address.segments
+        pack_address(address, self.schema_index)  # validates segment count and ranges
+        return tuple(address)
+
+    def insert(self, address, value: Any) -> bool:
+        """Add value at address (segments, int or Address). False if it was already there."""
+        node = self.root
+        path = [node]
+        for segment in self._segments(address):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _TrieNode()
+            node = child
+            path.append(node)
+        if value in node.values:
+            return False
+        node.values.add(value)
+        for node in path:
+            node.members[value] = node.members.get(value, 0) + 1
+        self.size += 1
+        return True
+
+    def remove(self, address, value: Any) -> bool:
+        """Remove value from address. False if it was not there."""
+        segments = self._segments(address)
+        node = self.root
+        path = [node]
+        for segment in segments:
+            node = node.children.get(segment)
+            if node is None:
+                return False
+            path.append(node)
+        if value not in node.values:
+            return False
+        node.values.discard(value)
+        for node in path:
+            count = node.members[value] - 1
+            if count:
+                node.members[value] = count
+            else:
+                del node.members[value]
+        # Prune branches left empty
+        for level in range(len(segments), 0, -1):
+            if path[level].members:
+                break
+            del path[level - 1].children[segments[level - 1]]
+        self.size -= 1
+        return True
+
+    def match(self, destination) -> set:
+        """Values whose address matches destination (segments, int or Address)."""
+        segments = self._segments(destination)
+        # Segments from `tail` on are all wildcards
+        tail = len(segments)
+        while tail and segments[tail - 1] == 0:
+            tail -= 1
+        result = set()
+        self._match(self.root, segments, 0, tail, result)
+        return result
+
+    def _match(self, node: _TrieNode, segments: tuple, level: int, tail: int, result: set):
+        while level < tail:
+            segment = segments[level]
+            level += 1
+            if segment == 0:
+                for child in node.children.values():
+                    self._match(child, segments, level, tail, result)
+                return
+            wildcard = node.children.get(0)
+            if wildcard is not None:
+                self._match(wildcard, segments, level, tail, result)
+            node = node.children.get(segment)
+            if node is None:
+                return
+        if level == len(segments):
+            result.update(node.values)
+        else:
+            result.update(node.members)
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, address) -> bool:
+        node = self.root
+        for segment in self._segments(address):
+            node = node.children.get(segment)
+            if node is None:
+                return False
+        return bool(node.values)
+
+if __name__ == "__main__":
+    trie = AddressTrie(2)  # [8, 4, 4], 255.15.15
+    trie.insert((63, 10, 1), "drone1")
+    trie.insert((63, 10, 2), "drone2")
+    trie.insert((63, 11, 1), "drone3")
+    trie.insert((63, 10, 0), "squad-10 leader")
+    trie.insert((12, 1, 1), "gcs1")
+    print("63.10.2 ->", trie.match((63, 10, 2)))
+    print("63.10.0 ->", trie.match((63, 10, 0)))
+    print("63.0.1 ->", trie.match((63, 0, 1)))
+    print("63.0.0 ->", trie.match((63, 0, 0)))
+    print("0.0.0 ->", trie.match((0, 0, 0)))
+    trie.remove((63, 10, 0), "squad-10 leader")
+    print("63.10.2 after leader left ->", trie.match((63, 10, 2)))
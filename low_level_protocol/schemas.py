@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# Network schema enumeration and selection. A schema splits an address of
+# `width` bits into segments (one per hierarchy level); segment value 0 is the
+# wildcard, so a level with n members needs n.bit_length() bits.
+import math
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Iterator, Optional, Sequence
+from base import RouteSchemas
+
+def required_bits(n: int) -> int:
+    """Bits for a level with n members, values 1..n with 0 kept as the wildcard."""
+    return max(n.bit_length(), 1)
+
+@lru_cache(maxsize=None)
+def _count(total: int, parts: tuple, words: int) -> int:
+    if words == 0:
+        return 1 if total == 0 else 0
+    return sum(_count(total - part, parts, words - 1) for part in parts if part <= total)
+
+def count_compositions(total: int, parts: Sequence[int], words: Optional[int] = None) -> int:
+    """Number of compositions of total from parts (optionally with exactly `words` parts), without building them."""
+    parts = tuple(sorted(set(parts)))
+    if words is not None:
+        return _count(total, parts, words)
+    smallest = parts[0] if parts else 1
+    return sum(_count(total, parts, n) for n in range(1, total // smallest + 1))
+
+def iter_compositions(total: int, parts: Sequence[int], words: Optional[int] = None,
+                      minimums: Optional[Sequence[int]] = None) -> Iterator[tuple]:
+    """
+    Compositions of total using values from parts, in the same order as the
+    old backtracking search, generated iteratively. words fixes the number of
+    segments and minimums[i] is the least value allowed for segment i; both
+    prune whole branches, so only the compositions asked for are visited.
+    """
+    parts = list(parts)
+    if not parts:
+        return
+    smallest, largest = min(parts), max(parts)
+    if minimums is not None:
+        words = len(minimums) if words is None else words
+        if len(minimums) != words:
+            raise ValueError("minimums must have one entry per word")
+    # tail_min[i]: least sum of segments i.., tail_max[i]: largest
+    if words is not None:
+        lows = [max(smallest, m) for m in minimums] if minimums is not None else [smallest] * words
+        tail_min = [sum(lows[i:]) for i in range(words + 1)]
+        tail_max = [largest * (words - i) for i in range(words + 1)]
+    current = []
+    stack = [iter(parts)]
+    remaining = total
+    while stack:
+        level = len(current)
+        for part in stack[-1]:
+            rest = remaining - part
+            if rest < 0:
+                continue
+            if words is not None:
+                if part < lows[level] or not tail_min[level + 1] <= rest <= tail_max[level + 1]:
+                    continue
+            current.append(part)
+            remaining = rest
+            if remaining == 0 and (words is None or len(current) == words):
+                yield tuple(current)
+                remaining += current.pop()
+                continue
+            if remaining < smallest or (words is not None and len(current) == words):
+                remaining += current.pop()
+                continue
+            stack.append(iter(parts))
+            break
+        else:
+            stack.pop()
+            if current:
+                remaining += current.pop()
+
+def compositions(total: int, parts: Sequence[int], words: Optional[int] = None) -> list:
+    """All compositions as lists, see iter_compositions()."""
+    return [list(c) for c in iter_compositions(total, parts, words)]
+
+def hierarchy_levels(hierarchy) -> list:
+    """
+    Largest member count per level of a fleet hierarchy. hierarchy is either
+    a list of per-level counts ([groups, subgroups per group, nodes per
+    subgroup]) or nested dicts of named groups ending in node counts, e.g.
+    {"alpha": {"recon": 12, "strike": 30}, "bravo": {"recon": 8}}.
+    """
+    if isinstance(hierarchy, (list, tuple)):
+        return list(hierarchy)
+    levels = []
+
+    def walk(node, depth):
+        count = node if isinstance(node, int) else len(node)
+        if depth == len(levels):
+            levels.append(0)
+        levels[depth] = max(levels[depth], count)
+        if isinstance(node, dict):
+            for child in node.values():
+                walk(child, depth + 1)
+
+    walk(hierarchy, 0)
+    return levels
+
+def address_field_bytes(width: int, words: int = 2) -> int:
+    """Header bytes for source and destination of width bits, plus the schema byte for multi-segment addresses."""
+    return math.ceil(((8 if words > 1 else 0) + 2 * width) / 8)
+
+def _allocate_bits(width: int, needed: Sequence[int], parts: Optional[Sequence[int]] = None) -> Optional[list]:
+    """
+    Segment sizes summing to width, each at least needed[i] (and from parts if
+    given): every level starts at its minimum, then spare bits go one step at
+    a time to the level with the least headroom, the deepest one on ties.
+    O(levels * spare bits). None if they can't be made to add up to width.
+    """
+    allowed = sorted(set(parts)) if parts is not None else None
+
+    def grow(bits):
+        # Smallest allowed size above bits
+        if allowed is None:
+            return bits + 1
+        i = bisect_right(allowed, bits)
+        return allowed[i] if i < len(allowed) else None
+
+    bits = []
+    for n in needed:
+        size = n if allowed is None or n in allowed else grow(n)
+        if size is None:
+            return None
+        bits.append(size)
+    spare = width - sum(bits)
+    while spare > 0:
+        best = best_size = None
+        for level in reversed(range(len(bits))):
+            size = grow(bits[level])
+            if size is None or size - bits[level] > spare:
+                continue
+            if best is None or bits[level] - needed[level] < bits[best] - needed[best]:
+                best, best_size = level, size
+        if best is None:
+            return None
+        spare -= best_size - bits[best]
+        bits[best] = best_size
+    return bits if spare == 0 else None
+
+def optimize_schema(hierarchy, widths: Sequence[int] = (16, 20, 24, 32), parts: Optional[Sequence[int]] = None) -> dict:
+    """
+    Schema for a fleet hierarchy (see hierarchy_levels()): one segment per
+    level, each wide enough for its member count plus the wildcard. The
+    smallest address width that fits wins, which minimises both header bytes
+    and wasted bits (every fitting schema of one width wastes the same
+    bits); within it the spare bits are handed out one at a time to the level
+    with the least headroom, deeper levels first on ties (nodes join more
+    often than groups), see _allocate_bits(). Built directly, without
+    enumerating compositions. Single level fleets only fit the 20-bit simple
+    addressing (RouteSchemas[0]). Existing RouteSchemas entries are reported
+    by index.
+
+    Returns {"schema", "index", "width", "header_bytes", "wasted_bits",
+    "capacity"}, raises ValueError when no width fits.
+    """
+    levels = hierarchy_levels(hierarchy)
+    needed = [required_bits(n) for n in levels]
+    for width in sorted(widths):
+        if sum(needed) > width or (len(needed) == 1 and width != 20):
+            continue
+        best = _allocate_bits(width, needed, parts)
+        if best is None:
+            continue
+        return {
+            "schema": best,
+            "index": RouteSchemas.index(best) if best in RouteSchemas else None,
+            "width": width,
+            "header_bytes": address_field_bytes(width, len(best)),
+            "wasted_bits": width - sum(needed),
+            "capacity": [(1 << bits) - 1 for bits in best],
+        }
+    raise ValueError(f"Fleet hierarchy {levels} does not fit any address width in {list(widths)}")
+
+if __name__ == "__main__":
+    print("16 bit schemas from 4-8 bit segments:", compositions(16, range(4, 9)))
+    for width in (20, 24, 32):
+        print(f"{width} bit: {count_compositions(width, range(4, 9)):,} schemas from 4-8 bit segments, "
+              f"{count_compositions(width, range(1, width + 1)):,} from any segment size")
+    fleet = {
+        "alpha": {"recon": 12, "strike": 30, "relay": 4},
+        "bravo": {"recon": 8, "strike": 20},
+        "gcs": {"ops": 3},
+    }
+    print("levels:", hierarchy_levels(fleet), "->", optimize_schema(fleet))
+    print("[200, 60, 900] ->", optimize_schema([200, 60, 900]))
+    print("[5000] ->", optimize_schema([5000]))
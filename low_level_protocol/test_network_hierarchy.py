@@ -1,28 +1,8 @@
-import math
-def required_bits(n: int) -> int:
-    if n == 0:
-        return 1
-    return n.bit_length()
+from schemas import required_bits, compositions, count_compositions, optimize_schema
 
 
 def enumerate_compositions(target, val_range):
-    solutions = []
-
-    def backtrack(current, current_sum):
-        if current_sum == target:
-            solutions.append(current.copy())
-            return
-        if current_sum > target:
-            return
-
-        for num in val_range:
-            if current_sum + num <= target:
-                current.append(num)
-                backtrack(current, current_sum + num)
-                current.pop()
-
-    backtrack([], 0)
-    return solutions
+    return compositions(target, val_range)
 
 
 
@@ -42,27 +22,7 @@ def enumerate_bit_compositions(target, val_range):
     if target <= 0 or (target & (target - 1)) != 0:
         raise ValueError("Target must be a power of 2.")
     
-    bit_target = int(math.log2(target))
-    solutions = []
-    
-    def backtrack(current, current_sum):
-        # If the sum of parts equals bit_target, we have a valid composition.
-        if current_sum == bit_target:
-            solutions.append(current.copy())
-            return
-        # If we exceed the required bit sum, backtrack.
-        if current_sum > bit_target:
-            return
-
-        # Try each allowed value.
-        for num in val_range:
-            if current_sum + num <= bit_target:
-                current.append(num)
-                backtrack(current, current_sum + num)
-                current.pop()
-
-    backtrack([], 0)
-    return solutions
+    return compositions(target.bit_length() - 1, val_range)
 
 
 
@@ -148,4 +108,19 @@ for combo, _ in schemas:
 print(x)
 print()
 for i in md:
-    print(i)
\ No newline at end of file
+    print(i)
+
+# Larger address widths: count first, the full lists grow as 2^(bits-1)
+print()
+for width in (20, 24, 32):
+    print(f"{width} bit addresses: {count_compositions(width, allowed_schema_bits):,} schemas from {allowed_schema_bits} bit segments")
+
+# Pick a schema for a fleet: groups -> subgroups -> nodes
+fleet = {
+    "alpha": {"recon": 12, "strike": 30, "relay": 4},
+    "bravo": {"recon": 8, "strike": 20},
+    "gcs": {"ops": 3},
+}
+print()
+print("Fleet schema:", optimize_schema(fleet))
+print("Large fleet schema:", optimize_schema([200, 60, 900]))
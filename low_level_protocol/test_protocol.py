@@ -3,6 +3,10 @@ from base import *
 import struct
 import crcmod
 import time
+try:
+    import numpy as np
+except ImportError:
+    np = None  # only needed for the bulk encode_addresses/decode_addresses
 from typing import Any, Dict, List
 from enum import Enum, IntEnum, auto
 from typing import List, Dict, Tuple, Optional, Any
@@ -65,8 +69,9 @@ def messageid(msg):
     subcategory_class = getattr(category_class, subcategory_name)
     subcategory_value = subcategory_class.value
     
-    # Get message value from the enum member itself
-    message_value = msg.value
+    # Get message value from the enum member itself (the generated
+    # subcategory .value class attribute shadows the member's .value)
+    message_value = msg._value_
     
     return (category_value, subcategory_value, message_value)
 
@@ -91,6 +96,65 @@ def get_payload_format(payload_defs: List[Dict[str, Any]]) -> str:
 # Address Encoder/Decoder
 # ---------------------------------------------------------------------------
 
+# Every schema is compiled once into ((shift, mask), ...) per segment and a
+# pair of generated pack/unpack functions with those constants inlined, so
+# converting an address is a few shifts and masks with no schema validation.
+
+def compile_schema(schema: list) -> tuple:
+    """((shift, mask), ...) for each segment of a schema (bit lengths summing to 16, or [20])."""
+    width = 20 if len(schema) == 1 else 16
+    if sum(schema) != width:
+        raise ValueError("Address space overflow")
+    fields = []
+    for bits in schema:
+        width -= bits
+        fields.append((width, (1 << bits) - 1))
+    return tuple(fields)
+
+def _compile_codec(fields: tuple) -> tuple:
+    """(pack, unpack) functions with the shifts and masks of a compiled schema unrolled."""
+    names = [f"s{i}" for i in range(len(fields))]
+    checks = " or ".join(f"{name} > {mask}" for name, (_, mask) in zip(names, fields))
+    packed = " | ".join(f"({name} & {mask}) << {shift}" for name, (shift, mask) in zip(names, fields))
+    unpacked = "".join(f"addr_int >> {shift} & {mask}, " for shift, mask in fields)
+    source = (
+        f"def pack(segments):\n"
+        f"    {', '.join(names)}, = segments\n"
+        f"    if {checks}:\n"
+        f"        raise ValueError(f'Segments {{segments}} out of range for schema {[m.bit_length() for _, m in fields]}.')\n"
+        f"    return {packed}\n"
+        f"def unpack(addr_int):\n"
+        f"    return ({unpacked})\n"
+    )
+    namespace = {}
+    exec(source, namespace)
+    return namespace["pack"], namespace["unpack"]
+
+SCHEMA_FIELDS = [compile_schema(schema) for schema in RouteSchemas]
+SCHEMA_MAX_ADDRESS = [(1 << sum(schema)) - 1 for schema in RouteSchemas]
+_address_codecs = [_compile_codec(fields) for fields in SCHEMA_FIELDS]
+_compiled_schemas = {tuple(schema): codec for schema, codec in zip(RouteSchemas, _address_codecs)}
+
+def _schema_codec(schema: list) -> tuple:
+    key = tuple(schema)
+    codec = _compiled_schemas.get(key)
+    if codec is None:
+        codec = _compiled_schemas[key] = _compile_codec(compile_schema(schema))
+    return codec
+
+def pack_address(segments, schema_index: int) -> int:
+    """encode_address() for RouteSchemas[schema_index]."""
+    try:
+        return _address_codecs[schema_index][0](segments)
+    except ValueError:
+        if len(segments) != len(SCHEMA_FIELDS[schema_index]):
+            raise ValueError("Number of segments does not match the schema length.") from None
+        raise
+
+def unpack_address(addr_int: int, schema_index: int) -> tuple:
+    """decode_address() for RouteSchemas[schema_index]."""
+    return _address_codecs[schema_index][1](addr_int)
+
 def encode_address(segments: tuple, schema: list) -> int:
     """
     Encode a tuple of address segments into an integer,
@@ -98,33 +162,49 @@ def encode_address(segments: tuple, schema: list) -> int:
     """
     if len(segments) != len(schema):
         raise ValueError("Number of segments does not match the schema length.")
-    if (len(schema) > 1 and sum(schema) != 16) or (len(schema) == 1 and sum(schema) != 20):
-        raise ValueError("Address space overflow")
-    
-    result = 0
-    shift = 20 if len(schema) == 1 else 16 
-    for seg, bits in zip(segments, schema):
-        shift -= bits
-        if seg >= (1 << bits):
-            raise ValueError(f"Segment value {seg} too high for allocated {bits} bits.")
-        result |= (seg & ((1 << bits) - 1)) << shift
-    return result
+    return _schema_codec(schema)[0](segments)
 
 def decode_address(addr_int: int, schema: list) -> tuple:
     """
     Decode a integer into a tuple of address segments
     based on the provided schema (list of bit lengths that sum to 16).
     """
-    if (len(schema) > 1 and sum(schema) != 16) or (len(schema) == 1 and sum(schema) != 20):
-        raise ValueError("Address space overflow")
-    
-    segments = []
-    shift = 20 if len(schema) == 1 else 16 
-    for bits in schema:
-        shift -= bits
-        seg = (addr_int >> shift) & ((1 << bits) - 1)
-        segments.append(seg)
-    return tuple(segments)
+    return _schema_codec(schema)[1](addr_int)
+
+# --- Bulk conversion (NumPy) ---
+
+if np is not None:
+    _np_shifts = [np.array([shift for shift, _ in fields], dtype=np.uint32) for fields in SCHEMA_FIELDS]
+    _np_masks = [np.array([mask for _, mask in fields], dtype=np.uint32) for fields in SCHEMA_FIELDS]
+
+def encode_addresses(segments, schema_index: int):
+    """
+    Encode an (N, words) array of address segments into a uint32 array of N
+    addresses for RouteSchemas[schema_index]. Requires NumPy.
+    """
+    if np is None:
+        raise ImportError("encode_addresses requires numpy")
+    segments = np.asarray(segments)
+    shifts, masks = _np_shifts[schema_index], _np_masks[schema_index]
+    if segments.ndim != 2 or segments.shape[1] != len(shifts):
+        raise ValueError("Number of segments does not match the schema length.")
+    if ((segments < 0) | (segments > masks)).any():
+        raise ValueError(f"Segment values out of range for schema {schema_index}.")
+    return np.bitwise_or.reduce(segments.astype(np.uint32) << shifts, axis=1)
+
+def decode_addresses(addresses, schema_index: int):
+    """
+    Decode an array of N addresses into an (N, words) uint32 array of segments
+    for RouteSchemas[schema_index]. Requires NumPy.
+    """
+    if np is None:
+        raise ImportError("decode_addresses requires numpy")
+    addresses = np.asarray(addresses, dtype=np.uint32)
+    return (addresses[:, None] >> _np_shifts[schema_index]) & _np_masks[schema_index]
+
+# Interned Address objects, (schema_index, address int) -> Address
+ADDRESS_CACHE_SIZE = 1 << 16
+_address_cache = {}
 
 class Address:
     """
@@ -138,32 +218,36 @@ class Address:
       - The address is composed of three segments: (A, B, C)
       - 'A' is 8 bits (0-255), 'B' is 4 bits (0-15), 'C' is 4 bits (0-15)
       - The complete 16-bit address is encoded as: (A << 8) | (B << 4) | C
+
+    Addresses are immutable; Address.get() and from_int() return interned instances.
     """
+    __slots__ = ("schema_index", "segments", "_int")
+
     def __init__(self, segments: tuple, schema_index: int):
         if schema_index < 0 or schema_index >= len(RouteSchemas):
             raise ValueError("Invalid schema index.")
         self.schema_index = schema_index
-        schema = RouteSchemas[schema_index]
-        if len(segments) != len(schema):
-            raise ValueError("Segments length does not match the schema.")
-        for seg, bits in zip(segments, schema):
-            if seg >= (1 << bits):
-                raise ValueError(f"Segment value {seg} exceeds {bits} bits limit.")
-        self.segments = segments
+        self._int = pack_address(segments, schema_index)
+        self.segments = tuple(segments)
+
+    @classmethod
+    def get(cls, segments: tuple, schema_index: int):
+        """Interned Address for segments."""
+        if schema_index < 0 or schema_index >= len(RouteSchemas):
+            raise ValueError("Invalid schema index.")
+        return cls.from_int(pack_address(segments, schema_index), schema_index)
 
     def to_int(self) -> int:
         """
         Convert the address segments into an integer based on the chosen schema.
         """
-        schema = RouteSchemas[self.schema_index]
-        return encode_address(self.segments, schema)
+        return self._int
 
     def to_bytes(self) -> bytes:
         """
         Return the encoded address as 2 bytes (little-endian).
         """
-        addr_int = self.to_int()
-        return struct.pack('<H', addr_int)
+        return struct.pack('<H', self._int)
 
     @classmethod
     def from_bytes(cls, data: bytes, schema_index: int):
@@ -173,9 +257,7 @@ class Address:
         if len(data) < 2:
             raise ValueError("Not enough data to extract address.")
         (addr_int,) = struct.unpack('<H', data[:2])
-        schema = RouteSchemas[schema_index]
-        segments = decode_address(addr_int, schema)
-        return cls(segments, schema_index)
+        return cls.from_int(addr_int, schema_index)
 
     @classmethod
     def from_int(cls, addr_int: int, schema_index: int):
@@ -187,11 +269,33 @@ class Address:
             - schema_index: Index into RouteSchemas.
 
         Returns:
-            An Address object.
+            An interned Address object.
+
+        Raises ValueError if addr_int does not fit the schema's 16 or 20 bits.
         """
-        schema = RouteSchemas[schema_index]
-        segments = decode_address(addr_int, schema)  # Assume decode_address exists
-        return cls(segments, schema_index)
+        key = (schema_index, addr_int)
+        address = _address_cache.get(key)
+        if address is None:
+            if schema_index < 0 or schema_index >= len(RouteSchemas):
+                raise ValueError("Invalid schema index.")
+            if not 0 <= addr_int <= SCHEMA_MAX_ADDRESS[schema_index]:
+                raise ValueError(f"Address {addr_int} out of range for schema {schema_index}.")
+            if len(_address_cache) >= ADDRESS_CACHE_SIZE:
+                _address_cache.clear()
+            address = cls.__new__(cls)
+            address.schema_index = schema_index
+            address.segments = unpack_address(addr_int, schema_index)
+            address._int = addr_int
+            _address_cache[key] = address
+        return address
+
+    def __eq__(self, other):
+        if not isinstance(other, Address):
+            return NotImplemented
+        return self.schema_index == other.schema_index and self._int == other._int
+
+    def __hash__(self):
+        return hash((self.schema_index, self._int))
 
     def __str__(self):
         """
@@ -203,26 +307,98 @@ class Address:
             return ".".join(str(seg) for seg in self.segments)
 
 
+# Whole header in one pack_into, both forms are 12 bytes:
+#   schema: StartByte, Length, Version, BinaryFlags, Routing, RouteSchema, SourceAddr, DestAddr, MessageID
+#   simple: StartByte, Length, Version, BinaryFlags, Routing, 40-bit address pair as I + B, MessageID
+_schema_header = struct.Struct("<BBBBBBHHH")
+_simple_header = struct.Struct("<BBBBBIBH")
+_checksum = struct.Struct("<H")
+PACKET_HEADER_SIZE = _schema_header.size
+
+_message_ids = {}  # message enum -> encoded 16-bit MessageID
+
+def encoded_message_id(message_id) -> int:
+    """16-bit MessageID for a Messages enum member (cached) or an already encoded int."""
+    if isinstance(message_id, int):
+        return message_id
+    encoded = _message_ids.get(message_id)
+    if encoded is None:
+        encoded = _message_ids[message_id] = encode_message_id(*messageid(message_id))
+    return encoded
+
+# Encoded MessageID -> Messages enum member, for decoding payloads
+MESSAGES_BY_ID = {
+    encoded_message_id(message): message
+    for category in MessageCategory
+    for subcategory in vars(getattr(Messages, category.name)).values()
+    if isinstance(subcategory, type) and issubclass(subcategory, Enum)
+    for message in subcategory
+}
+
+def _pack_header(buffer, flags, routing, route_schema, sender, receiver, message_id, payload_size: int) -> int:
+    """Writes the header for a payload of payload_size bytes, returns the payload end offset."""
+    if payload_size > MAX_PAYLOAD_SIZE:
+        raise ValueError("Packet exceeds maximum allowed size.")
+    payload_end = PACKET_HEADER_SIZE + payload_size
+    length = payload_end + _checksum.size - 3  # Exclude StartByte, Length, Version
+    msg_id = encoded_message_id(message_id)
+    if routing & RoutingFlag.ROUTE_SCHEMA:
+        source = sender if isinstance(sender, int) else pack_address(sender, route_schema)
+        destination = receiver if isinstance(receiver, int) else pack_address(receiver, route_schema)
+        _schema_header.pack_into(buffer, 0, SYNC_BYTE, length, PROTOCOL_VERSION, flags, routing,
+                                 route_schema, source & 0xFFFF, destination & 0xFFFF, msg_id)
+    else:
+        # Two 20-bit addresses in 5 bytes, no schema
+        source = sender if isinstance(sender, int) else pack_address(sender, 0)
+        destination = receiver if isinstance(receiver, int) else pack_address(receiver, 0)
+        combined = ((source & 0xFFFFF) << 20) | (destination & 0xFFFFF)
+        _simple_header.pack_into(buffer, 0, SYNC_BYTE, length, PROTOCOL_VERSION, flags, routing,
+                                 combined & 0xFFFFFFFF, combined >> 32, msg_id)
+    return payload_end
+
+def _finish_packet(buffer, payload_end: int) -> memoryview:
+    view = memoryview(buffer)
+    _checksum.pack_into(buffer, payload_end, crc16(view[3:payload_end]))
+    return view[:payload_end + _checksum.size]
+
+def encode_packet_into(buffer: bytearray, flags: BinaryFlag, routing: RoutingFlag, route_schema: int,
+                sender, receiver, message_id, payload) -> memoryview:
+    """
+    encode_packet() writing into buffer (at least MAX_PACKET_SIZE bytes) in one
+    pass. Returns a memoryview of the packet in buffer, valid until the buffer
+    is reused. sender/receiver are segment lists or already encoded address ints.
+    """
+    payload_end = _pack_header(buffer, flags, routing, route_schema, sender, receiver, message_id, len(payload))
+    buffer[PACKET_HEADER_SIZE:payload_end] = payload
+    return _finish_packet(buffer, payload_end)
 
-# fragment
-class Packet:
-    def __init__(self, data: Dict[str, Any]):
-        # Recursively set attributes from the decoded data
-        for key, value in data.items():
-            if isinstance(value, dict):
-                setattr(self, key, Packet(value))
-            else:
-                setattr(self, key, value)
-        self._data = data
-
-    def to_dict(self) -> Dict[str, Any]:
-        """
-        Return the original decoded packet as a dictionary.
-        """
-        return self._data
-
-    def __repr__(self):
-        return f"Packet({self._data})"
+def encode_message_into(buffer: bytearray, flags: BinaryFlag, routing: RoutingFlag, route_schema: int,
+                sender, receiver, message, *values) -> memoryview:
+    """
+    encode_packet_into() for a Messages member with its payload fields given as
+    values, packed straight into the buffer with the message's payload_struct.
+    """
+    payload_struct = message.payload_struct
+    payload_end = _pack_header(buffer, flags, routing, route_schema, sender, receiver, message, payload_struct.size)
+    try:
+        payload_struct.pack_into(buffer, PACKET_HEADER_SIZE, *values)
+    except struct.error as e:
+        raise ValueError(f"Invalid payload for {message.name} {message.payload_fields}: {e}") from None
+    return _finish_packet(buffer, payload_end)
+
+def encode_message(flags: BinaryFlag, routing: RoutingFlag, route_schema: int,
+                sender, receiver, message, *values) -> bytes:
+    """encode_message_into() returning a bytes packet, reentrant and thread safe (own buffer per call)."""
+    return bytes(encode_message_into(bytearray(MAX_PACKET_SIZE), flags, routing, route_schema, sender, receiver, message, *values))
+
+def decode_payload(message_id, payload) -> tuple:
+    """Payload field values of a message (Messages member or encoded MessageID)."""
+    message = message_id if isinstance(message_id, Enum) else MESSAGES_BY_ID.get(message_id)
+    if message is None:
+        raise ValueError(f"Unknown message id {message_id}.")
+    if len(payload) != message.payload_struct.size:
+        raise ValueError(f"Payload size mismatch for {message.name}: {len(payload)} != {message.payload_struct.size}.")
+    return message.payload_struct.unpack(payload)
 
 def encode_packet(flags: BinaryFlag, routing: RoutingFlag, route_schema: int,
                 sender: list, receiver: list, message_id: int,
@@ -233,62 +409,139 @@ def encode_packet(flags: BinaryFlag, routing: RoutingFlag, route_schema: int,
     Parameters:
         - flags: BinaryFlag value (1 byte).
         - routing: RoutingFlag with TTL in upper 4 bits and flags in lower 4 bits (1 byte).
-        - route_schema: 8-bit Schema index space (used if ROUTE_SCHEMA flag is set).
+        - route_schema: 8-bit Schema index space (used if ROUTE_SCHEMA flag is set,
+          otherwise addresses are single 20-bit segments, schema 0).
         - source: 16-bit Address space.
         - destination: 16-bit Address space.
         - message_id: 16-bit MessageID.
         - payload: Payload bytes.
 
     Returns:
-        A complete packet as a bytes object.
+        A complete packet as a bytes object, in a buffer of its own so calls
+        can overlap. Use encode_packet_into() with a reused buffer to save the
+        allocation and copy.
     """
-    # Encode MessageID
-    qwe = messageid(message_id)
-    encoded_message_id = encode_message_id(*qwe)
+    return bytes(encode_packet_into(bytearray(MAX_PACKET_SIZE), flags, routing, route_schema, sender, receiver, message_id, payload))
 
-    source = Address(sender, schema_index)
-    destination = Address(receiver, schema_index)
+class Packet:
+    """
+    Decoded packet from parse_packet(). Header fields are kept as the raw ints
+    from the wire; flags, TTL, addresses and MessageID are only decoded when
+    read, so forwarding a packet costs one unpack_from. payload is a memoryview
+    into the received buffer.
+    """
+    __slots__ = ("length", "version", "binary_flags", "routing", "route_schema",
+                 "source_int", "dest_int", "message_id", "payload", "checksum")
+
+    def __init__(self, length, version, binary_flags, routing, route_schema, source_int, dest_int, message_id, payload, checksum):
+        self.length = length
+        self.version = version
+        self.binary_flags = binary_flags
+        self.routing = routing
+        self.route_schema = route_schema
+        self.source_int = source_int
+        self.dest_int = dest_int
+        self.message_id = message_id
+        self.payload = payload
+        self.checksum = checksum
+
+    @property
+    def ttl(self) -> int:
+        return self.routing >> 4
+
+    @property
+    def routing_flags(self) -> RoutingFlag:
+        return RoutingFlag(self.routing & 0xF)
+
+    @property
+    def flags(self) -> BinaryFlag:
+        return BinaryFlag(self.binary_flags)
+
+    @property
+    def schema_index(self) -> int:
+        # No schema: single 20-bit segment addresses
+        return 0 if self.route_schema is None else self.route_schema
+
+    @property
+    def source(self) -> tuple:
+        return unpack_address(self.source_int, self.schema_index)
+
+    @property
+    def destination(self) -> tuple:
+        return unpack_address(self.dest_int, self.schema_index)
+
+    @property
+    def message(self) -> tuple:
+        """MessageID as (category, type, subtype)."""
+        return decode_message_id(self.message_id)
+
+    @property
+    def message_type(self):
+        """The Messages member, None if unknown."""
+        return MESSAGES_BY_ID.get(self.message_id)
+
+    @property
+    def values(self) -> tuple:
+        """Payload field values."""
+        return decode_payload(self.message_id, self.payload)
+
+    @property
+    def fields(self) -> Dict[str, Any]:
+        """Payload as {field name: value}."""
+        return dict(zip(MESSAGES_BY_ID[self.message_id].payload_fields, self.values))
 
-    # Fixed header: StartByte, Length (placeholder), Version
-    fixed_header = struct.pack("<BBB", SYNC_BYTE, 0, PROTOCOL_VERSION)
+    def to_dict(self) -> Dict[str, Any]:
+        """The packet in the decode_packet() dictionary form."""
+        return {
+            "StartByte": SYNC_BYTE,
+            "Length": self.length,
+            "Version": self.version,
+            "BinaryFlags": self.flags,
+            "Routing": self.routing,
+            "TTL": self.ttl,
+            "RoutingFlags": self.routing_flags,
+            "RouteSchema": self.route_schema,
+            "SourceAddr": ".".join(map(str, self.source)),
+            "DestAddr": ".".join(map(str, self.destination)),
+            "MessageID": self.message,
+            "Payload": bytes(self.payload),
+            "Checksum": self.checksum,
+        }
 
-    # Common body fields
-    binary_flags_bytes = struct.pack("<B", flags.value)
-    # Assume routing.value includes TTL (bits 7-4) and flags (bits 3-0)
-    routing_byte = struct.pack("<B", routing.value)
+    def __repr__(self):
+        return f"Packet({self.to_dict()})"
 
-    # Dynamic address fields based on ROUTE_SCHEMA flag
-    if routing & RoutingFlag.ROUTE_SCHEMA:
-        route_schema_byte = struct.pack("<B", route_schema)
-        source_addr_bytes = struct.pack("<H", source.to_int() & 0xFFFF)
-        dest_addr_bytes = struct.pack("<H", destination.to_int() & 0xFFFF)
-        addresses_part = route_schema_byte + source_addr_bytes + dest_addr_bytes
+def parse_packet(packet, verify: bool = True) -> Packet:
+    """
+    Decode a packet (bytes, bytearray or memoryview) into a Packet record with
+    a single unpack_from for the header. verify=False skips the CRC check, for
+    callers that already checked it or only peek at TTL/destination.
+    """
+    view = memoryview(packet)
+    size = len(view)
+    if size < PACKET_HEADER_SIZE + _checksum.size:
+        raise ValueError("Packet too short.")
+    if view[4] & RoutingFlag.ROUTE_SCHEMA:
+        start_byte, length, version, binary_flags, routing, route_schema, source_int, dest_int, message_id = \
+            _schema_header.unpack_from(view)
     else:
-        # Pack two 20-bit addresses into 5 bytes
-        source_int = source.to_int() & 0xFFFFF  # Ensure 20-bit max
-        dest_int = destination.to_int() & 0xFFFFF  # Ensure 20-bit max
-        combined = (source_int << 20) | dest_int  # 40 bits
-        addresses_part = combined.to_bytes(5, 'little')
-
-    # MessageID
-    message_id_bytes = struct.pack("<H", encoded_message_id & 0xFFFF)
-
-    # Assemble data for checksum: BinaryFlags through payload
-    crc_data = binary_flags_bytes + routing_byte + addresses_part + message_id_bytes + payload
-    checksum = crc16(crc_data)
-    checksum_bytes = struct.pack("<H", checksum)
-
-    # Total packet
-    packet = fixed_header + crc_data + checksum_bytes
-
-    # Update Length: size of everything after fixed header
-    length = len(packet) - 3  # Exclude StartByte, Length, Version
-    packet = struct.pack("<BBB", SYNC_BYTE, length, PROTOCOL_VERSION) + packet[3:]
-
-    if len(packet) > MAX_PACKET_SIZE:
-        raise ValueError("Packet exceeds maximum allowed size.")
-
-    return packet
+        start_byte, length, version, binary_flags, routing, low, high, message_id = _simple_header.unpack_from(view)
+        combined = (high << 32) | low
+        route_schema = None
+        source_int = combined >> 20
+        dest_int = combined & 0xFFFFF  # 20-bit mask
+    if start_byte != SYNC_BYTE:
+        raise ValueError("Invalid start byte.")
+    if version != PROTOCOL_VERSION:
+        raise ValueError("Unsupported protocol version.")
+    if length != size - 3:
+        raise ValueError("Packet length mismatch.")
+    payload_end = size - _checksum.size
+    checksum = _checksum.unpack_from(view, payload_end)[0]
+    if verify and crc16(view[3:payload_end]) != checksum:
+        raise ValueError("Checksum mismatch.")
+    return Packet(length, version, binary_flags, routing, route_schema, source_int, dest_int,
+                  message_id, view[PACKET_HEADER_SIZE:payload_end], checksum)
 
 def decode_packet(packet: bytes) -> dict:
     """
@@ -299,84 +552,10 @@ def decode_packet(packet: bytes) -> dict:
 
     Returns:
         A dictionary with header fields, parsed flags, addresses, and payload.
-        MessageID is decoded into (category, type, subtype).
+        MessageID is decoded into (category, type, subtype). parse_packet()
+        returns the same lazily as a Packet record.
     """
-    if len(packet) < 6:  # Minimum: StartByte, Length, Version, BinaryFlags, Routing, Checksum
-        raise ValueError("Packet too short.")
-
-    # Unpack fixed header
-    start_byte, length, version = struct.unpack("<BBB", packet[:3])
-    if start_byte != SYNC_BYTE:
-        raise ValueError("Invalid start byte.")
-    if version != PROTOCOL_VERSION:
-        raise ValueError("Unsupported protocol version.")
-
-    offset = 3
-    binary_flags = struct.unpack("<B", packet[offset:offset+1])[0]
-    offset += 1
-    routing_byte = struct.unpack("<B", packet[offset:offset+1])[0]
-    offset += 1
-
-    # Parse Routing byte
-    ttl = (routing_byte >> 4) & 0xF
-    routing_flags = RoutingFlag(routing_byte & 0xF)
-
-    # Dynamic address parsing
-    if routing_flags & RoutingFlag.ROUTE_SCHEMA:
-        route_schema = struct.unpack("<B", packet[offset:offset+1])[0]
-        offset += 1
-        source_int = struct.unpack("<H", packet[offset:offset+2])[0]
-        offset += 2
-        dest_int = struct.unpack("<H", packet[offset:offset+2])[0]
-        offset += 2
-        schema_index = route_schema
-    else:
-        combined = int.from_bytes(packet[offset:offset+5], 'little')
-        source_int = combined >> 20
-        dest_int = combined & 0xFFFFF  # 20-bit mask
-        offset += 5
-        schema_index = 0  # No schema, 20-bit addresses
-
-    # MessageID
-    message_id = struct.unpack("<H", packet[offset:offset+2])[0]
-    offset += 2
-
-    # Payload and checksum
-    payload_end = len(packet) - 2  # Exclude checksum
-    payload = packet[offset:payload_end]
-    checksum_received = struct.unpack("<H", packet[payload_end:])[0]
-
-    # Verify length
-    expected_length = offset + len(payload) + 2 - 3  # From BinaryFlags to end
-    if length != expected_length:
-        raise ValueError("Packet length mismatch.")
-
-    # Verify checksum
-    crc_data = packet[3:payload_end]  # BinaryFlags through payload
-    calc_checksum = crc16(crc_data)
-    if calc_checksum != checksum_received:
-        raise ValueError("Checksum mismatch.")
-
-    # Create Address objects
-    source_addr = Address.from_int(source_int, schema_index)
-    dest_addr = Address.from_int(dest_int, schema_index)
-
-    # Return parsed fields
-    return {
-        "StartByte": start_byte,
-        "Length": length,
-        "Version": version,
-        "BinaryFlags": BinaryFlag(binary_flags),
-        "Routing": routing_byte,
-        "TTL": ttl,
-        "RoutingFlags": routing_flags,
-        "RouteSchema": route_schema if routing_flags & RoutingFlag.ROUTE_SCHEMA else None,
-        "SourceAddr": str(source_addr),
-        "DestAddr": str(dest_addr),
-        "MessageID": decode_message_id(message_id),
-        "Payload": payload,
-        "Checksum": checksum_received,
-    }
+    return parse_packet(packet).to_dict()
 
 # --- Example Usage ---
 if __name__ == "__main__":
@@ -392,7 +571,7 @@ if __name__ == "__main__":
     
     # Example parameters.
     msgflags = BinaryFlag.ACK_REQUEST
-    routingflags = RoutingFlag(0)
+    routingflags = RoutingFlag.ROUTE_SCHEMA
 
     # Pack the packet.
     print(messageid(Messages.Command.Mission.SET_MISSION))
@@ -413,6 +592,11 @@ if __name__ == "__main__":
     unpacked = decode_packet(packet)
     print("Unpacked Packet:", unpacked)
     
+    # Typed payload fields, packed with the message's compiled payload_struct
+    packet = encode_message(msgflags, routingflags, schema_index, src_addr, dst_addr,
+                            Messages.Command.Mission.NAVIGATE_TO, 158334550, -73000000)
+    print("NAVIGATE_TO fields:", parse_packet(packet).fields)
+
     # Pack a packet using a Cursor-on-Target event.
     # Using the nested MessageID: MessageID.CotEvent.GENERIC
     print("Packed Packet (hex):", packet.hex())
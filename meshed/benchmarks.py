@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+# Size and speed measurements for the meshed protocol, run: python3 benchmarks.py
+import json
+import math
+import socket
+import time
+import zlib
+import tracemalloc
+import msgpack
+from message_structure import Messages
+from payload_enums import PayloadEnum
+from protocol import *
+
+# Representative field values per datatype: (typical, worst case)
+sample_values = {
+    "uint8_t": (12, 0xFF),
+    "uint16_t": (1500, 0xFFFF),
+    "uint32_t": (0b1011, 0xFFFFFFFF),
+    "uint64_t": (0b1011, 0xFFFFFFFFFFFFFFFF),
+    "int8_t": (-12, -0x80),
+    "int16_t": (181, -0x8000),
+    "int32_t": (158334550, -0x80000000),
+    "int64_t": (158334550, -0x8000000000000000),
+    "int": (120, 0xFFFFFFFF),
+    "float": (15.83, 15.83),
+    "double": (15.83345500, 15.83345500),
+    "bool": (True, True),
+    "char": (b"A", b"A"),
+    "string": ("ok", "x" * 32),
+    "bytes": (b"\x01" * 9, b"\x01" * 9),  # packed MGRS, precision 5
+}
+
+def sample_payload(msg_enum, worst=False):
+    """Builds a payload list for msg_enum from sample_values."""
+    kwargs = {}
+    for field in msg_enum.payload_def:
+        key = field["name"][len("PayloadEnum_"):] if field["name"].startswith("PayloadEnum_") else field["name"]
+        if field["datatype"] == "enum":
+            # enum fields are named after their PayloadEnum class
+            kwargs[key] = list(getattr(PayloadEnum, key))[-1 if worst else 0]
+        else:
+            kwargs[key] = sample_values[field["datatype"]][1 if worst else 0]
+    return msg_enum.payload(**kwargs)
+
+def payload_size_comparison():
+    """Encoded message size per message type for each envelope/payload mode."""
+    modes = [("msgpack", False, False), ("binary", True, False), ("compact", False, True), ("cmp+bin", True, True)]
+    print(f"{'Message':<36}" + "".join(f" {label:>8}" for label, _, _ in modes) + "   (typical / max values)")
+    for msg_id, msg_enum in MESSAGE_ENUMS.items():
+        if not msg_enum.payload_def:
+            continue
+        sizes = []
+        for label, binary, compact in modes:
+            typical = len(encode_message(msg_enum, sample_payload(msg_enum), binary=binary, compact=compact))
+            worst = len(encode_message(msg_enum, sample_payload(msg_enum, worst=True), binary=binary, compact=compact))
+            sizes.append(f"{typical}/{worst}")
+        print(f"{MESSAGE_NAMES[msg_id]:<36}" + "".join(f" {size:>8}" for size in sizes))
+
+def timeit(func, n=100000):
+    start = time.perf_counter()
+    for _ in range(n):
+        func()
+    return n / (time.perf_counter() - start)
+
+def codec_speed():
+    """Encode/decode rate for INAV telemetry in both payload modes."""
+    msg_enum = Messages.Status.System.INAV
+    payload = sample_payload(msg_enum)
+    for binary in (False, True):
+        encoded = encode_message(msg_enum, payload, binary=binary)
+        enc = timeit(lambda: encode_message(msg_enum, payload, binary=binary))
+        dec = timeit(lambda: decode_message(encoded))
+        print(f"INAV {'binary' if binary else 'msgpack':<8} encode {enc:>10,.0f} msg/s   decode {dec:>10,.0f} msg/s")
+
+def batch_speed(n_frames=200):
+    """Draining a full receive buffer: per-frame decode_message vs decode_messages."""
+    msg_enum = Messages.Status.System.INAV
+    frames = [encode_message(msg_enum, sample_payload(msg_enum))] * n_frames
+    single = timeit(lambda: [decode_message(f) for f in frames], n=500) * n_frames
+    batch = timeit(lambda: decode_messages(frames), n=500) * n_frames
+    grouped = timeit(lambda: decode_messages(frames, group=True), n=500) * n_frames
+    print(f"{n_frames} frames: single {single:>10,.0f} msg/s   batch {batch:>10,.0f} msg/s   grouped {grouped:>10,.0f} msg/s")
+
+def lazy_decode(n_frames=200):
+    """GCS filtering a telemetry stream on one field: dict decode vs MessageView."""
+    msg_enum = Messages.Status.System.INAV
+    frames = [encode_message(msg_enum, sample_payload(msg_enum))] * n_frames
+    for lazy in (False, True):
+        rate = timeit(lambda: [payload["msl_alt"] for _, payload in decode_messages(frames, lazy=lazy)[0]], n=500) * n_frames
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        results = decode_messages(frames, lazy=lazy)[0]
+        allocated = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        print(f"decode_messages lazy={lazy!s:<5} + one field read {rate:>10,.0f} msg/s   {allocated / n_frames:>5.0f} bytes per decoded message")
+
+def retained_records(n_frames=10000):
+    """Memory held by n decoded INAV payloads kept around, and field read speed, per payload form."""
+    msg_enum = Messages.Status.System.INAV
+    frames = [encode_message(msg_enum, sample_payload(msg_enum))] * n_frames
+    for label, lazy, record in (("dict", False, False), ("MessageView", True, False), ("PayloadRecord", False, True)):
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        payloads = [payload for _, payload in decode_messages(frames, lazy=lazy, record=record)[0]]
+        allocated = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        payload = payloads[0]
+        if record:
+            read = timeit(lambda: payload.heading + payload.msl_alt, n=1000000)
+        else:
+            read = timeit(lambda: payload["heading"] + payload["msl_alt"], n=1000000)
+        print(f"{label:<14} {allocated / n_frames:>5.0f} bytes per retained payload   {read:>12,.0f} two-field reads/s")
+
+def schema_filter():
+    """PeerSchemas.filter() per frame for a same-schema, unknown-schema and translated peer."""
+    msg_enum = Messages.Status.System.INAV
+    frame = encode_message(msg_enum, sample_payload(msg_enum))
+    heartbeat = lambda fingerprint: encode_message(Messages.Heartbeat.System.HEARTBEAT, [fingerprint])
+    with open("message_definitions.json") as f:
+        other_revision = json.load(f)
+    other_revision["Testing"]["System"]["TEXTMSG2"] = []  # some other CSV revision, same INAV
+    peer_schemas = PeerSchemas()
+    peer_schemas.observe("same", heartbeat(SCHEMA_FINGERPRINT))
+    peer_schemas.observe("other", heartbeat(0))
+    peer_schemas.observe("translated", heartbeat(peer_schemas.add_translation(other_revision)))
+    for peer in ("same", "other", "translated"):
+        rate = timeit(lambda: peer_schemas.filter(peer, frame), n=200000)
+        print(f"PeerSchemas.filter {peer:<10} {rate:>12,.0f} frames/s")
+
+def udp_envelope_rx(n=10000):
+    """Rx path cost of decode_udp_packet: rate and bytes held per decoded datagram."""
+    msg_enum = Messages.Status.System.INAV
+    telemetry = encode_udp_packet("drone1", "gcs1", encode_message(msg_enum, sample_payload(msg_enum)))
+    # BINMSG is compressed by default, which would shrink the zero blob to a few bytes
+    blob = encode_udp_packet("drone1", "gcs1", encode_message(Messages.Testing.System.BINMSG, [b"\x00" * 4096], compress=False))
+    compressed = encode_udp_packet("drone1", "gcs1", encode_message(Messages.Testing.System.BINMSG, [b"\x00" * 4096]))
+    for label, packet in (("telemetry", telemetry), ("4k blob", blob), ("4k deflate", compressed)):
+        rate = timeit(lambda: decode_udp_packet(packet))
+        tracemalloc.start()
+        results = []
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(n):
+            results.append(decode_udp_packet(packet))
+        allocated = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        print(f"decode_udp_packet {label:<10} {len(packet):>5} B {rate:>10,.0f} pkt/s   {allocated / n:>6.0f} bytes held per packet")
+
+def free_udp_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def datalink_rx(n_packets=5000, burst=64, n_pings=500):
+    """DatalinkInterface UDP receive over loopback: packets/s for bursts and p50/p99 one-way latency."""
+    import asyncio
+    from datalinks import DatalinkInterface
+
+    async def run():
+        port = free_udp_port()
+        link = DatalinkInterface(use_udp=True, socket_host="127.0.0.1", socket_port=port, my_name="gcs1")
+        link.start()
+        tx_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        packet = encode_udp_packet("drone1", "gcs1", encode_message(Messages.Status.System.INAV, sample_payload(Messages.Status.System.INAV)))
+
+        async def collect(count, deadline):
+            received = 0
+            while received < count and time.perf_counter() < deadline:
+                received += len(link.receive())
+                await asyncio.sleep(0)
+            return received
+
+        received = 0
+        start = time.perf_counter()
+        for _ in range(n_packets // burst):
+            for _ in range(burst):
+                tx_sock.sendto(packet, ("127.0.0.1", port))
+            received += await collect(burst, time.perf_counter() + 1.0)
+        elapsed = time.perf_counter() - start
+        print(f"DatalinkInterface rx: {received}/{n_packets // burst * burst} packets in bursts of {burst}, {received / elapsed:,.0f} packets/s")
+
+        latencies = []
+        for _ in range(n_pings):
+            sent = time.perf_counter()
+            tx_sock.sendto(packet, ("127.0.0.1", port))
+            if await collect(1, sent + 1.0):
+                latencies.append(time.perf_counter() - sent)
+        latencies.sort()
+        p50, p99 = latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+        print(f"DatalinkInterface rx latency: p50 {p50 * 1e6:,.0f} us, p99 {p99 * 1e6:,.0f} us ({len(latencies)}/{n_pings} received)")
+        tx_sock.close()
+        link.stop()
+
+    asyncio.run(run())
+
+def udp_rcvbuf_errors():
+    """Kernel UDP receive buffer drops so far (Linux), None elsewhere."""
+    try:
+        with open("/proc/net/snmp") as f:
+            rows = [line.split() for line in f if line.startswith("Udp:")]
+        return int(rows[1][rows[0].index("RcvbufErrors")])
+    except (OSError, IndexError, ValueError):
+        return None
+
+def datalink_burst(n_nodes=200, burst=10, rounds=5):
+    """n_nodes send `burst` telemetry datagrams each at the same moment, DatalinkInterface receiving; drops per config."""
+    import asyncio
+    import threading
+    from datalinks import DatalinkInterface
+
+    packet = encode_udp_packet("drone1", "gcs1", encode_message(Messages.Status.System.INAV, sample_payload(Messages.Status.System.INAV)))
+    total = n_nodes * burst * rounds
+
+    async def run(rx_budget, rcvbuf_size):
+        port = free_udp_port()
+        link = DatalinkInterface(use_udp=True, socket_host="127.0.0.1", socket_port=port, my_name="gcs1",
+                                 rx_budget=rx_budget, rcvbuf_size=rcvbuf_size)
+        link.start()
+        nodes = [socket.socket(socket.AF_INET, socket.SOCK_DGRAM) for _ in range(n_nodes)]
+
+        def swarm():
+            for _ in range(rounds):
+                for _ in range(burst):
+                    for sock in nodes:
+                        sock.sendto(packet, ("127.0.0.1", port))
+                time.sleep(0.05)
+
+        errors_before = udp_rcvbuf_errors()
+        sender = threading.Thread(target=swarm)
+        start = time.perf_counter()
+        sender.start()
+        received = 0
+        while received < total:
+            batch = await link.receive_wait(0.2)
+            if not batch and not sender.is_alive():
+                break
+            received += len(batch)
+        elapsed = time.perf_counter() - start
+        sender.join()
+        errors = udp_rcvbuf_errors()
+        kernel_drops = "n/a" if errors is None else errors - errors_before
+        print(f"rx_budget={rx_budget:<4} rcvbuf={str(rcvbuf_size or 'default'):<8} {received:>6}/{total} received in {elapsed:.2f} s, "
+              f"kernel drops {kernel_drops}")
+        for sock in nodes:
+            sock.close()
+        link.stop()
+
+    for rx_budget, rcvbuf_size in ((1, None), (256, None), (256, 1 << 20)):
+        asyncio.run(run(rx_budget, rcvbuf_size))
+
+def datalink_send(n=20000):
+    """DatalinkInterface.send() rate, unicast and multicast, over loopback."""
+    import asyncio
+    import warnings
+    from datalinks import DatalinkInterface
+
+    async def run():
+        rx_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        rx_sock.bind(("127.0.0.1", 0))
+        nodemap = {"gcs1": {"meshid": 1, "ip": list(rx_sock.getsockname())}}
+        link = DatalinkInterface(use_udp=True, socket_host="127.0.0.1", socket_port=free_udp_port(), my_name="drone1",
+                                 nodemap=nodemap, multicast_group="239.255.42.1", multicast_port=free_udp_port())
+        link.start()
+        frame = encode_message(Messages.Status.System.INAV, sample_payload(Messages.Status.System.INAV))
+        for label, kwargs in (("unicast", {"dest": "gcs1", "udp": True}), ("multicast", {"dest": "gcs1", "multicast": True})):
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                try:
+                    link.send(frame, **kwargs)
+                except UserWarning as e:
+                    print(f"DatalinkInterface.send {label}: skipped ({e})")
+                    continue
+            start = time.perf_counter()
+            for _ in range(n):
+                link.send(frame, **kwargs)
+            print(f"DatalinkInterface.send {label}: {n / (time.perf_counter() - start):,.0f} sends/s")
+        link.stop()
+        rx_sock.close()
+
+    asyncio.run(run())
+
+def udp_header_size():
+    """UDP envelope overhead with node names vs numeric node ids from nodes.json."""
+    with open("nodes.json") as f:
+        node_index = NodeIndex(json.load(f))
+    payload = encode_message(Messages.Status.System.INAV, sample_payload(Messages.Status.System.INAV))
+    for source, destination in (("drone1", "gcs1"), ("gcs1", "drone1")):
+        by_name = len(encode_udp_packet(source, destination, payload)) - len(payload)
+        by_id = len(encode_udp_packet(source, destination, payload, node_index=node_index)) - len(payload)
+        print(f"{source} -> {destination:<8} names {by_name:>3} B   ids {by_id:>3} B")
+
+def stream_decode(n_packets=2000, chunk_size=256):
+    """StreamDecoder throughput on a clean byte stream fed in serial-sized chunks."""
+    from streams import StreamDecoder
+    msg_enum = Messages.Status.System.INAV
+    stream = encode_udp_packet("drone1", "gcs1", encode_message(msg_enum, sample_payload(msg_enum))) * n_packets
+    chunks = [stream[i:i + chunk_size] for i in range(0, len(stream), chunk_size)]
+    def run():
+        decoder = StreamDecoder()
+        return sum(len(decoder.feed(chunk)) for chunk in chunks)
+    assert run() == n_packets
+    rate = timeit(run, n=20) * n_packets
+    print(f"StreamDecoder {chunk_size} byte chunks: {rate:>10,.0f} packets/s   {rate * len(stream) / n_packets / 1e6:.1f} MB/s")
+
+def lora_airtime(payload_len, sf=11, bw=250e3, cr=5, preamble=16, header=16):
+    """Semtech LoRa time on air in seconds, defaults are Meshtastic LongFast plus its 16 byte header."""
+    t_sym = (2 ** sf) / bw
+    low_dr = 1 if t_sym > 0.016 else 0
+    n_payload = 8 + max(math.ceil((8 * (payload_len + header) - 4 * sf + 28 + 16) / (4 * (sf - 2 * low_dr))) * cr, 0)
+    return (preamble + 4.25 + n_payload) * t_sym
+
+def bundling_throughput(n_messages=2000):
+    """Messages per second with and without FrameBundler: LoRa airtime bound and a UDP loopback run."""
+    messages = [(Messages.Status.System.INAV, sample_payload(Messages.Status.System.INAV)),
+                (Messages.Heartbeat.System.HEARTBEAT, sample_payload(Messages.Heartbeat.System.HEARTBEAT))] * (n_messages // 2)
+    frames, _ = encode_messages(messages)
+    rx_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    rx_sock.bind(("127.0.0.1", 0))
+    tx_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    addr = rx_sock.getsockname()
+    for bundled in (False, True):
+        if bundled:
+            bundler = FrameBundler()
+            packets = [packet for frame in frames for packet in bundler.add("gcs1", frame)] + [bundler.flush("gcs1")]
+        else:
+            packets = frames
+        airtime = sum(lora_airtime(len(packet)) for packet in packets)
+        received = 0
+        start = time.perf_counter()
+        for packet in packets:
+            tx_sock.sendto(encode_udp_packet("drone1", "gcs1", packet), addr)
+            source, destination, data = decode_udp_packet(rx_sock.recv(2048))
+            results, errors = decode_messages(unbundle(data))
+            received += len(results)
+        rate = received / (time.perf_counter() - start)
+        print(f"bundled={bundled!s:<5} {len(packets):>5} packets  {n_messages / len(packets):>5.1f} msg/packet   "
+              f"LoRa LongFast {n_messages / airtime:>6.1f} msg/s   UDP loopback {rate:>9,.0f} msg/s")
+    rx_sock.close()
+    tx_sock.close()
+
+def reassembly_speed(n_fragments=20):
+    """Reassembler rate for one transfer vs many interleaved ones (should stay flat)."""
+    fragmenter = Fragmenter()
+    for n_peers in (1, 50, 500):
+        transfers = [fragmenter.fragment(bytes([peer % 256]) * (FRAGMENT_CHUNK_SIZE * n_fragments)) for peer in range(n_peers)]
+        interleaved = [(peer, fragments[i]) for i in range(n_fragments) for peer, fragments in enumerate(transfers)]
+        reassembler = Reassembler(max_bytes=n_peers * (TRANSFER_OVERHEAD + n_fragments * (MAX_MESH_PACKET_SIZE + FRAGMENT_SLOT_SIZE)))
+        start = time.perf_counter()
+        complete = sum(reassembler.add(peer, fragment, now=0.0) is not None for peer, fragment in interleaved)
+        rate = len(interleaved) / (time.perf_counter() - start)
+        print(f"{n_peers:>4} interleaved transfers of {n_fragments} fragments: {rate:>10,.0f} fragments/s, {complete} complete")
+    # One peer starting a new transfer per fragment while others are in
+    # progress: each one evicts that peer's oldest, cost independent of the others
+    for n_peers in (1, 500):
+        reassembler = Reassembler(max_bytes=1 << 30)
+        for peer in range(1, n_peers):
+            reassembler.add(peer, msgpack.packb([FRAGMENT_MARKER, 0, 0, 2, b"x"]), now=0.0)
+        fragments = [msgpack.packb([FRAGMENT_MARKER, transfer_id, 0, 2, b"x"]) for transfer_id in range(20000)]
+        start = time.perf_counter()
+        for fragment in fragments:
+            reassembler.add(0, fragment, now=0.0)
+        rate = len(fragments) / (time.perf_counter() - start)
+        print(f"{n_peers:>4} peers, one opening a new transfer per fragment: {rate:>10,.0f} fragments/s, {len(reassembler.transfers)} held")
+
+# Operator chat/status strings not in compression_samples.txt
+chat_samples = [
+    b"drone3 holding at waypoint 9, alt 140m",
+    b"Battery low 23%, returning to home",
+    b"GPS fix lost, holding position at 18TWL4444455555",
+    b"gcs1: copy, continue mission 6",
+    b"Status: cruising, battery 71%, 15 sats",
+    b"Link quality degraded, RSSI -109 dBm, switching to mesh",
+    b"Waypoint 14 reached, 3 remaining",
+    b"Takeoff confirmed, climbing to 90m",
+    b"ok",
+]
+
+def compression_ratio():
+    """TEXTMSG size and encode/decode cost without compression, plain deflate and with the preset dictionary."""
+    msg_enum = Messages.Testing.System.TEXTMSG
+    plain = lambda data: zlib.compress(data, 9)[2:-4]  # raw deflate, no dictionary
+    sizes = {"none": 0, "deflate": 0, "dictionary": 0}
+    for text in chat_samples:
+        sizes["none"] += len(encode_message(msg_enum, [text], compress=False))
+        sizes["deflate"] += len(encode_message(msg_enum, [text], compress=False)) - len(text) + min(len(text), len(plain(text)))
+        sizes["dictionary"] += len(encode_message(msg_enum, [text]))
+    n = len(chat_samples)
+    print("TEXTMSG avg bytes: " + "   ".join(f"{label} {size / n:.1f}" for label, size in sizes.items())
+          + f"   (dictionary: {100 * (1 - sizes['dictionary'] / sizes['none']):.0f}% less)")
+    for compress in (False, True):
+        frames = [encode_message(msg_enum, [text], compress=compress) for text in chat_samples]
+        enc = timeit(lambda: [encode_message(msg_enum, [text], compress=compress) for text in chat_samples], n=2000) * n
+        dec = timeit(lambda: [decode_message(frame) for frame in frames], n=2000) * n
+        print(f"compress={compress!s:<5} encode {1e6 / enc:>5.1f} us/msg   decode {1e6 / dec:>5.1f} us/msg")
+
+def delta_telemetry(n_frames=120, keyframe_interval=12):
+    """Average INAV frame size over a simulated flight: full frames vs DeltaEncoder."""
+    msg_enum = Messages.Status.System.INAV
+    payloads = []
+    for i in range(n_frames):
+        cruising = i % 40 < 30  # straight and level most of the time, then a turn
+        payloads.append(msg_enum.payload(
+            inavmodes=0b1011,
+            airspeed=1500 + (0 if cruising else i % 7),
+            groundspeed=1480 + (i % 3 if cruising else i % 11),
+            heading=181 if cruising else (181 + 5 * (i % 40)) % 360,
+            msl_alt=120 + (i // 20),
+            packed_mgrs=(b"\x01" * 7) + bytes([i // 4 % 256, 0]),  # moves every 4th frame
+        ))
+    for compact in (False, True):
+        full = sum(len(encode_message(msg_enum, payload, compact=compact)) for payload in payloads)
+        encoder = DeltaEncoder(keyframe_interval=keyframe_interval)
+        delta = sum(len(encoder.encode("gcs1", msg_enum, payload, compact=compact)) for payload in payloads)
+        print(f"INAV compact={compact!s:<5} full {full / n_frames:>5.1f} B/frame   delta {delta / n_frames:>5.1f} B/frame   ({100 * (1 - delta / full):.0f}% less)")
+
+if __name__ == "__main__":
+    print("#" * 16, "Payload sizes (bytes)")
+    payload_size_comparison()
+    print()
+    print("#" * 16, "Codec speed")
+    codec_speed()
+    batch_speed()
+    lazy_decode()
+    retained_records()
+    schema_filter()
+    udp_envelope_rx()
+    stream_decode()
+    datalink_rx()
+    print()
+    print("#" * 16, "Datalink burst receive")
+    datalink_burst()
+    print()
+    print("#" * 16, "Datalink send")
+    datalink_send()
+    print()
+    print("#" * 16, "UDP envelope overhead (bytes)")
+    udp_header_size()
+    print()
+    print("#" * 16, "Frame bundling")
+    bundling_throughput()
+    print()
+    print("#" * 16, "Fragment reassembly")
+    reassembly_speed()
+    print()
+    print("#" * 16, "Compression")
+    compression_ratio()
+    print()
+    print("#" * 16, "Delta coded telemetry")
+    delta_telemetry()
@@ -0,0 +1,16 @@
+# This file is auto generated from compression_samples.txt, refer to gen_definitions.py
+# zlib preset dictionary for compressed message payloads. Changing it breaks
+# decoding of compressed messages between nodes with different versions.
+
+COMPRESSION_DICTIONARY = (
+    b'11 14 now100m120mRTH alt modeMSL, Wind 12 dBmdrone1 drone2 Headi'
+    b'ng Landed, Altitude Geofence Obstacle airspeed m/s from waypoint'
+    b'sMission 2 ack, uploaded, Battery low Navigate to GPS fix lost, '
+    b'reachedstartedCamera recording m/s, groundspeed Waypoint GPS fix'
+    b' recovered, Target acquired at groundspeed reducedholding at way'
+    b'point satsairborne, climbing to Battery GPS fix Status: battery '
+    b'complete, returning to homeLink quality degraded, RSSI gcs1: Tak'
+    b'eoff confirmed, climbing to holding positionpositionclimbing to '
+    b'groundspeed Switching to Mission continue missionreturning to ho'
+    b'me'
+)
@@ -5,7 +5,8 @@ import json
 from typing import Optional, Dict, Any
 import time
 import crcmod
-from protocol import SYNC_BYTE, crc16, encode_udp_packet, decode_udp_packet
+from protocol import SYNC_BYTE, crc16, encode_udp_packet, decode_udp_packet, NodeIndex, FrameBundler, unbundle, \
+    MAX_MESH_PACKET_SIZE, Fragmenter, Reassembler, is_fragment, is_nack
 
 class DatalinkInterface:
     def __init__(self, 
@@ -20,7 +21,12 @@ class DatalinkInterface:
                  my_id: int = 0,
                  nodemap: Dict[str, Dict] = {},
                  multicast_group: str = "",       # New parameter for multicast group
-                 multicast_port: int = None):       # New parameter for multicast port
+                 multicast_port: int = None,        # New parameter for multicast port
+                 numeric_node_ids: bool = False,    # Send meshids instead of names in the UDP envelope
+                 bundle_delay: float = 0.0,         # Seconds a message may wait to share a packet, 0 disables bundling
+                 rx_budget: int = 256,              # Datagrams read per socket per wakeup
+                 rcvbuf_size: Optional[int] = None,           # SO_RCVBUF of the UDP socket, None keeps the OS default
+                 multicast_rcvbuf_size: Optional[int] = None):  # SO_RCVBUF of the multicast socket, defaults to rcvbuf_size
                  
         if not (use_meshtastic or use_udp):
             raise ValueError("At least one datalinks mode must be enabled.")
@@ -32,6 +38,18 @@ class DatalinkInterface:
         self.my_name = my_name
         self.my_id = my_id
         self.nodemap = nodemap
+        # Received envelopes are decoded in either form, only sending is switched
+        self.node_index = NodeIndex(nodemap)
+        self.tx_node_index = self.node_index if numeric_node_ids else None
+        self.bundle_delay = bundle_delay
+        self.bundler = FrameBundler() if bundle_delay > 0 else None
+        self.bundle_timers = {}
+        # Messages over MAX_MESH_PACKET_SIZE are fragmented, missing fragments re-requested
+        self.fragmenter = Fragmenter()
+        self.reassembler = Reassembler()
+        self.rx_budget = rx_budget
+        self.rcvbuf_size = rcvbuf_size
+        self.multicast_rcvbuf_size = multicast_rcvbuf_size if multicast_rcvbuf_size is not None else rcvbuf_size
         
         # Set socket host and port based on my_id from nodemap
         if my_id and my_id in nodemap:
@@ -42,14 +60,21 @@ class DatalinkInterface:
 
         self.udp_sock = None
         self.multicast_sock = None  # Multicast socket
+        # Long-lived send sockets, opened in start()
+        self.send_sock = None
+        self.multicast_send_sock = None
+        # Resolved (ip, port) per node name, from nodemap
+        self.udp_addresses = {name: tuple(node["ip"]) for name, node in nodemap.items() if isinstance(node, dict) and "ip" in node}
         self.mesh_client = None
         self.rx_buffer = []
+        self.rx_ready = asyncio.Event()  # set while rx_buffer has messages
         self.running = False
         self.loop = asyncio.get_event_loop()
         
         self.multicast_group = multicast_group  # Save the multicast group
         # Use separate multicast port if provided; otherwise default to socket_port
         self.multicast_port = multicast_port if multicast_port is not None else self.socket_port
+        self.multicast_address = (self.multicast_group, self.multicast_port)
 
     def start(self):
         if self.use_udp:
@@ -57,6 +82,7 @@ class DatalinkInterface:
             self.udp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.udp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self.udp_sock.setblocking(False)
+            self._set_rcvbuf(self.udp_sock, self.rcvbuf_size)
             self.udp_sock.bind((self.socket_host, self.socket_port))
             
             # Create multicast socket if multicast_group is provided
@@ -79,6 +105,8 @@ class DatalinkInterface:
                 mreq = socket.inet_aton(self.multicast_group) + socket.inet_aton(self.socket_host)
                 self.multicast_sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
                 self.multicast_sock.setblocking(False)
+                self._set_rcvbuf(self.multicast_sock, self.multicast_rcvbuf_size)
+            self._open_send_sockets()
 
         if self.use_meshtastic:
             print("DatalinkInterface using Meshtastic")
@@ -87,78 +115,151 @@ class DatalinkInterface:
             self.mesh_client = MeshtasticClient(self.radio_port)
         
         self.running = True
-        asyncio.create_task(self._listen())
+        # Datagrams are read from the event loop's selector callbacks the moment they arrive
+        self.loop = asyncio.get_running_loop()
+        for sock in (self.udp_sock, self.multicast_sock):
+            if sock is not None:
+                self.loop.add_reader(sock.fileno(), self._on_readable, sock)
+        if self.udp_sock:
+            print(f"UDP Listening on {self.socket_host}:{self.socket_port}")
+        self.listen_task = asyncio.create_task(self._listen())
         print("Connected to datalinkss")
 
     def stop(self):
+        self.flush()
         self.running = False
-        if self.udp_sock:
-            self.udp_sock.close()
-        if self.multicast_sock:
-            self.multicast_sock.close()
+        for sock in (self.udp_sock, self.multicast_sock):
+            if sock is not None:
+                self.loop.remove_reader(sock.fileno())
+                sock.close()
+        for sock in (self.send_sock, self.multicast_send_sock):
+            if sock is not None:
+                sock.close()
+        self.send_sock = self.multicast_send_sock = None
         if self.mesh_client:
             self.mesh_client.meshint.close()
         print("DatalinkInterfaces stopped")
 
+    def _open_send_sockets(self):
+        self.send_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.send_sock.settimeout(2.0)
+        if self.multicast_group != "":
+            self.multicast_send_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+            self.multicast_send_sock.settimeout(2.0)
+            self.multicast_send_sock.setsockopt(
+                socket.IPPROTO_IP,
+                socket.IP_MULTICAST_IF,
+                socket.inet_aton(self.socket_host)
+            )
+            self.multicast_send_sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 0)
+            self.multicast_send_sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 2)
+
+    @staticmethod
+    def _set_rcvbuf(sock: socket.socket, size: Optional[int]):
+        if size is None:
+            return
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, size)
+        # Linux reports double the requested size and caps it at net.core.rmem_max
+        actual = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        if actual < size:
+            warnings.warn(f"Datalink SO_RCVBUF {size} capped to {actual} by the OS (net.core.rmem_max)")
+
+    def _on_readable(self, sock: socket.socket):
+        # Drain the socket until it would block or rx_budget datagrams were read,
+        # so a burst costs one wakeup, then decode and enqueue the batch
+        datagrams = []
+        recv = sock.recv
+        try:
+            for _ in range(self.rx_budget):
+                datagrams.append(recv(2048))
+        except (BlockingIOError, InterruptedError):
+            pass
+        except OSError as e:
+            warnings.warn(f"Datalink UDP receive error: {str(e)}")
+        queued = len(self.rx_buffer)
+        for datagram in datagrams:
+            try:
+                source, dest, data = decode_udp_packet(datagram, node_index=self.node_index)
+                if data:
+                    self._receive_frames(data, {"from": source}, udp=True)
+            except Exception as e:
+                warnings.warn(f"Datalink UDP listen error: {str(e)}")
+        if len(self.rx_buffer) > queued:
+            self.rx_ready.set()
+
     async def _listen(self):
-        print(f"UDP Listening on {self.socket_host}:{self.socket_port}")
+        # Reception is event driven, this only re-requests missing fragments
         while self.running:
-            if self.use_udp and self.udp_sock:
-                try:
-                    #if hasattr(self.loop, 'sock_recvfrom'):
-                    #    data, addr = await self.loop.sock_recvfrom(self.udp_sock, 1024)
-                    #else:
-                    data, addr = await self.loop.run_in_executor(None, self.udp_sock.recvfrom, 1024)
-                    #print(data)
-                    source, dest, data = decode_udp_packet(data)
-                    if data:
-                        self.rx_buffer.append({"data": data, "from": source})
-                except Exception as e:
-                    err = str(e)
-                    if "[Errno 11] Resource temporarily unavailable" not in err:
-                        warnings.warn(f"Datalink Multicast listen error: {str(e)}")
-            if self.multicast_sock:
-                try:
-                    #if hasattr(self.loop, 'sock_recvfrom'):
-                    #    data, addr = await self.loop.sock_recvfrom(self.multicast_sock, 1024)
-                    #else:
-                    data, addr = await self.loop.run_in_executor(None, self.multicast_sock.recvfrom, 1024)
-                    #print(data)
-                    source, dest, data = decode_udp_packet(data)
-                    if data:
-                        self.rx_buffer.append({"data": data, "from": source})
-                except Exception as e:
-                    err = str(e)
-                    if "[Errno 11] Resource temporarily unavailable" not in err:
-                        warnings.warn(f"Datalink Multicast listen error: {str(e)}")
+            for peer, nack in self.reassembler.nacks():
+                self._send_frame(nack, peer, True, True, False)
             await asyncio.sleep(0.1)
 
+    def _receive_frames(self, data: bytes, msg: dict, udp: bool):
+        """Unbundles a received packet into rx_buffer, handling fragments and re-requests."""
+        source = msg["from"]
+        for frame in unbundle(data):
+            if is_fragment(frame):
+                frame = self.reassembler.add(source, frame)
+                if frame is None:
+                    continue
+            elif is_nack(frame):
+                for fragment in self.fragmenter.resend(source, frame):
+                    self._send_frame(fragment, source, udp, not udp, False)
+                continue
+            self.rx_buffer.append({**msg, "data": frame})
 
-    def send(self, data: bytes, dest: Optional[str] = None, udp: bool = False, meshtastic: bool = False, multicast: bool = False) -> bool:
+
+    def send(self, data: bytes, dest: Optional[str] = None, udp: bool = False, meshtastic: bool = False, multicast: bool = False, bundle: bool = True) -> bool:
+        """
+        With bundling enabled the message is queued and sent together with others
+        for the same destination once the packet is full or bundle_delay has passed.
+        bundle=False sends it right away (after anything already queued for it).
+        Messages over MAX_MESH_PACKET_SIZE are sent as fragments.
+        """
+        frames = self.fragmenter.fragment(data, None if multicast else dest) if len(data) > MAX_MESH_PACKET_SIZE else [data]
+        if self.bundler is None:
+            return all([self._send_frame(frame, dest, udp, meshtastic, multicast) for frame in frames])
+        key = (dest, udp, meshtastic, multicast)
+        if bundle:
+            ready = [ready_frame for frame in frames for ready_frame in self.bundler.add(key, frame)]
+        else:
+            ready = [frame for frame in (self.bundler.flush(key), *frames) if frame is not None]
+        sent = all([self._send_frame(frame, *key) for frame in ready])
+        if ready and key in self.bundle_timers:
+            self.bundle_timers.pop(key).cancel()
+        if key in self.bundler.pending and key not in self.bundle_timers:
+            self.bundle_timers[key] = self.loop.call_later(self.bundle_delay, self._flush_bundle, key)
+        return sent
+
+    def _flush_bundle(self, key) -> bool:
+        self.bundle_timers.pop(key, None)
+        frame = self.bundler.flush(key)
+        return frame is None or self._send_frame(frame, *key)
+
+    def flush(self) -> bool:
+        """Sends everything queued for bundling now."""
+        if self.bundler is None:
+            return True
+        for timer in self.bundle_timers.values():
+            timer.cancel()
+        self.bundle_timers.clear()
+        return all([self._flush_bundle(key) for key in list(self.bundler.pending)])
+
+    def _send_frame(self, data: bytes, dest: Optional[str], udp: bool, meshtastic: bool, multicast: bool) -> bool:
         try:
             if self.use_udp:
+                if self.send_sock is None:
+                    self._open_send_sockets()
                 # Send multicast if requested and a group is defined.
                 if multicast and self.multicast_group != "":
-                    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP) as send_sock:
-                        send_sock.settimeout(2.0)
-                        send_sock.setsockopt(
-                            socket.IPPROTO_IP,
-                            socket.IP_MULTICAST_IF,
-                            socket.inet_aton(self.socket_host)
-                        )
-                        send_sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 0)
-                        send_sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 2)
-                        encdat = encode_udp_packet(source=self.my_name, destination=dest, payload=data)
-                        send_sock.sendto(encdat, (self.multicast_group, self.multicast_port))
-                        return True
+                    encdat = encode_udp_packet(source=self.my_name, destination=dest, payload=data, node_index=self.tx_node_index)
+                    self.multicast_send_sock.sendto(encdat, self.multicast_address)
+                    return True
                 # Otherwise send unicast.
-                elif dest in self.nodemap and udp:
-                    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as send_sock:
-                        send_sock.settimeout(2.0)
-                        addr = self.nodemap[dest]["ip"]
-                        encdat = encode_udp_packet(source=self.my_name, destination=dest, payload=data)
-                        send_sock.sendto(encdat, tuple(addr))
-                        return True
+                elif udp and dest in self.udp_addresses:
+                    encdat = encode_udp_packet(source=self.my_name, destination=dest, payload=data, node_index=self.tx_node_index)
+                    self.send_sock.sendto(encdat, self.udp_addresses[dest])
+                    return True
         except Exception as e:
             warnings.warn(f"Datalink UDP Send failed: {str(e)}")
             return False
@@ -183,11 +284,28 @@ class DatalinkInterface:
         if self.mesh_client is not None:
             for msg in self.mesh_client.checkMail():
                 if msg.get("port") == self.link_port:
-                    self.rx_buffer.append(msg)
+                    if isinstance(msg.get("from"), int):
+                        msg["from"] = self.node_index.names.get(msg["from"], msg["from"])
+                    try:
+                        self._receive_frames(msg["data"], msg, udp=False)
+                    except Exception as e:
+                        warnings.warn(f"Datalink Meshtastic receive error: {str(e)}")
         messages = self.rx_buffer.copy()
         self.rx_buffer.clear()
+        self.rx_ready.clear()
         return messages
 
+    async def receive_wait(self, timeout: Optional[float] = None) -> list:
+        """
+        receive(), waiting up to timeout seconds for a message to arrive first.
+        UDP datagrams wake it immediately, Meshtastic mail is collected when it returns.
+        """
+        try:
+            await asyncio.wait_for(self.rx_ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.receive()
+
 def load_nodes_map():
     with open("nodes.json", 'r') as file:
         return json.loads(file.read())
@@ -0,0 +1,12 @@
+# Schema fingerprint shared by gen_definitions.py (SCHEMA_FINGERPRINT in
+# message_codecs.py) and protocol.py (PeerSchemas translations)
+import json
+import hashlib
+
+def schema_fingerprint(message_dict) -> int:
+    """
+    32-bit hash of everything that decides the wire format: category, subcategory
+    and message order (the auto() ids), field names, types and bitmask flags.
+    """
+    canonical = json.dumps(message_dict, separators=(",", ":"))
+    return int.from_bytes(hashlib.sha256(canonical.encode()).digest()[:4], "big")
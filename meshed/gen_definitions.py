@@ -3,6 +3,10 @@ import csv
 import json
 import pprint
 import os
+import re
+import textwrap
+from collections import Counter
+from fingerprint import schema_fingerprint
 
 def generate_enums_file(message_dict):
     # Remove old file to ensure fresh generation
@@ -58,6 +62,314 @@ def generate_enums_file(message_dict):
     with open("message_structure.py", "w") as f:
         f.write(code)
 
+# Python type each CSV datatype is validated against in the generated encoders
+codec_type_names = {
+    "int": "int",
+    "float": "float",
+    "string": "str",
+    "bool": "bool",
+    "enum": "IntEnum",
+    "bytes": "bytes",
+    "uint8_t": "int",
+    "uint16_t": "int",
+    "uint32_t": "int",
+    "uint64_t": "int",
+    "int8_t": "int",
+    "int16_t": "int",
+    "int32_t": "int",
+    "int64_t": "int",
+    "double": "float",
+    "char": "bytes",
+}
+
+# Fixed-size datatypes usable in the binary (struct) payload layout.
+# Anything not listed here (int, string, bytes) is variable and goes through msgpack.
+bin_type_map = {
+    "enum": "B",
+    "uint8_t": "B",
+    "uint16_t": "H",
+    "uint32_t": "I",
+    "uint64_t": "Q",
+    "int8_t": "b",
+    "int16_t": "h",
+    "int32_t": "i",
+    "int64_t": "q",
+    "float": "f",
+    "double": "d",
+    "char": "c",
+    "bool": "?"
+}
+
+# Value ranges checked by the generated encoders for sized integer fields
+int_ranges = {
+    "uint8_t": (0, 0xFF),
+    "uint16_t": (0, 0xFFFF),
+    "uint32_t": (0, 0xFFFFFFFF),
+    "uint64_t": (0, 0xFFFFFFFFFFFFFFFF),
+    "int8_t": (-0x80, 0x7F),
+    "int16_t": (-0x8000, 0x7FFF),
+    "int32_t": (-0x80000000, 0x7FFFFFFF),
+    "int64_t": (-0x8000000000000000, 0x7FFFFFFFFFFFFFFF),
+}
+# Enum fields are packed as uint8 in the binary layout
+bin_ranges = {**int_ranges, "enum": (0, 0xFF)}
+
+def range_check(key, datatype):
+    """Generated check of a sized integer field against its struct range."""
+    low, high = bin_ranges[datatype]
+    return (f"    if not {low} <= {key} <= {high}:\n"
+            f"        raise ValueError(f\"Protocol Error: Field '{key}' value {{{key}}} out of range for {datatype}\")\n")
+
+# Base class of the generated payload classes in message_codecs.py. Slots only,
+# so a retained record costs a fraction of the decoded dict; reads like the dict too.
+PAYLOAD_RECORD_BASE = '''class PayloadRecord:
+    __slots__ = ()
+    msg_name = ""
+    msg_enum = None  # set by protocol.register_message
+    encoder = None   # protocol.encode_message, set by protocol.build_message_registry
+
+    def encode(self, binary=False, compact=False, compress=None):
+        """Encodes the record as a message envelope, with the same validation as Messages.*.payload()."""
+        return self.encoder(self.msg_enum, self.to_list(), binary, compact, compress)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def __eq__(self, other):
+        if isinstance(other, PayloadRecord):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        return self.to_dict() == other
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{key}={getattr(self, key)!r}' for key in self.__slots__)})"
+
+'''
+
+def generate_codecs_file(message_dict):
+    """Generates message_codecs.py: one unrolled encode/decode function per message,
+    plus a struct binary layout (pack/unpack) for messages with fixed-size fields."""
+    if os.path.exists("message_codecs.py"):
+        os.remove("message_codecs.py")
+
+    code = "# This file is auto generated by gen_definitions.py, do not edit\n\n"
+    code += "import struct\n"
+    code += "import msgpack\n"
+    code += "from enum import IntEnum\n"
+    code += "from payload_enums import PayloadEnum\n\n"
+    code += "# Hash of the message definitions this file was generated from, see schema_fingerprint()\n"
+    code += f"SCHEMA_FINGERPRINT = 0x{schema_fingerprint(message_dict):08x}\n\n"
+    code += "def field_mismatch(fields, kwargs):\n"
+    code += "    missing = fields - kwargs.keys()\n"
+    code += "    if missing:\n"
+    code += "        return ValueError(f\"Protocol Error: Missing required fields: {missing}\")\n"
+    code += "    return ValueError(f\"Protocol Error: Extra fields provided: {set(kwargs.keys() - fields)}\")\n\n"
+    code += "def length_mismatch(payload_list, expected):\n"
+    code += "    return ValueError(f\"Protocol Error: Payload list length {len(payload_list)} does not match definition {expected}\")\n\n"
+    code += PAYLOAD_RECORD_BASE
+
+    encoders = []
+    decoders = []
+    packers = []
+    unpackers = []
+    records = []
+    for category in message_dict:
+        for subcategory in message_dict[category]:
+            for message in message_dict[category][subcategory]:
+                payload = message_dict[category][subcategory][message]
+                name = f"{category}.{subcategory}.{message}"
+                ident = name.replace(".", "_")
+                keys = []
+                annotations = []
+                fixed_keys = []
+                variable_keys = []
+                fmt = "<"
+                checks = ""
+                pack_checks = ""  # validation before struct.pack, so bad values raise like the msgpack path
+                converts = ""
+                for field in payload:
+                    field_name = field["name"]
+                    datatype = field["datatype"]
+                    if field_name.startswith("PayloadEnum_"):
+                        key = field_name[len("PayloadEnum_"):]
+                        enum_name = datatype or field_name
+                        checks += f"    if not isinstance({key}, PayloadEnum.{enum_name}):\n"
+                        checks += f"        raise TypeError(f\"Protocol Error: Field '{key}' expects an instance of {enum_name}, got {{type({key}).__name__}}\")\n"
+                        converts += f"    try:\n"
+                        converts += f"        {key} = PayloadEnum.{enum_name}({key})\n"
+                        converts += f"    except ValueError:\n"
+                        converts += f"        raise ValueError(f\"Protocol Error: Invalid value {{{key}}} for enum {enum_name}\") from None\n"
+                        datatype = "enum"
+                        annotations.append(f"PayloadEnum.{enum_name}")
+                        # Hand built payload lists may carry plain ints, only the struct range matters here
+                        pack_checks += range_check(key, "enum")
+                    else:
+                        key = field_name
+                        type_name = codec_type_names.get(datatype)
+                        if type_name is None:
+                            raise ValueError(f"Unknown datatype '{datatype}' for field '{key}' in {name}")
+                        if datatype in int_ranges:
+                            # bool is an int subclass but not a valid sized int
+                            field_check = f"    if not isinstance({key}, int) or isinstance({key}, bool):\n"
+                        else:
+                            field_check = f"    if not isinstance({key}, {type_name}):\n"
+                        field_check += f"        raise TypeError(f\"Protocol Error: Field '{key}' expects {type_name}, got {{type({key}).__name__}}\")\n"
+                        if datatype in bin_ranges:
+                            field_check += range_check(key, datatype)
+                        elif datatype == "char":
+                            field_check += f"    if len({key}) != 1:\n"
+                            field_check += f"        raise ValueError(f\"Protocol Error: Field '{key}' expects 1 byte for char, got {{len({key})}}\")\n"
+                        checks += field_check
+                        if datatype in bin_type_map:
+                            pack_checks += field_check
+                        annotations.append(type_name)
+                    keys.append(key)
+                    if datatype in bin_type_map:
+                        fixed_keys.append(key)
+                        fmt += bin_type_map[datatype]
+                    else:
+                        variable_keys.append(key)
+
+                code += f"# {name}\n"
+                code += f"{ident}_fields = frozenset({tuple(keys)!r})\n"
+                if fixed_keys:
+                    code += f"{ident}_struct = struct.Struct({fmt!r})\n"
+                code += "\n"
+
+                code += f"def encode_{ident}(kwargs):\n"
+                code += f"    if kwargs.keys() != {ident}_fields:\n"
+                code += f"        raise field_mismatch({ident}_fields, kwargs)\n"
+                for key in keys:
+                    code += f"    {key} = kwargs[{key!r}]\n"
+                code += checks
+                code += f"    return [{', '.join(keys)}]\n\n"
+
+                code += f"def decode_{ident}(payload_list):\n"
+                code += f"    if len(payload_list) != {len(keys)}:\n"
+                code += f"        raise length_mismatch(payload_list, {len(keys)})\n"
+                if keys:
+                    code += f"    {', '.join(keys)}, = payload_list\n"
+                code += converts
+                code += "    return {" + ", ".join(f"{key!r}: {key}" for key in keys) + "}\n\n"
+
+                # Payload class: one slot per field, same checks and conversions
+                code += f"class {ident}(PayloadRecord):\n"
+                code += f"    __slots__ = {tuple(keys)!r}\n"
+                code += f"    msg_name = {name!r}\n\n"
+                code += f"    def __init__(self{''.join(f', {key}: {annotation}' for key, annotation in zip(keys, annotations))}):\n"
+                for key in keys:
+                    code += f"        self.{key} = {key}\n"
+                if not keys:
+                    code += "        pass\n"
+                code += "\n    @classmethod\n"
+                code += "    def from_list(cls, payload_list):\n"
+                code += f"        if len(payload_list) != {len(keys)}:\n"
+                code += f"            raise length_mismatch(payload_list, {len(keys)})\n"
+                code += "        self = object.__new__(cls)\n"
+                if keys and not converts:
+                    code += f"        {', '.join(f'self.{key}' for key in keys)}, = payload_list\n"
+                elif keys:
+                    code += f"        {', '.join(keys)}, = payload_list\n"
+                    code += textwrap.indent(converts, "    ")
+                    for key in keys:
+                        code += f"        self.{key} = {key}\n"
+                code += "        return self\n\n"
+                code += "    def to_list(self):\n"
+                for key in keys:
+                    code += f"        {key} = self.{key}\n"
+                code += textwrap.indent(checks, "    ")
+                code += f"        return [{', '.join(keys)}]\n\n"
+
+                # Binary layout: fixed fields in one struct, variable fields as a msgpack tail
+                if fixed_keys:
+                    code += f"def pack_{ident}(payload_list):\n"
+                    code += f"    {', '.join(keys)}, = payload_list\n"
+                    code += pack_checks
+                    packed = f"{ident}_struct.pack({', '.join(fixed_keys)})"
+                    if len(variable_keys) == 1:
+                        packed += f" + msgpack.packb({variable_keys[0]})"
+                    elif variable_keys:
+                        packed += f" + msgpack.packb([{', '.join(variable_keys)}])"
+                    code += f"    return {packed}\n\n"
+
+                    code += f"def unpack_{ident}(data):\n"
+                    code += f"    {', '.join(fixed_keys)}, = {ident}_struct.unpack_from(data)\n"
+                    if len(variable_keys) == 1:
+                        code += f"    {variable_keys[0]} = msgpack.unpackb(data[{ident}_struct.size:])\n"
+                    elif variable_keys:
+                        code += f"    {', '.join(variable_keys)}, = msgpack.unpackb(data[{ident}_struct.size:], use_list=True)\n"
+                    else:
+                        code += f"    if len(data) != {ident}_struct.size:\n"
+                        code += f"        raise ValueError(f\"Protocol Error: Binary payload length {{len(data)}} does not match layout {{{ident}_struct.size}}\")\n"
+                    code += f"    return [{', '.join(keys)}]\n\n"
+
+                    packers.append(f"    {name!r}: pack_{ident},\n")
+                    unpackers.append(f"    {name!r}: unpack_{ident},\n")
+
+                encoders.append(f"    {name!r}: encode_{ident},\n")
+                decoders.append(f"    {name!r}: decode_{ident},\n")
+                records.append(f"    {name!r}: {ident},\n")
+
+    code += "\nENCODERS = {\n" + "".join(encoders) + "}\n\n"
+    code += "DECODERS = {\n" + "".join(decoders) + "}\n\n"
+    code += "# Only messages with at least one fixed-size field have a binary layout\n"
+    code += "PACKERS = {\n" + "".join(packers) + "}\n\n"
+    code += "UNPACKERS = {\n" + "".join(unpackers) + "}\n\n"
+    code += "RECORDS = {\n" + "".join(records) + "}\n"
+
+    print(f"Generated codecs for {len(encoders)} messages ({len(packers)} with binary layout)")
+
+    with open("message_codecs.py", "w") as f:
+        f.write(code)
+
+def generate_compression_dictionary(samples_file="compression_samples.txt", max_size=2048):
+    """
+    Builds the zlib preset dictionary for compressed messages from sample text,
+    one message per line: the word n-grams that repeat across samples, scored by
+    bytes saved, most valuable last (closest to the data). Writes compression_dictionary.py.
+    """
+    with open(samples_file, encoding="utf-8") as f:
+        samples = [line.rstrip("\n") for line in f if line.strip()]
+    counts = Counter()
+    for sample in samples:
+        tokens = re.findall(r"\S+\s*", sample)
+        grams = set()
+        for n in range(1, 5):
+            for i in range(len(tokens) - n + 1):
+                grams.add("".join(tokens[i:i + n]))
+        counts.update(grams)  # number of samples containing each n-gram
+    candidates = sorted(((count - 1) * len(gram), gram) for gram, count in counts.items() if count > 1 and len(gram) > 2)
+    chosen = []
+    size = 0
+    for score, gram in reversed(candidates):
+        if any(gram in other for other in chosen):
+            continue
+        if size + len(gram.encode()) > max_size:
+            break
+        chosen.append(gram)
+        size += len(gram.encode())
+    dictionary = "".join(reversed(chosen)).encode()
+
+    code = "# This file is auto generated from compression_samples.txt, refer to gen_definitions.py\n"
+    code += "# zlib preset dictionary for compressed message payloads. Changing it breaks\n"
+    code += "# decoding of compressed messages between nodes with different versions.\n\n"
+    code += "COMPRESSION_DICTIONARY = (\n"
+    for i in range(0, len(dictionary), 64):
+        code += f"    {dictionary[i:i + 64]!r}\n"
+    code += ")\n"
+    with open("compression_dictionary.py", "w") as f:
+        f.write(code)
+
 def generate_message_definitions():
     """Reads the CSV, builds the message dictionary, writes it to JSON, and generates enums."""
     messages = {}
@@ -100,8 +412,10 @@ def generate_message_definitions():
     with open("message_definitions.json", "w") as file:
         file.write(json.dumps(messages, indent=4))
     
-    # Generate enums
+    # Generate enums and per-message codecs
     generate_enums_file(messages)
+    generate_codecs_file(messages)
+    generate_compression_dictionary()
 
 if __name__ == '__main__':
     generate_message_definitions()
@@ -0,0 +1,2154 @@
+# This file is auto generated by gen_definitions.py, do not edit
+
+import struct
+import msgpack
+from enum import IntEnum
+from payload_enums import PayloadEnum
+
+# Hash of the message definitions this file was generated from, see schema_fingerprint()
+SCHEMA_FINGERPRINT = 0xebfaf3b6
+
+def field_mismatch(fields, kwargs):
+    missing = fields - kwargs.keys()
+    if missing:
+        return ValueError(f"Protocol Error: Missing required fields: {missing}")
+    return ValueError(f"Protocol Error: Extra fields provided: {set(kwargs.keys() - fields)}")
+
+def length_mismatch(payload_list, expected):
+    return ValueError(f"Protocol Error: Payload list length {len(payload_list)} does not match definition {expected}")
+
+class PayloadRecord:
+    __slots__ = ()
+    msg_name = ""
+    msg_enum = None  # set by protocol.register_message
+    encoder = None   # protocol.encode_message, set by protocol.build_message_registry
+
+    def encode(self, binary=False, compact=False, compress=None):
+        """Encodes the record as a message envelope, with the same validation as Messages.*.payload()."""
+        return self.encoder(self.msg_enum, self.to_list(), binary, compact, compress)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def __eq__(self, other):
+        if isinstance(other, PayloadRecord):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        return self.to_dict() == other
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{key}={getattr(self, key)!r}' for key in self.__slots__)})"
+
+# Heartbeat.System.HEARTBEAT
+Heartbeat_System_HEARTBEAT_fields = frozenset(('schema_fingerprint',))
+Heartbeat_System_HEARTBEAT_struct = struct.Struct('<I')
+
+def encode_Heartbeat_System_HEARTBEAT(kwargs):
+    if kwargs.keys() != Heartbeat_System_HEARTBEAT_fields:
+        raise field_mismatch(Heartbeat_System_HEARTBEAT_fields, kwargs)
+    schema_fingerprint = kwargs['schema_fingerprint']
+    if not isinstance(schema_fingerprint, int) or isinstance(schema_fingerprint, bool):
+        raise TypeError(f"Protocol Error: Field 'schema_fingerprint' expects int, got {type(schema_fingerprint).__name__}")
+    if not 0 <= schema_fingerprint <= 4294967295:
+        raise ValueError(f"Protocol Error: Field 'schema_fingerprint' value {schema_fingerprint} out of range for uint32_t")
+    return [schema_fingerprint]
+
+def decode_Heartbeat_System_HEARTBEAT(payload_list):
+    if len(payload_list) != 1:
+        raise length_mismatch(payload_list, 1)
+    schema_fingerprint, = payload_list
+    return {'schema_fingerprint': schema_fingerprint}
+
+class Heartbeat_System_HEARTBEAT(PayloadRecord):
+    __slots__ = ('schema_fingerprint',)
+    msg_name = 'Heartbeat.System.HEARTBEAT'
+
+    def __init__(self, schema_fingerprint: int):
+        self.schema_fingerprint = schema_fingerprint
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 1:
+            raise length_mismatch(payload_list, 1)
+        self = object.__new__(cls)
+        self.schema_fingerprint, = payload_list
+        return self
+
+    def to_list(self):
+        schema_fingerprint = self.schema_fingerprint
+        if not isinstance(schema_fingerprint, int) or isinstance(schema_fingerprint, bool):
+            raise TypeError(f"Protocol Error: Field 'schema_fingerprint' expects int, got {type(schema_fingerprint).__name__}")
+        if not 0 <= schema_fingerprint <= 4294967295:
+            raise ValueError(f"Protocol Error: Field 'schema_fingerprint' value {schema_fingerprint} out of range for uint32_t")
+        return [schema_fingerprint]
+
+def pack_Heartbeat_System_HEARTBEAT(payload_list):
+    schema_fingerprint, = payload_list
+    if not isinstance(schema_fingerprint, int) or isinstance(schema_fingerprint, bool):
+        raise TypeError(f"Protocol Error: Field 'schema_fingerprint' expects int, got {type(schema_fingerprint).__name__}")
+    if not 0 <= schema_fingerprint <= 4294967295:
+        raise ValueError(f"Protocol Error: Field 'schema_fingerprint' value {schema_fingerprint} out of range for uint32_t")
+    return Heartbeat_System_HEARTBEAT_struct.pack(schema_fingerprint)
+
+def unpack_Heartbeat_System_HEARTBEAT(data):
+    schema_fingerprint, = Heartbeat_System_HEARTBEAT_struct.unpack_from(data)
+    if len(data) != Heartbeat_System_HEARTBEAT_struct.size:
+        raise ValueError(f"Protocol Error: Binary payload length {len(data)} does not match layout {Heartbeat_System_HEARTBEAT_struct.size}")
+    return [schema_fingerprint]
+
+# Testing.System.TEXTMSG
+Testing_System_TEXTMSG_fields = frozenset(('textdata',))
+
+def encode_Testing_System_TEXTMSG(kwargs):
+    if kwargs.keys() != Testing_System_TEXTMSG_fields:
+        raise field_mismatch(Testing_System_TEXTMSG_fields, kwargs)
+    textdata = kwargs['textdata']
+    if not isinstance(textdata, bytes):
+        raise TypeError(f"Protocol Error: Field 'textdata' expects bytes, got {type(textdata).__name__}")
+    return [textdata]
+
+def decode_Testing_System_TEXTMSG(payload_list):
+    if len(payload_list) != 1:
+        raise length_mismatch(payload_list, 1)
+    textdata, = payload_list
+    return {'textdata': textdata}
+
+class Testing_System_TEXTMSG(PayloadRecord):
+    __slots__ = ('textdata',)
+    msg_name = 'Testing.System.TEXTMSG'
+
+    def __init__(self, textdata: bytes):
+        self.textdata = textdata
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 1:
+            raise length_mismatch(payload_list, 1)
+        self = object.__new__(cls)
+        self.textdata, = payload_list
+        return self
+
+    def to_list(self):
+        textdata = self.textdata
+        if not isinstance(textdata, bytes):
+            raise TypeError(f"Protocol Error: Field 'textdata' expects bytes, got {type(textdata).__name__}")
+        return [textdata]
+
+# Testing.System.BINMSG
+Testing_System_BINMSG_fields = frozenset(('data',))
+
+def encode_Testing_System_BINMSG(kwargs):
+    if kwargs.keys() != Testing_System_BINMSG_fields:
+        raise field_mismatch(Testing_System_BINMSG_fields, kwargs)
+    data = kwargs['data']
+    if not isinstance(data, bytes):
+        raise TypeError(f"Protocol Error: Field 'data' expects bytes, got {type(data).__name__}")
+    return [data]
+
+def decode_Testing_System_BINMSG(payload_list):
+    if len(payload_list) != 1:
+        raise length_mismatch(payload_list, 1)
+    data, = payload_list
+    return {'data': data}
+
+class Testing_System_BINMSG(PayloadRecord):
+    __slots__ = ('data',)
+    msg_name = 'Testing.System.BINMSG'
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 1:
+            raise length_mismatch(payload_list, 1)
+        self = object.__new__(cls)
+        self.data, = payload_list
+        return self
+
+    def to_list(self):
+        data = self.data
+        if not isinstance(data, bytes):
+            raise TypeError(f"Protocol Error: Field 'data' expects bytes, got {type(data).__name__}")
+        return [data]
+
+# Status.Mission.MISSION_PHASE
+Status_Mission_MISSION_PHASE_fields = frozenset(('MissionPhase',))
+Status_Mission_MISSION_PHASE_struct = struct.Struct('<B')
+
+def encode_Status_Mission_MISSION_PHASE(kwargs):
+    if kwargs.keys() != Status_Mission_MISSION_PHASE_fields:
+        raise field_mismatch(Status_Mission_MISSION_PHASE_fields, kwargs)
+    MissionPhase = kwargs['MissionPhase']
+    if not isinstance(MissionPhase, IntEnum):
+        raise TypeError(f"Protocol Error: Field 'MissionPhase' expects IntEnum, got {type(MissionPhase).__name__}")
+    if not 0 <= MissionPhase <= 255:
+        raise ValueError(f"Protocol Error: Field 'MissionPhase' value {MissionPhase} out of range for enum")
+    return [MissionPhase]
+
+def decode_Status_Mission_MISSION_PHASE(payload_list):
+    if len(payload_list) != 1:
+        raise length_mismatch(payload_list, 1)
+    MissionPhase, = payload_list
+    return {'MissionPhase': MissionPhase}
+
+class Status_Mission_MISSION_PHASE(PayloadRecord):
+    __slots__ = ('MissionPhase',)
+    msg_name = 'Status.Mission.MISSION_PHASE'
+
+    def __init__(self, MissionPhase: IntEnum):
+        self.MissionPhase = MissionPhase
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 1:
+            raise length_mismatch(payload_list, 1)
+        self = object.__new__(cls)
+        self.MissionPhase, = payload_list
+        return self
+
+    def to_list(self):
+        MissionPhase = self.MissionPhase
+        if not isinstance(MissionPhase, IntEnum):
+            raise TypeError(f"Protocol Error: Field 'MissionPhase' expects IntEnum, got {type(MissionPhase).__name__}")
+        if not 0 <= MissionPhase <= 255:
+            raise ValueError(f"Protocol Error: Field 'MissionPhase' value {MissionPhase} out of range for enum")
+        return [MissionPhase]
+
+def pack_Status_Mission_MISSION_PHASE(payload_list):
+    MissionPhase, = payload_list
+    if not isinstance(MissionPhase, IntEnum):
+        raise TypeError(f"Protocol Error: Field 'MissionPhase' expects IntEnum, got {type(MissionPhase).__name__}")
+    if not 0 <= MissionPhase <= 255:
+        raise ValueError(f"Protocol Error: Field 'MissionPhase' value {MissionPhase} out of range for enum")
+    return Status_Mission_MISSION_PHASE_struct.pack(MissionPhase)
+
+def unpack_Status_Mission_MISSION_PHASE(data):
+    MissionPhase, = Status_Mission_MISSION_PHASE_struct.unpack_from(data)
+    if len(data) != Status_Mission_MISSION_PHASE_struct.size:
+        raise ValueError(f"Protocol Error: Binary payload length {len(data)} does not match layout {Status_Mission_MISSION_PHASE_struct.size}")
+    return [MissionPhase]
+
+# Status.System.INAV
+Status_System_INAV_fields = frozenset(('inavmodes', 'airspeed', 'groundspeed', 'heading', 'msl_alt', 'packed_mgrs'))
+Status_System_INAV_struct = struct.Struct('<IHHhh')
+
+def encode_Status_System_INAV(kwargs):
+    if kwargs.keys() != Status_System_INAV_fields:
+        raise field_mismatch(Status_System_INAV_fields, kwargs)
+    inavmodes = kwargs['inavmodes']
+    airspeed = kwargs['airspeed']
+    groundspeed = kwargs['groundspeed']
+    heading = kwargs['heading']
+    msl_alt = kwargs['msl_alt']
+    packed_mgrs = kwargs['packed_mgrs']
+    if not isinstance(inavmodes, int) or isinstance(inavmodes, bool):
+        raise TypeError(f"Protocol Error: Field 'inavmodes' expects int, got {type(inavmodes).__name__}")
+    if not 0 <= inavmodes <= 4294967295:
+        raise ValueError(f"Protocol Error: Field 'inavmodes' value {inavmodes} out of range for uint32_t")
+    if not isinstance(airspeed, int) or isinstance(airspeed, bool):
+        raise TypeError(f"Protocol Error: Field 'airspeed' expects int, got {type(airspeed).__name__}")
+    if not 0 <= airspeed <= 65535:
+        raise ValueError(f"Protocol Error: Field 'airspeed' value {airspeed} out of range for uint16_t")
+    if not isinstance(groundspeed, int) or isinstance(groundspeed, bool):
+        raise TypeError(f"Protocol Error: Field 'groundspeed' expects int, got {type(groundspeed).__name__}")
+    if not 0 <= groundspeed <= 65535:
+        raise ValueError(f"Protocol Error: Field 'groundspeed' value {groundspeed} out of range for uint16_t")
+    if not isinstance(heading, int) or isinstance(heading, bool):
+        raise TypeError(f"Protocol Error: Field 'heading' expects int, got {type(heading).__name__}")
+    if not -32768 <= heading <= 32767:
+        raise ValueError(f"Protocol Error: Field 'heading' value {heading} out of range for int16_t")
+    if not isinstance(msl_alt, int) or isinstance(msl_alt, bool):
+        raise TypeError(f"Protocol Error: Field 'msl_alt' expects int, got {type(msl_alt).__name__}")
+    if not -32768 <= msl_alt <= 32767:
+        raise ValueError(f"Protocol Error: Field 'msl_alt' value {msl_alt} out of range for int16_t")
+    if not isinstance(packed_mgrs, bytes):
+        raise TypeError(f"Protocol Error: Field 'packed_mgrs' expects bytes, got {type(packed_mgrs).__name__}")
+    return [inavmodes, airspeed, groundspeed, heading, msl_alt, packed_mgrs]
+
+def decode_Status_System_INAV(payload_list):
+    if len(payload_list) != 6:
+        raise length_mismatch(payload_list, 6)
+    inavmodes, airspeed, groundspeed, heading, msl_alt, packed_mgrs, = payload_list
+    return {'inavmodes': inavmodes, 'airspeed': airspeed, 'groundspeed': groundspeed, 'heading': heading, 'msl_alt': msl_alt, 'packed_mgrs': packed_mgrs}
+
+class Status_System_INAV(PayloadRecord):
+    __slots__ = ('inavmodes', 'airspeed', 'groundspeed', 'heading', 'msl_alt', 'packed_mgrs')
+    msg_name = 'Status.System.INAV'
+
+    def __init__(self, inavmodes: int, airspeed: int, groundspeed: int, heading: int, msl_alt: int, packed_mgrs: bytes):
+        self.inavmodes = inavmodes
+        self.airspeed = airspeed
+        self.groundspeed = groundspeed
+        self.heading = heading
+        self.msl_alt = msl_alt
+        self.packed_mgrs = packed_mgrs
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 6:
+            raise length_mismatch(payload_list, 6)
+        self = object.__new__(cls)
+        self.inavmodes, self.airspeed, self.groundspeed, self.heading, self.msl_alt, self.packed_mgrs, = payload_list
+        return self
+
+    def to_list(self):
+        inavmodes = self.inavmodes
+        airspeed = self.airspeed
+        groundspeed = self.groundspeed
+        heading = self.heading
+        msl_alt = self.msl_alt
+        packed_mgrs = self.packed_mgrs
+        if not isinstance(inavmodes, int) or isinstance(inavmodes, bool):
+            raise TypeError(f"Protocol Error: Field 'inavmodes' expects int, got {type(inavmodes).__name__}")
+        if not 0 <= inavmodes <= 4294967295:
+            raise ValueError(f"Protocol Error: Field 'inavmodes' value {inavmodes} out of range for uint32_t")
+        if not isinstance(airspeed, int) or isinstance(airspeed, bool):
+            raise TypeError(f"Protocol Error: Field 'airspeed' expects int, got {type(airspeed).__name__}")
+        if not 0 <= airspeed <= 65535:
+            raise ValueError(f"Protocol Error: Field 'airspeed' value {airspeed} out of range for uint16_t")
+        if not isinstance(groundspeed, int) or isinstance(groundspeed, bool):
+            raise TypeError(f"Protocol Error: Field 'groundspeed' expects int, got {type(groundspeed).__name__}")
+        if not 0 <= groundspeed <= 65535:
+            raise ValueError(f"Protocol Error: Field 'groundspeed' value {groundspeed} out of range for uint16_t")
+        if not isinstance(heading, int) or isinstance(heading, bool):
+            raise TypeError(f"Protocol Error: Field 'heading' expects int, got {type(heading).__name__}")
+        if not -32768 <= heading <= 32767:
+            raise ValueError(f"Protocol Error: Field 'heading' value {heading} out of range for int16_t")
+        if not isinstance(msl_alt, int) or isinstance(msl_alt, bool):
+            raise TypeError(f"Protocol Error: Field 'msl_alt' expects int, got {type(msl_alt).__name__}")
+        if not -32768 <= msl_alt <= 32767:
+            raise ValueError(f"Protocol Error: Field 'msl_alt' value {msl_alt} out of range for int16_t")
+        if not isinstance(packed_mgrs, bytes):
+            raise TypeError(f"Protocol Error: Field 'packed_mgrs' expects bytes, got {type(packed_mgrs).__name__}")
+        return [inavmodes, airspeed, groundspeed, heading, msl_alt, packed_mgrs]
+
+def pack_Status_System_INAV(payload_list):
+    inavmodes, airspeed, groundspeed, heading, msl_alt, packed_mgrs, = payload_list
+    if not isinstance(inavmodes, int) or isinstance(inavmodes, bool):
+        raise TypeError(f"Protocol Error: Field 'inavmodes' expects int, got {type(inavmodes).__name__}")
+    if not 0 <= inavmodes <= 4294967295:
+        raise ValueError(f"Protocol Error: Field 'inavmodes' value {inavmodes} out of range for uint32_t")
+    if not isinstance(airspeed, int) or isinstance(airspeed, bool):
+        raise TypeError(f"Protocol Error: Field 'airspeed' expects int, got {type(airspeed).__name__}")
+    if not 0 <= airspeed <= 65535:
+        raise ValueError(f"Protocol Error: Field 'airspeed' value {airspeed} out of range for uint16_t")
+    if not isinstance(groundspeed, int) or isinstance(groundspeed, bool):
+        raise TypeError(f"Protocol Error: Field 'groundspeed' expects int, got {type(groundspeed).__name__}")
+    if not 0 <= groundspeed <= 65535:
+        raise ValueError(f"Protocol Error: Field 'groundspeed' value {groundspeed} out of range for uint16_t")
+    if not isinstance(heading, int) or isinstance(heading, bool):
+        raise TypeError(f"Protocol Error: Field 'heading' expects int, got {type(heading).__name__}")
+    if not -32768 <= heading <= 32767:
+        raise ValueError(f"Protocol Error: Field 'heading' value {heading} out of range for int16_t")
+    if not isinstance(msl_alt, int) or isinstance(msl_alt, bool):
+        raise TypeError(f"Protocol Error: Field 'msl_alt' expects int, got {type(msl_alt).__name__}")
+    if not -32768 <= msl_alt <= 32767:
+        raise ValueError(f"Protocol Error: Field 'msl_alt' value {msl_alt} out of range for int16_t")
+    return Status_System_INAV_struct.pack(inavmodes, airspeed, groundspeed, heading, msl_alt) + msgpack.packb(packed_mgrs)
+
+def unpack_Status_System_INAV(data):
+    inavmodes, airspeed, groundspeed, heading, msl_alt, = Status_System_INAV_struct.unpack_from(data)
+    packed_mgrs = msgpack.unpackb(data[Status_System_INAV_struct.size:])
+    return [inavmodes, airspeed, groundspeed, heading, msl_alt, packed_mgrs]
+
+# Status.System.FLIGHT
+Status_System_FLIGHT_fields = frozenset(('FlightMode', 'airspeed', 'groundspeed', 'heading', 'msl_alt', 'packed_mgrs'))
+Status_System_FLIGHT_struct = struct.Struct('<BHHhh')
+
+def encode_Status_System_FLIGHT(kwargs):
+    if kwargs.keys() != Status_System_FLIGHT_fields:
+        raise field_mismatch(Status_System_FLIGHT_fields, kwargs)
+    FlightMode = kwargs['FlightMode']
+    airspeed = kwargs['airspeed']
+    groundspeed = kwargs['groundspeed']
+    heading = kwargs['heading']
+    msl_alt = kwargs['msl_alt']
+    packed_mgrs = kwargs['packed_mgrs']
+    if not isinstance(FlightMode, IntEnum):
+        raise TypeError(f"Protocol Error: Field 'FlightMode' expects IntEnum, got {type(FlightMode).__name__}")
+    if not 0 <= FlightMode <= 255:
+        raise ValueError(f"Protocol Error: Field 'FlightMode' value {FlightMode} out of range for enum")
+    if not isinstance(airspeed, int) or isinstance(airspeed, bool):
+        raise TypeError(f"Protocol Error: Field 'airspeed' expects int, got {type(airspeed).__name__}")
+    if not 0 <= airspeed <= 65535:
+        raise ValueError(f"Protocol Error: Field 'airspeed' value {airspeed} out of range for uint16_t")
+    if not isinstance(groundspeed, int) or isinstance(groundspeed, bool):
+        raise TypeError(f"Protocol Error: Field 'groundspeed' expects int, got {type(groundspeed).__name__}")
+    if not 0 <= groundspeed <= 65535:
+        raise ValueError(f"Protocol Error: Field 'groundspeed' value {groundspeed} out of range for uint16_t")
+    if not isinstance(heading, int) or isinstance(heading, bool):
+        raise TypeError(f"Protocol Error: Field 'heading' expects int, got {type(heading).__name__}")
+    if not -32768 <= heading <= 32767:
+        raise ValueError(f"Protocol Error: Field 'heading' value {heading} out of range for int16_t")
+    if not isinstance(msl_alt, int) or isinstance(msl_alt, bool):
+        raise TypeError(f"Protocol Error: Field 'msl_alt' expects int, got {type(msl_alt).__name__}")
+    if not -32768 <= msl_alt <= 32767:
+        raise ValueError(f"Protocol Error: Field 'msl_alt' value {msl_alt} out of range for int16_t")
+    if not isinstance(packed_mgrs, bytes):
+        raise TypeError(f"Protocol Error: Field 'packed_mgrs' expects bytes, got {type(packed_mgrs).__name__}")
+    return [FlightMode, airspeed, groundspeed, heading, msl_alt, packed_mgrs]
+
+def decode_Status_System_FLIGHT(payload_list):
+    if len(payload_list) != 6:
+        raise length_mismatch(payload_list, 6)
+    FlightMode, airspeed, groundspeed, heading, msl_alt, packed_mgrs, = payload_list
+    return {'FlightMode': FlightMode, 'airspeed': airspeed, 'groundspeed': groundspeed, 'heading': heading, 'msl_alt': msl_alt, 'packed_mgrs': packed_mgrs}
+
+class Status_System_FLIGHT(PayloadRecord):
+    __slots__ = ('FlightMode', 'airspeed', 'groundspeed', 'heading', 'msl_alt', 'packed_mgrs')
+    msg_name = 'Status.System.FLIGHT'
+
+    def __init__(self, FlightMode: IntEnum, airspeed: int, groundspeed: int, heading: int, msl_alt: int, packed_mgrs: bytes):
+        self.FlightMode = FlightMode
+        self.airspeed = airspeed
+        self.groundspeed = groundspeed
+        self.heading = heading
+        self.msl_alt = msl_alt
+        self.packed_mgrs = packed_mgrs
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 6:
+            raise length_mismatch(payload_list, 6)
+        self = object.__new__(cls)
+        self.FlightMode, self.airspeed, self.groundspeed, self.heading, self.msl_alt, self.packed_mgrs, = payload_list
+        return self
+
+    def to_list(self):
+        FlightMode = self.FlightMode
+        airspeed = self.airspeed
+        groundspeed = self.groundspeed
+        heading = self.heading
+        msl_alt = self.msl_alt
+        packed_mgrs = self.packed_mgrs
+        if not isinstance(FlightMode, IntEnum):
+            raise TypeError(f"Protocol Error: Field 'FlightMode' expects IntEnum, got {type(FlightMode).__name__}")
+        if not 0 <= FlightMode <= 255:
+            raise ValueError(f"Protocol Error: Field 'FlightMode' value {FlightMode} out of range for enum")
+        if not isinstance(airspeed, int) or isinstance(airspeed, bool):
+            raise TypeError(f"Protocol Error: Field 'airspeed' expects int, got {type(airspeed).__name__}")
+        if not 0 <= airspeed <= 65535:
+            raise ValueError(f"Protocol Error: Field 'airspeed' value {airspeed} out of range for uint16_t")
+        if not isinstance(groundspeed, int) or isinstance(groundspeed, bool):
+            raise TypeError(f"Protocol Error: Field 'groundspeed' expects int, got {type(groundspeed).__name__}")
+        if not 0 <= groundspeed <= 65535:
+            raise ValueError(f"Protocol Error: Field 'groundspeed' value {groundspeed} out of range for uint16_t")
+        if not isinstance(heading, int) or isinstance(heading, bool):
+            raise TypeError(f"Protocol Error: Field 'heading' expects int, got {type(heading).__name__}")
+        if not -32768 <= heading <= 32767:
+            raise ValueError(f"Protocol Error: Field 'heading' value {heading} out of range for int16_t")
+        if not isinstance(msl_alt, int) or isinstance(msl_alt, bool):
+            raise TypeError(f"Protocol Error: Field 'msl_alt' expects int, got {type(msl_alt).__name__}")
+        if not -32768 <= msl_alt <= 32767:
+            raise ValueError(f"Protocol Error: Field 'msl_alt' value {msl_alt} out of range for int16_t")
+        if not isinstance(packed_mgrs, bytes):
+            raise TypeError(f"Protocol Error: Field 'packed_mgrs' expects bytes, got {type(packed_mgrs).__name__}")
+        return [FlightMode, airspeed, groundspeed, heading, msl_alt, packed_mgrs]
+
+def pack_Status_System_FLIGHT(payload_list):
+    FlightMode, airspeed, groundspeed, heading, msl_alt, packed_mgrs, = payload_list
+    if not isinstance(FlightMode, IntEnum):
+        raise TypeError(f"Protocol Error: Field 'FlightMode' expects IntEnum, got {type(FlightMode).__name__}")
+    if not 0 <= FlightMode <= 255:
+        raise ValueError(f"Protocol Error: Field 'FlightMode' value {FlightMode} out of range for enum")
+    if not isinstance(airspeed, int) or isinstance(airspeed, bool):
+        raise TypeError(f"Protocol Error: Field 'airspeed' expects int, got {type(airspeed).__name__}")
+    if not 0 <= airspeed <= 65535:
+        raise ValueError(f"Protocol Error: Field 'airspeed' value {airspeed} out of range for uint16_t")
+    if not isinstance(groundspeed, int) or isinstance(groundspeed, bool):
+        raise TypeError(f"Protocol Error: Field 'groundspeed' expects int, got {type(groundspeed).__name__}")
+    if not 0 <= groundspeed <= 65535:
+        raise ValueError(f"Protocol Error: Field 'groundspeed' value {groundspeed} out of range for uint16_t")
+    if not isinstance(heading, int) or isinstance(heading, bool):
+        raise TypeError(f"Protocol Error: Field 'heading' expects int, got {type(heading).__name__}")
+    if not -32768 <= heading <= 32767:
+        raise ValueError(f"Protocol Error: Field 'heading' value {heading} out of range for int16_t")
+    if not isinstance(msl_alt, int) or isinstance(msl_alt, bool):
+        raise TypeError(f"Protocol Error: Field 'msl_alt' expects int, got {type(msl_alt).__name__}")
+    if not -32768 <= msl_alt <= 32767:
+        raise ValueError(f"Protocol Error: Field 'msl_alt' value {msl_alt} out of range for int16_t")
+    return Status_System_FLIGHT_struct.pack(FlightMode, airspeed, groundspeed, heading, msl_alt) + msgpack.packb(packed_mgrs)
+
+def unpack_Status_System_FLIGHT(data):
+    FlightMode, airspeed, groundspeed, heading, msl_alt, = Status_System_FLIGHT_struct.unpack_from(data)
+    packed_mgrs = msgpack.unpackb(data[Status_System_FLIGHT_struct.size:])
+    return [FlightMode, airspeed, groundspeed, heading, msl_alt, packed_mgrs]
+
+# Status.System.POSITION
+Status_System_POSITION_fields = frozenset(('packed_mgrs',))
+
+def encode_Status_System_POSITION(kwargs):
+    if kwargs.keys() != Status_System_POSITION_fields:
+        raise field_mismatch(Status_System_POSITION_fields, kwargs)
+    packed_mgrs = kwargs['packed_mgrs']
+    if not isinstance(packed_mgrs, bytes):
+        raise TypeError(f"Protocol Error: Field 'packed_mgrs' expects bytes, got {type(packed_mgrs).__name__}")
+    return [packed_mgrs]
+
+def decode_Status_System_POSITION(payload_list):
+    if len(payload_list) != 1:
+        raise length_mismatch(payload_list, 1)
+    packed_mgrs, = payload_list
+    return {'packed_mgrs': packed_mgrs}
+
+class Status_System_POSITION(PayloadRecord):
+    __slots__ = ('packed_mgrs',)
+    msg_name = 'Status.System.POSITION'
+
+    def __init__(self, packed_mgrs: bytes):
+        self.packed_mgrs = packed_mgrs
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 1:
+            raise length_mismatch(payload_list, 1)
+        self = object.__new__(cls)
+        self.packed_mgrs, = payload_list
+        return self
+
+    def to_list(self):
+        packed_mgrs = self.packed_mgrs
+        if not isinstance(packed_mgrs, bytes):
+            raise TypeError(f"Protocol Error: Field 'packed_mgrs' expects bytes, got {type(packed_mgrs).__name__}")
+        return [packed_mgrs]
+
+# Status.System.NAVIGATION
+Status_System_NAVIGATION_fields = frozenset(())
+
+def encode_Status_System_NAVIGATION(kwargs):
+    if kwargs.keys() != Status_System_NAVIGATION_fields:
+        raise field_mismatch(Status_System_NAVIGATION_fields, kwargs)
+    return []
+
+def decode_Status_System_NAVIGATION(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Status_System_NAVIGATION(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Status.System.NAVIGATION'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Status.System.FUEL
+Status_System_FUEL_fields = frozenset(())
+
+def encode_Status_System_FUEL(kwargs):
+    if kwargs.keys() != Status_System_FUEL_fields:
+        raise field_mismatch(Status_System_FUEL_fields, kwargs)
+    return []
+
+def decode_Status_System_FUEL(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Status_System_FUEL(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Status.System.FUEL'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Status.System.CONTROL
+Status_System_CONTROL_fields = frozenset(())
+
+def encode_Status_System_CONTROL(kwargs):
+    if kwargs.keys() != Status_System_CONTROL_fields:
+        raise field_mismatch(Status_System_CONTROL_fields, kwargs)
+    return []
+
+def decode_Status_System_CONTROL(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Status_System_CONTROL(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Status.System.CONTROL'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Status.System.SYSTEMS
+Status_System_SYSTEMS_fields = frozenset(())
+
+def encode_Status_System_SYSTEMS(kwargs):
+    if kwargs.keys() != Status_System_SYSTEMS_fields:
+        raise field_mismatch(Status_System_SYSTEMS_fields, kwargs)
+    return []
+
+def decode_Status_System_SYSTEMS(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Status_System_SYSTEMS(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Status.System.SYSTEMS'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Status.System.NAV
+Status_System_NAV_fields = frozenset(())
+
+def encode_Status_System_NAV(kwargs):
+    if kwargs.keys() != Status_System_NAV_fields:
+        raise field_mismatch(Status_System_NAV_fields, kwargs)
+    return []
+
+def decode_Status_System_NAV(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Status_System_NAV(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Status.System.NAV'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Status.System.RADIO
+Status_System_RADIO_fields = frozenset(())
+
+def encode_Status_System_RADIO(kwargs):
+    if kwargs.keys() != Status_System_RADIO_fields:
+        raise field_mismatch(Status_System_RADIO_fields, kwargs)
+    return []
+
+def decode_Status_System_RADIO(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Status_System_RADIO(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Status.System.RADIO'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Status.System.PAYLOAD
+Status_System_PAYLOAD_fields = frozenset(())
+
+def encode_Status_System_PAYLOAD(kwargs):
+    if kwargs.keys() != Status_System_PAYLOAD_fields:
+        raise field_mismatch(Status_System_PAYLOAD_fields, kwargs)
+    return []
+
+def decode_Status_System_PAYLOAD(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Status_System_PAYLOAD(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Status.System.PAYLOAD'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Command.System.ACTIVATE
+Command_System_ACTIVATE_fields = frozenset(())
+
+def encode_Command_System_ACTIVATE(kwargs):
+    if kwargs.keys() != Command_System_ACTIVATE_fields:
+        raise field_mismatch(Command_System_ACTIVATE_fields, kwargs)
+    return []
+
+def decode_Command_System_ACTIVATE(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Command_System_ACTIVATE(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Command.System.ACTIVATE'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Command.System.SHUTDOWN
+Command_System_SHUTDOWN_fields = frozenset(())
+
+def encode_Command_System_SHUTDOWN(kwargs):
+    if kwargs.keys() != Command_System_SHUTDOWN_fields:
+        raise field_mismatch(Command_System_SHUTDOWN_fields, kwargs)
+    return []
+
+def decode_Command_System_SHUTDOWN(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Command_System_SHUTDOWN(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Command.System.SHUTDOWN'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Command.System.SET_FLIGHT_MODE
+Command_System_SET_FLIGHT_MODE_fields = frozenset(())
+
+def encode_Command_System_SET_FLIGHT_MODE(kwargs):
+    if kwargs.keys() != Command_System_SET_FLIGHT_MODE_fields:
+        raise field_mismatch(Command_System_SET_FLIGHT_MODE_fields, kwargs)
+    return []
+
+def decode_Command_System_SET_FLIGHT_MODE(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Command_System_SET_FLIGHT_MODE(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Command.System.SET_FLIGHT_MODE'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Command.System.SWITCH_DATALINK
+Command_System_SWITCH_DATALINK_fields = frozenset(())
+
+def encode_Command_System_SWITCH_DATALINK(kwargs):
+    if kwargs.keys() != Command_System_SWITCH_DATALINK_fields:
+        raise field_mismatch(Command_System_SWITCH_DATALINK_fields, kwargs)
+    return []
+
+def decode_Command_System_SWITCH_DATALINK(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Command_System_SWITCH_DATALINK(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Command.System.SWITCH_DATALINK'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Command.System.DATALINK_CONFIG
+Command_System_DATALINK_CONFIG_fields = frozenset(())
+
+def encode_Command_System_DATALINK_CONFIG(kwargs):
+    if kwargs.keys() != Command_System_DATALINK_CONFIG_fields:
+        raise field_mismatch(Command_System_DATALINK_CONFIG_fields, kwargs)
+    return []
+
+def decode_Command_System_DATALINK_CONFIG(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Command_System_DATALINK_CONFIG(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Command.System.DATALINK_CONFIG'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Command.System.SET_FLIGHT_PARAMETERS
+Command_System_SET_FLIGHT_PARAMETERS_fields = frozenset(())
+
+def encode_Command_System_SET_FLIGHT_PARAMETERS(kwargs):
+    if kwargs.keys() != Command_System_SET_FLIGHT_PARAMETERS_fields:
+        raise field_mismatch(Command_System_SET_FLIGHT_PARAMETERS_fields, kwargs)
+    return []
+
+def decode_Command_System_SET_FLIGHT_PARAMETERS(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Command_System_SET_FLIGHT_PARAMETERS(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Command.System.SET_FLIGHT_PARAMETERS'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Command.Mission.SET_MISSION
+Command_Mission_SET_MISSION_fields = frozenset(('mission_index',))
+Command_Mission_SET_MISSION_struct = struct.Struct('<B')
+
+def encode_Command_Mission_SET_MISSION(kwargs):
+    if kwargs.keys() != Command_Mission_SET_MISSION_fields:
+        raise field_mismatch(Command_Mission_SET_MISSION_fields, kwargs)
+    mission_index = kwargs['mission_index']
+    if not isinstance(mission_index, int) or isinstance(mission_index, bool):
+        raise TypeError(f"Protocol Error: Field 'mission_index' expects int, got {type(mission_index).__name__}")
+    if not 0 <= mission_index <= 255:
+        raise ValueError(f"Protocol Error: Field 'mission_index' value {mission_index} out of range for uint8_t")
+    return [mission_index]
+
+def decode_Command_Mission_SET_MISSION(payload_list):
+    if len(payload_list) != 1:
+        raise length_mismatch(payload_list, 1)
+    mission_index, = payload_list
+    return {'mission_index': mission_index}
+
+class Command_Mission_SET_MISSION(PayloadRecord):
+    __slots__ = ('mission_index',)
+    msg_name = 'Command.Mission.SET_MISSION'
+
+    def __init__(self, mission_index: int):
+        self.mission_index = mission_index
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 1:
+            raise length_mismatch(payload_list, 1)
+        self = object.__new__(cls)
+        self.mission_index, = payload_list
+        return self
+
+    def to_list(self):
+        mission_index = self.mission_index
+        if not isinstance(mission_index, int) or isinstance(mission_index, bool):
+            raise TypeError(f"Protocol Error: Field 'mission_index' expects int, got {type(mission_index).__name__}")
+        if not 0 <= mission_index <= 255:
+            raise ValueError(f"Protocol Error: Field 'mission_index' value {mission_index} out of range for uint8_t")
+        return [mission_index]
+
+def pack_Command_Mission_SET_MISSION(payload_list):
+    mission_index, = payload_list
+    if not isinstance(mission_index, int) or isinstance(mission_index, bool):
+        raise TypeError(f"Protocol Error: Field 'mission_index' expects int, got {type(mission_index).__name__}")
+    if not 0 <= mission_index <= 255:
+        raise ValueError(f"Protocol Error: Field 'mission_index' value {mission_index} out of range for uint8_t")
+    return Command_Mission_SET_MISSION_struct.pack(mission_index)
+
+def unpack_Command_Mission_SET_MISSION(data):
+    mission_index, = Command_Mission_SET_MISSION_struct.unpack_from(data)
+    if len(data) != Command_Mission_SET_MISSION_struct.size:
+        raise ValueError(f"Protocol Error: Binary payload length {len(data)} does not match layout {Command_Mission_SET_MISSION_struct.size}")
+    return [mission_index]
+
+# Command.Mission.SET_MISSION_MODE
+Command_Mission_SET_MISSION_MODE_fields = frozenset(())
+
+def encode_Command_Mission_SET_MISSION_MODE(kwargs):
+    if kwargs.keys() != Command_Mission_SET_MISSION_MODE_fields:
+        raise field_mismatch(Command_Mission_SET_MISSION_MODE_fields, kwargs)
+    return []
+
+def decode_Command_Mission_SET_MISSION_MODE(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Command_Mission_SET_MISSION_MODE(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Command.Mission.SET_MISSION_MODE'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Command.Mission.TAKEOFF
+Command_Mission_TAKEOFF_fields = frozenset(())
+
+def encode_Command_Mission_TAKEOFF(kwargs):
+    if kwargs.keys() != Command_Mission_TAKEOFF_fields:
+        raise field_mismatch(Command_Mission_TAKEOFF_fields, kwargs)
+    return []
+
+def decode_Command_Mission_TAKEOFF(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Command_Mission_TAKEOFF(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Command.Mission.TAKEOFF'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Command.Mission.ABORT
+Command_Mission_ABORT_fields = frozenset(())
+
+def encode_Command_Mission_ABORT(kwargs):
+    if kwargs.keys() != Command_Mission_ABORT_fields:
+        raise field_mismatch(Command_Mission_ABORT_fields, kwargs)
+    return []
+
+def decode_Command_Mission_ABORT(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Command_Mission_ABORT(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Command.Mission.ABORT'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Command.Mission.HOLD
+Command_Mission_HOLD_fields = frozenset(())
+
+def encode_Command_Mission_HOLD(kwargs):
+    if kwargs.keys() != Command_Mission_HOLD_fields:
+        raise field_mismatch(Command_Mission_HOLD_fields, kwargs)
+    return []
+
+def decode_Command_Mission_HOLD(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Command_Mission_HOLD(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Command.Mission.HOLD'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Command.Mission.PROCEED
+Command_Mission_PROCEED_fields = frozenset(())
+
+def encode_Command_Mission_PROCEED(kwargs):
+    if kwargs.keys() != Command_Mission_PROCEED_fields:
+        raise field_mismatch(Command_Mission_PROCEED_fields, kwargs)
+    return []
+
+def decode_Command_Mission_PROCEED(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Command_Mission_PROCEED(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Command.Mission.PROCEED'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Command.Mission.REROUTE
+Command_Mission_REROUTE_fields = frozenset(())
+
+def encode_Command_Mission_REROUTE(kwargs):
+    if kwargs.keys() != Command_Mission_REROUTE_fields:
+        raise field_mismatch(Command_Mission_REROUTE_fields, kwargs)
+    return []
+
+def decode_Command_Mission_REROUTE(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Command_Mission_REROUTE(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Command.Mission.REROUTE'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Command.Mission.REASSIGN
+Command_Mission_REASSIGN_fields = frozenset(())
+
+def encode_Command_Mission_REASSIGN(kwargs):
+    if kwargs.keys() != Command_Mission_REASSIGN_fields:
+        raise field_mismatch(Command_Mission_REASSIGN_fields, kwargs)
+    return []
+
+def decode_Command_Mission_REASSIGN(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Command_Mission_REASSIGN(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Command.Mission.REASSIGN'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Command.Mission.SET_WAYPOINT
+Command_Mission_SET_WAYPOINT_fields = frozenset(())
+
+def encode_Command_Mission_SET_WAYPOINT(kwargs):
+    if kwargs.keys() != Command_Mission_SET_WAYPOINT_fields:
+        raise field_mismatch(Command_Mission_SET_WAYPOINT_fields, kwargs)
+    return []
+
+def decode_Command_Mission_SET_WAYPOINT(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Command_Mission_SET_WAYPOINT(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Command.Mission.SET_WAYPOINT'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Command.Mission.SET_ZONE
+Command_Mission_SET_ZONE_fields = frozenset(())
+
+def encode_Command_Mission_SET_ZONE(kwargs):
+    if kwargs.keys() != Command_Mission_SET_ZONE_fields:
+        raise field_mismatch(Command_Mission_SET_ZONE_fields, kwargs)
+    return []
+
+def decode_Command_Mission_SET_ZONE(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Command_Mission_SET_ZONE(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Command.Mission.SET_ZONE'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Command.Mission.NAVIGATE_TO
+Command_Mission_NAVIGATE_TO_fields = frozenset(('packed_mgrs',))
+
+def encode_Command_Mission_NAVIGATE_TO(kwargs):
+    if kwargs.keys() != Command_Mission_NAVIGATE_TO_fields:
+        raise field_mismatch(Command_Mission_NAVIGATE_TO_fields, kwargs)
+    packed_mgrs = kwargs['packed_mgrs']
+    if not isinstance(packed_mgrs, bytes):
+        raise TypeError(f"Protocol Error: Field 'packed_mgrs' expects bytes, got {type(packed_mgrs).__name__}")
+    return [packed_mgrs]
+
+def decode_Command_Mission_NAVIGATE_TO(payload_list):
+    if len(payload_list) != 1:
+        raise length_mismatch(payload_list, 1)
+    packed_mgrs, = payload_list
+    return {'packed_mgrs': packed_mgrs}
+
+class Command_Mission_NAVIGATE_TO(PayloadRecord):
+    __slots__ = ('packed_mgrs',)
+    msg_name = 'Command.Mission.NAVIGATE_TO'
+
+    def __init__(self, packed_mgrs: bytes):
+        self.packed_mgrs = packed_mgrs
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 1:
+            raise length_mismatch(payload_list, 1)
+        self = object.__new__(cls)
+        self.packed_mgrs, = payload_list
+        return self
+
+    def to_list(self):
+        packed_mgrs = self.packed_mgrs
+        if not isinstance(packed_mgrs, bytes):
+            raise TypeError(f"Protocol Error: Field 'packed_mgrs' expects bytes, got {type(packed_mgrs).__name__}")
+        return [packed_mgrs]
+
+# Command.Mission.LOITER
+Command_Mission_LOITER_fields = frozenset(())
+
+def encode_Command_Mission_LOITER(kwargs):
+    if kwargs.keys() != Command_Mission_LOITER_fields:
+        raise field_mismatch(Command_Mission_LOITER_fields, kwargs)
+    return []
+
+def decode_Command_Mission_LOITER(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Command_Mission_LOITER(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Command.Mission.LOITER'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Command.Mission.LAND
+Command_Mission_LAND_fields = frozenset(())
+
+def encode_Command_Mission_LAND(kwargs):
+    if kwargs.keys() != Command_Mission_LAND_fields:
+        raise field_mismatch(Command_Mission_LAND_fields, kwargs)
+    return []
+
+def decode_Command_Mission_LAND(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Command_Mission_LAND(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Command.Mission.LAND'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Command.Mission.ALLOW_DEPLOY
+Command_Mission_ALLOW_DEPLOY_fields = frozenset(())
+
+def encode_Command_Mission_ALLOW_DEPLOY(kwargs):
+    if kwargs.keys() != Command_Mission_ALLOW_DEPLOY_fields:
+        raise field_mismatch(Command_Mission_ALLOW_DEPLOY_fields, kwargs)
+    return []
+
+def decode_Command_Mission_ALLOW_DEPLOY(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Command_Mission_ALLOW_DEPLOY(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Command.Mission.ALLOW_DEPLOY'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Command.Mission.SWARM_CONTROL
+Command_Mission_SWARM_CONTROL_fields = frozenset(())
+
+def encode_Command_Mission_SWARM_CONTROL(kwargs):
+    if kwargs.keys() != Command_Mission_SWARM_CONTROL_fields:
+        raise field_mismatch(Command_Mission_SWARM_CONTROL_fields, kwargs)
+    return []
+
+def decode_Command_Mission_SWARM_CONTROL(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Command_Mission_SWARM_CONTROL(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Command.Mission.SWARM_CONTROL'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Event.Mission.PHASE
+Event_Mission_PHASE_fields = frozenset(('MissionPhase',))
+Event_Mission_PHASE_struct = struct.Struct('<B')
+
+def encode_Event_Mission_PHASE(kwargs):
+    if kwargs.keys() != Event_Mission_PHASE_fields:
+        raise field_mismatch(Event_Mission_PHASE_fields, kwargs)
+    MissionPhase = kwargs['MissionPhase']
+    if not isinstance(MissionPhase, IntEnum):
+        raise TypeError(f"Protocol Error: Field 'MissionPhase' expects IntEnum, got {type(MissionPhase).__name__}")
+    if not 0 <= MissionPhase <= 255:
+        raise ValueError(f"Protocol Error: Field 'MissionPhase' value {MissionPhase} out of range for enum")
+    return [MissionPhase]
+
+def decode_Event_Mission_PHASE(payload_list):
+    if len(payload_list) != 1:
+        raise length_mismatch(payload_list, 1)
+    MissionPhase, = payload_list
+    return {'MissionPhase': MissionPhase}
+
+class Event_Mission_PHASE(PayloadRecord):
+    __slots__ = ('MissionPhase',)
+    msg_name = 'Event.Mission.PHASE'
+
+    def __init__(self, MissionPhase: IntEnum):
+        self.MissionPhase = MissionPhase
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 1:
+            raise length_mismatch(payload_list, 1)
+        self = object.__new__(cls)
+        self.MissionPhase, = payload_list
+        return self
+
+    def to_list(self):
+        MissionPhase = self.MissionPhase
+        if not isinstance(MissionPhase, IntEnum):
+            raise TypeError(f"Protocol Error: Field 'MissionPhase' expects IntEnum, got {type(MissionPhase).__name__}")
+        if not 0 <= MissionPhase <= 255:
+            raise ValueError(f"Protocol Error: Field 'MissionPhase' value {MissionPhase} out of range for enum")
+        return [MissionPhase]
+
+def pack_Event_Mission_PHASE(payload_list):
+    MissionPhase, = payload_list
+    if not isinstance(MissionPhase, IntEnum):
+        raise TypeError(f"Protocol Error: Field 'MissionPhase' expects IntEnum, got {type(MissionPhase).__name__}")
+    if not 0 <= MissionPhase <= 255:
+        raise ValueError(f"Protocol Error: Field 'MissionPhase' value {MissionPhase} out of range for enum")
+    return Event_Mission_PHASE_struct.pack(MissionPhase)
+
+def unpack_Event_Mission_PHASE(data):
+    MissionPhase, = Event_Mission_PHASE_struct.unpack_from(data)
+    if len(data) != Event_Mission_PHASE_struct.size:
+        raise ValueError(f"Protocol Error: Binary payload length {len(data)} does not match layout {Event_Mission_PHASE_struct.size}")
+    return [MissionPhase]
+
+# Event.System.ONLINE
+Event_System_ONLINE_fields = frozenset(())
+
+def encode_Event_System_ONLINE(kwargs):
+    if kwargs.keys() != Event_System_ONLINE_fields:
+        raise field_mismatch(Event_System_ONLINE_fields, kwargs)
+    return []
+
+def decode_Event_System_ONLINE(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Event_System_ONLINE(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Event.System.ONLINE'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Event.System.GPS_FIX
+Event_System_GPS_FIX_fields = frozenset(())
+
+def encode_Event_System_GPS_FIX(kwargs):
+    if kwargs.keys() != Event_System_GPS_FIX_fields:
+        raise field_mismatch(Event_System_GPS_FIX_fields, kwargs)
+    return []
+
+def decode_Event_System_GPS_FIX(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Event_System_GPS_FIX(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Event.System.GPS_FIX'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Event.System.ERROR
+Event_System_ERROR_fields = frozenset(())
+
+def encode_Event_System_ERROR(kwargs):
+    if kwargs.keys() != Event_System_ERROR_fields:
+        raise field_mismatch(Event_System_ERROR_fields, kwargs)
+    return []
+
+def decode_Event_System_ERROR(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Event_System_ERROR(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Event.System.ERROR'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Event.System.RADIO
+Event_System_RADIO_fields = frozenset(())
+
+def encode_Event_System_RADIO(kwargs):
+    if kwargs.keys() != Event_System_RADIO_fields:
+        raise field_mismatch(Event_System_RADIO_fields, kwargs)
+    return []
+
+def decode_Event_System_RADIO(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Event_System_RADIO(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Event.System.RADIO'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Event.System.RF_EVENT
+Event_System_RF_EVENT_fields = frozenset(())
+
+def encode_Event_System_RF_EVENT(kwargs):
+    if kwargs.keys() != Event_System_RF_EVENT_fields:
+        raise field_mismatch(Event_System_RF_EVENT_fields, kwargs)
+    return []
+
+def decode_Event_System_RF_EVENT(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Event_System_RF_EVENT(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Event.System.RF_EVENT'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Event.System.FAILSAFE
+Event_System_FAILSAFE_fields = frozenset(())
+
+def encode_Event_System_FAILSAFE(kwargs):
+    if kwargs.keys() != Event_System_FAILSAFE_fields:
+        raise field_mismatch(Event_System_FAILSAFE_fields, kwargs)
+    return []
+
+def decode_Event_System_FAILSAFE(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Event_System_FAILSAFE(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Event.System.FAILSAFE'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Event.System.HW_FAILURE
+Event_System_HW_FAILURE_fields = frozenset(())
+
+def encode_Event_System_HW_FAILURE(kwargs):
+    if kwargs.keys() != Event_System_HW_FAILURE_fields:
+        raise field_mismatch(Event_System_HW_FAILURE_fields, kwargs)
+    return []
+
+def decode_Event_System_HW_FAILURE(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Event_System_HW_FAILURE(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Event.System.HW_FAILURE'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Data.Mission.QUERY_MISSION_ID
+Data_Mission_QUERY_MISSION_ID_fields = frozenset(())
+
+def encode_Data_Mission_QUERY_MISSION_ID(kwargs):
+    if kwargs.keys() != Data_Mission_QUERY_MISSION_ID_fields:
+        raise field_mismatch(Data_Mission_QUERY_MISSION_ID_fields, kwargs)
+    return []
+
+def decode_Data_Mission_QUERY_MISSION_ID(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Data_Mission_QUERY_MISSION_ID(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Data.Mission.QUERY_MISSION_ID'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Data.Mission.QUERY_MISSION_PROGRESS
+Data_Mission_QUERY_MISSION_PROGRESS_fields = frozenset(())
+
+def encode_Data_Mission_QUERY_MISSION_PROGRESS(kwargs):
+    if kwargs.keys() != Data_Mission_QUERY_MISSION_PROGRESS_fields:
+        raise field_mismatch(Data_Mission_QUERY_MISSION_PROGRESS_fields, kwargs)
+    return []
+
+def decode_Data_Mission_QUERY_MISSION_PROGRESS(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Data_Mission_QUERY_MISSION_PROGRESS(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Data.Mission.QUERY_MISSION_PROGRESS'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Data.Mission.QUERY_CONTACTS
+Data_Mission_QUERY_CONTACTS_fields = frozenset(())
+
+def encode_Data_Mission_QUERY_CONTACTS(kwargs):
+    if kwargs.keys() != Data_Mission_QUERY_CONTACTS_fields:
+        raise field_mismatch(Data_Mission_QUERY_CONTACTS_fields, kwargs)
+    return []
+
+def decode_Data_Mission_QUERY_CONTACTS(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Data_Mission_QUERY_CONTACTS(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Data.Mission.QUERY_CONTACTS'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Data.Mission.QUERY_SWARM_INFO
+Data_Mission_QUERY_SWARM_INFO_fields = frozenset(())
+
+def encode_Data_Mission_QUERY_SWARM_INFO(kwargs):
+    if kwargs.keys() != Data_Mission_QUERY_SWARM_INFO_fields:
+        raise field_mismatch(Data_Mission_QUERY_SWARM_INFO_fields, kwargs)
+    return []
+
+def decode_Data_Mission_QUERY_SWARM_INFO(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Data_Mission_QUERY_SWARM_INFO(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Data.Mission.QUERY_SWARM_INFO'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Data.System.QUERY_SENSOR_DATA
+Data_System_QUERY_SENSOR_DATA_fields = frozenset(())
+
+def encode_Data_System_QUERY_SENSOR_DATA(kwargs):
+    if kwargs.keys() != Data_System_QUERY_SENSOR_DATA_fields:
+        raise field_mismatch(Data_System_QUERY_SENSOR_DATA_fields, kwargs)
+    return []
+
+def decode_Data_System_QUERY_SENSOR_DATA(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Data_System_QUERY_SENSOR_DATA(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Data.System.QUERY_SENSOR_DATA'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Data.System.QUERY_LOG_DATA
+Data_System_QUERY_LOG_DATA_fields = frozenset(())
+
+def encode_Data_System_QUERY_LOG_DATA(kwargs):
+    if kwargs.keys() != Data_System_QUERY_LOG_DATA_fields:
+        raise field_mismatch(Data_System_QUERY_LOG_DATA_fields, kwargs)
+    return []
+
+def decode_Data_System_QUERY_LOG_DATA(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Data_System_QUERY_LOG_DATA(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Data.System.QUERY_LOG_DATA'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Data.System.QUERY_DATALINK_STATUS
+Data_System_QUERY_DATALINK_STATUS_fields = frozenset(())
+
+def encode_Data_System_QUERY_DATALINK_STATUS(kwargs):
+    if kwargs.keys() != Data_System_QUERY_DATALINK_STATUS_fields:
+        raise field_mismatch(Data_System_QUERY_DATALINK_STATUS_fields, kwargs)
+    return []
+
+def decode_Data_System_QUERY_DATALINK_STATUS(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Data_System_QUERY_DATALINK_STATUS(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Data.System.QUERY_DATALINK_STATUS'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Data.System.QUERY_NETWORK_STATUS
+Data_System_QUERY_NETWORK_STATUS_fields = frozenset(())
+
+def encode_Data_System_QUERY_NETWORK_STATUS(kwargs):
+    if kwargs.keys() != Data_System_QUERY_NETWORK_STATUS_fields:
+        raise field_mismatch(Data_System_QUERY_NETWORK_STATUS_fields, kwargs)
+    return []
+
+def decode_Data_System_QUERY_NETWORK_STATUS(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Data_System_QUERY_NETWORK_STATUS(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Data.System.QUERY_NETWORK_STATUS'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Data.System.QUERY_SYSTEM_HEALTH
+Data_System_QUERY_SYSTEM_HEALTH_fields = frozenset(())
+
+def encode_Data_System_QUERY_SYSTEM_HEALTH(kwargs):
+    if kwargs.keys() != Data_System_QUERY_SYSTEM_HEALTH_fields:
+        raise field_mismatch(Data_System_QUERY_SYSTEM_HEALTH_fields, kwargs)
+    return []
+
+def decode_Data_System_QUERY_SYSTEM_HEALTH(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Data_System_QUERY_SYSTEM_HEALTH(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Data.System.QUERY_SYSTEM_HEALTH'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+# Data.System.QUERY_TELEMETRY
+Data_System_QUERY_TELEMETRY_fields = frozenset(())
+
+def encode_Data_System_QUERY_TELEMETRY(kwargs):
+    if kwargs.keys() != Data_System_QUERY_TELEMETRY_fields:
+        raise field_mismatch(Data_System_QUERY_TELEMETRY_fields, kwargs)
+    return []
+
+def decode_Data_System_QUERY_TELEMETRY(payload_list):
+    if len(payload_list) != 0:
+        raise length_mismatch(payload_list, 0)
+    return {}
+
+class Data_System_QUERY_TELEMETRY(PayloadRecord):
+    __slots__ = ()
+    msg_name = 'Data.System.QUERY_TELEMETRY'
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def from_list(cls, payload_list):
+        if len(payload_list) != 0:
+            raise length_mismatch(payload_list, 0)
+        self = object.__new__(cls)
+        return self
+
+    def to_list(self):
+        return []
+
+
+ENCODERS = {
+    'Heartbeat.System.HEARTBEAT': encode_Heartbeat_System_HEARTBEAT,
+    'Testing.System.TEXTMSG': encode_Testing_System_TEXTMSG,
+    'Testing.System.BINMSG': encode_Testing_System_BINMSG,
+    'Status.Mission.MISSION_PHASE': encode_Status_Mission_MISSION_PHASE,
+    'Status.System.INAV': encode_Status_System_INAV,
+    'Status.System.FLIGHT': encode_Status_System_FLIGHT,
+    'Status.System.POSITION': encode_Status_System_POSITION,
+    'Status.System.NAVIGATION': encode_Status_System_NAVIGATION,
+    'Status.System.FUEL': encode_Status_System_FUEL,
+    'Status.System.CONTROL': encode_Status_System_CONTROL,
+    'Status.System.SYSTEMS': encode_Status_System_SYSTEMS,
+    'Status.System.NAV': encode_Status_System_NAV,
+    'Status.System.RADIO': encode_Status_System_RADIO,
+    'Status.System.PAYLOAD': encode_Status_System_PAYLOAD,
+    'Command.System.ACTIVATE': encode_Command_System_ACTIVATE,
+    'Command.System.SHUTDOWN': encode_Command_System_SHUTDOWN,
+    'Command.System.SET_FLIGHT_MODE': encode_Command_System_SET_FLIGHT_MODE,
+    'Command.System.SWITCH_DATALINK': encode_Command_System_SWITCH_DATALINK,
+    'Command.System.DATALINK_CONFIG': encode_Command_System_DATALINK_CONFIG,
+    'Command.System.SET_FLIGHT_PARAMETERS': encode_Command_System_SET_FLIGHT_PARAMETERS,
+    'Command.Mission.SET_MISSION': encode_Command_Mission_SET_MISSION,
+    'Command.Mission.SET_MISSION_MODE': encode_Command_Mission_SET_MISSION_MODE,
+    'Command.Mission.TAKEOFF': encode_Command_Mission_TAKEOFF,
+    'Command.Mission.ABORT': encode_Command_Mission_ABORT,
+    'Command.Mission.HOLD': encode_Command_Mission_HOLD,
+    'Command.Mission.PROCEED': encode_Command_Mission_PROCEED,
+    'Command.Mission.REROUTE': encode_Command_Mission_REROUTE,
+    'Command.Mission.REASSIGN': encode_Command_Mission_REASSIGN,
+    'Command.Mission.SET_WAYPOINT': encode_Command_Mission_SET_WAYPOINT,
+    'Command.Mission.SET_ZONE': encode_Command_Mission_SET_ZONE,
+    'Command.Mission.NAVIGATE_TO': encode_Command_Mission_NAVIGATE_TO,
+    'Command.Mission.LOITER': encode_Command_Mission_LOITER,
+    'Command.Mission.LAND': encode_Command_Mission_LAND,
+    'Command.Mission.ALLOW_DEPLOY': encode_Command_Mission_ALLOW_DEPLOY,
+    'Command.Mission.SWARM_CONTROL': encode_Command_Mission_SWARM_CONTROL,
+    'Event.Mission.PHASE': encode_Event_Mission_PHASE,
+    'Event.System.ONLINE': encode_Event_System_ONLINE,
+    'Event.System.GPS_FIX': encode_Event_System_GPS_FIX,
+    'Event.System.ERROR': encode_Event_System_ERROR,
+    'Event.System.RADIO': encode_Event_System_RADIO,
+    'Event.System.RF_EVENT': encode_Event_System_RF_EVENT,
+    'Event.System.FAILSAFE': encode_Event_System_FAILSAFE,
+    'Event.System.HW_FAILURE': encode_Event_System_HW_FAILURE,
+    'Data.Mission.QUERY_MISSION_ID': encode_Data_Mission_QUERY_MISSION_ID,
+    'Data.Mission.QUERY_MISSION_PROGRESS': encode_Data_Mission_QUERY_MISSION_PROGRESS,
+    'Data.Mission.QUERY_CONTACTS': encode_Data_Mission_QUERY_CONTACTS,
+    'Data.Mission.QUERY_SWARM_INFO': encode_Data_Mission_QUERY_SWARM_INFO,
+    'Data.System.QUERY_SENSOR_DATA': encode_Data_System_QUERY_SENSOR_DATA,
+    'Data.System.QUERY_LOG_DATA': encode_Data_System_QUERY_LOG_DATA,
+    'Data.System.QUERY_DATALINK_STATUS': encode_Data_System_QUERY_DATALINK_STATUS,
+    'Data.System.QUERY_NETWORK_STATUS': encode_Data_System_QUERY_NETWORK_STATUS,
+    'Data.System.QUERY_SYSTEM_HEALTH': encode_Data_System_QUERY_SYSTEM_HEALTH,
+    'Data.System.QUERY_TELEMETRY': encode_Data_System_QUERY_TELEMETRY,
+}
+
+DECODERS = {
+    'Heartbeat.System.HEARTBEAT': decode_Heartbeat_System_HEARTBEAT,
+    'Testing.System.TEXTMSG': decode_Testing_System_TEXTMSG,
+    'Testing.System.BINMSG': decode_Testing_System_BINMSG,
+    'Status.Mission.MISSION_PHASE': decode_Status_Mission_MISSION_PHASE,
+    'Status.System.INAV': decode_Status_System_INAV,
+    'Status.System.FLIGHT': decode_Status_System_FLIGHT,
+    'Status.System.POSITION': decode_Status_System_POSITION,
+    'Status.System.NAVIGATION': decode_Status_System_NAVIGATION,
+    'Status.System.FUEL': decode_Status_System_FUEL,
+    'Status.System.CONTROL': decode_Status_System_CONTROL,
+    'Status.System.SYSTEMS': decode_Status_System_SYSTEMS,
+    'Status.System.NAV': decode_Status_System_NAV,
+    'Status.System.RADIO': decode_Status_System_RADIO,
+    'Status.System.PAYLOAD': decode_Status_System_PAYLOAD,
+    'Command.System.ACTIVATE': decode_Command_System_ACTIVATE,
+    'Command.System.SHUTDOWN': decode_Command_System_SHUTDOWN,
+    'Command.System.SET_FLIGHT_MODE': decode_Command_System_SET_FLIGHT_MODE,
+    'Command.System.SWITCH_DATALINK': decode_Command_System_SWITCH_DATALINK,
+    'Command.System.DATALINK_CONFIG': decode_Command_System_DATALINK_CONFIG,
+    'Command.System.SET_FLIGHT_PARAMETERS': decode_Command_System_SET_FLIGHT_PARAMETERS,
+    'Command.Mission.SET_MISSION': decode_Command_Mission_SET_MISSION,
+    'Command.Mission.SET_MISSION_MODE': decode_Command_Mission_SET_MISSION_MODE,
+    'Command.Mission.TAKEOFF': decode_Command_Mission_TAKEOFF,
+    'Command.Mission.ABORT': decode_Command_Mission_ABORT,
+    'Command.Mission.HOLD': decode_Command_Mission_HOLD,
+    'Command.Mission.PROCEED': decode_Command_Mission_PROCEED,
+    'Command.Mission.REROUTE': decode_Command_Mission_REROUTE,
+    'Command.Mission.REASSIGN': decode_Command_Mission_REASSIGN,
+    'Command.Mission.SET_WAYPOINT': decode_Command_Mission_SET_WAYPOINT,
+    'Command.Mission.SET_ZONE': decode_Command_Mission_SET_ZONE,
+    'Command.Mission.NAVIGATE_TO': decode_Command_Mission_NAVIGATE_TO,
+    'Command.Mission.LOITER': decode_Command_Mission_LOITER,
+    'Command.Mission.LAND': decode_Command_Mission_LAND,
+    'Command.Mission.ALLOW_DEPLOY': decode_Command_Mission_ALLOW_DEPLOY,
+    'Command.Mission.SWARM_CONTROL': decode_Command_Mission_SWARM_CONTROL,
+    'Event.Mission.PHASE': decode_Event_Mission_PHASE,
+    'Event.System.ONLINE': decode_Event_System_ONLINE,
+    'Event.System.GPS_FIX': decode_Event_System_GPS_FIX,
+    'Event.System.ERROR': decode_Event_System_ERROR,
+    'Event.System.RADIO': decode_Event_System_RADIO,
+    'Event.System.RF_EVENT': decode_Event_System_RF_EVENT,
+    'Event.System.FAILSAFE': decode_Event_System_FAILSAFE,
+    'Event.System.HW_FAILURE': decode_Event_System_HW_FAILURE,
+    'Data.Mission.QUERY_MISSION_ID': decode_Data_Mission_QUERY_MISSION_ID,
+    'Data.Mission.QUERY_MISSION_PROGRESS': decode_Data_Mission_QUERY_MISSION_PROGRESS,
+    'Data.Mission.QUERY_CONTACTS': decode_Data_Mission_QUERY_CONTACTS,
+    'Data.Mission.QUERY_SWARM_INFO': decode_Data_Mission_QUERY_SWARM_INFO,
+    'Data.System.QUERY_SENSOR_DATA': decode_Data_System_QUERY_SENSOR_DATA,
+    'Data.System.QUERY_LOG_DATA': decode_Data_System_QUERY_LOG_DATA,
+    'Data.System.QUERY_DATALINK_STATUS': decode_Data_System_QUERY_DATALINK_STATUS,
+    'Data.System.QUERY_NETWORK_STATUS': decode_Data_System_QUERY_NETWORK_STATUS,
+    'Data.System.QUERY_SYSTEM_HEALTH': decode_Data_System_QUERY_SYSTEM_HEALTH,
+    'Data.System.QUERY_TELEMETRY': decode_Data_System_QUERY_TELEMETRY,
+}
+
+# Only messages with at least one fixed-size field have a binary layout
+PACKERS = {
+    'Heartbeat.System.HEARTBEAT': pack_Heartbeat_System_HEARTBEAT,
+    'Status.Mission.MISSION_PHASE': pack_Status_Mission_MISSION_PHASE,
+    'Status.System.INAV': pack_Status_System_INAV,
+    'Status.System.FLIGHT': pack_Status_System_FLIGHT,
+    'Command.Mission.SET_MISSION': pack_Command_Mission_SET_MISSION,
+    'Event.Mission.PHASE': pack_Event_Mission_PHASE,
+}
+
+UNPACKERS = {
+    'Heartbeat.System.HEARTBEAT': unpack_Heartbeat_System_HEARTBEAT,
+    'Status.Mission.MISSION_PHASE': unpack_Status_Mission_MISSION_PHASE,
+    'Status.System.INAV': unpack_Status_System_INAV,
+    'Status.System.FLIGHT': unpack_Status_System_FLIGHT,
+    'Command.Mission.SET_MISSION': unpack_Command_Mission_SET_MISSION,
+    'Event.Mission.PHASE': unpack_Event_Mission_PHASE,
+}
+
+RECORDS = {
+    'Heartbeat.System.HEARTBEAT': Heartbeat_System_HEARTBEAT,
+    'Testing.System.TEXTMSG': Testing_System_TEXTMSG,
+    'Testing.System.BINMSG': Testing_System_BINMSG,
+    'Status.Mission.MISSION_PHASE': Status_Mission_MISSION_PHASE,
+    'Status.System.INAV': Status_System_INAV,
+    'Status.System.FLIGHT': Status_System_FLIGHT,
+    'Status.System.POSITION': Status_System_POSITION,
+    'Status.System.NAVIGATION': Status_System_NAVIGATION,
+    'Status.System.FUEL': Status_System_FUEL,
+    'Status.System.CONTROL': Status_System_CONTROL,
+    'Status.System.SYSTEMS': Status_System_SYSTEMS,
+    'Status.System.NAV': Status_System_NAV,
+    'Status.System.RADIO': Status_System_RADIO,
+    'Status.System.PAYLOAD': Status_System_PAYLOAD,
+    'Command.System.ACTIVATE': Command_System_ACTIVATE,
+    'Command.System.SHUTDOWN': Command_System_SHUTDOWN,
+    'Command.System.SET_FLIGHT_MODE': Command_System_SET_FLIGHT_MODE,
+    'Command.System.SWITCH_DATALINK': Command_System_SWITCH_DATALINK,
+    'Command.System.DATALINK_CONFIG': Command_System_DATALINK_CONFIG,
+    'Command.System.SET_FLIGHT_PARAMETERS': Command_System_SET_FLIGHT_PARAMETERS,
+    'Command.Mission.SET_MISSION': Command_Mission_SET_MISSION,
+    'Command.Mission.SET_MISSION_MODE': Command_Mission_SET_MISSION_MODE,
+    'Command.Mission.TAKEOFF': Command_Mission_TAKEOFF,
+    'Command.Mission.ABORT': Command_Mission_ABORT,
+    'Command.Mission.HOLD': Command_Mission_HOLD,
+    'Command.Mission.PROCEED': Command_Mission_PROCEED,
+    'Command.Mission.REROUTE': Command_Mission_REROUTE,
+    'Command.Mission.REASSIGN': Command_Mission_REASSIGN,
+    'Command.Mission.SET_WAYPOINT': Command_Mission_SET_WAYPOINT,
+    'Command.Mission.SET_ZONE': Command_Mission_SET_ZONE,
+    'Command.Mission.NAVIGATE_TO': Command_Mission_NAVIGATE_TO,
+    'Command.Mission.LOITER': Command_Mission_LOITER,
+    'Command.Mission.LAND': Command_Mission_LAND,
+    'Command.Mission.ALLOW_DEPLOY': Command_Mission_ALLOW_DEPLOY,
+    'Command.Mission.SWARM_CONTROL': Command_Mission_SWARM_CONTROL,
+    'Event.Mission.PHASE': Event_Mission_PHASE,
+    'Event.System.ONLINE': Event_System_ONLINE,
+    'Event.System.GPS_FIX': Event_System_GPS_FIX,
+    'Event.System.ERROR': Event_System_ERROR,
+    'Event.System.RADIO': Event_System_RADIO,
+    'Event.System.RF_EVENT': Event_System_RF_EVENT,
+    'Event.System.FAILSAFE': Event_System_FAILSAFE,
+    'Event.System.HW_FAILURE': Event_System_HW_FAILURE,
+    'Data.Mission.QUERY_MISSION_ID': Data_Mission_QUERY_MISSION_ID,
+    'Data.Mission.QUERY_MISSION_PROGRESS': Data_Mission_QUERY_MISSION_PROGRESS,
+    'Data.Mission.QUERY_CONTACTS': Data_Mission_QUERY_CONTACTS,
+    'Data.Mission.QUERY_SWARM_INFO': Data_Mission_QUERY_SWARM_INFO,
+    'Data.System.QUERY_SENSOR_DATA': Data_System_QUERY_SENSOR_DATA,
+    'Data.System.QUERY_LOG_DATA': Data_System_QUERY_LOG_DATA,
+    'Data.System.QUERY_DATALINK_STATUS': Data_System_QUERY_DATALINK_STATUS,
+    'Data.System.QUERY_NETWORK_STATUS': Data_System_QUERY_NETWORK_STATUS,
+    'Data.System.QUERY_SYSTEM_HEALTH': Data_System_QUERY_SYSTEM_HEALTH,
+    'Data.System.QUERY_TELEMETRY': Data_System_QUERY_TELEMETRY,
+}
@@ -114,12 +114,12 @@ Messages.Event.value_cat = 5
 Messages.Event.str = 'Event'
 Messages.Data.value_cat = 6
 Messages.Data.str = 'Data'
-Messages.Heartbeat.System.HEARTBEAT.payload_def = []
+Messages.Heartbeat.System.HEARTBEAT.payload_def = [{'name': 'schema_fingerprint', 'datatype': 'uint32_t', 'bitmask': False}]
 Messages.Testing.System.TEXTMSG.payload_def = [{'name': 'textdata', 'datatype': 'bytes', 'bitmask': False}]
 Messages.Testing.System.BINMSG.payload_def = [{'name': 'data', 'datatype': 'bytes', 'bitmask': False}]
 Messages.Status.Mission.MISSION_PHASE.payload_def = [{'name': 'MissionPhase', 'datatype': 'enum', 'bitmask': False}]
-Messages.Status.System.INAV.payload_def = [{'name': 'inavmodes', 'datatype': 'int', 'bitmask': False}, {'name': 'airspeed', 'datatype': 'int', 'bitmask': False}, {'name': 'groundspeed', 'datatype': 'int', 'bitmask': False}, {'name': 'heading', 'datatype': 'int', 'bitmask': False}, {'name': 'msl_alt', 'datatype': 'int', 'bitmask': False}, {'name': 'packed_mgrs', 'datatype': 'bytes', 'bitmask': False}]
-Messages.Status.System.FLIGHT.payload_def = [{'name': 'FlightMode', 'datatype': 'enum', 'bitmask': False}, {'name': 'airspeed', 'datatype': 'int', 'bitmask': False}, {'name': 'groundspeed', 'datatype': 'int', 'bitmask': False}, {'name': 'heading', 'datatype': 'int', 'bitmask': False}, {'name': 'msl_alt', 'datatype': 'int', 'bitmask': False}, {'name': 'packed_mgrs', 'datatype': 'bytes', 'bitmask': False}]
+Messages.Status.System.INAV.payload_def = [{'name': 'inavmodes', 'datatype': 'uint32_t', 'bitmask': True}, {'name': 'airspeed', 'datatype': 'uint16_t', 'bitmask': True}, {'name': 'groundspeed', 'datatype': 'uint16_t', 'bitmask': True}, {'name': 'heading', 'datatype': 'int16_t', 'bitmask': True}, {'name': 'msl_alt', 'datatype': 'int16_t', 'bitmask': True}, {'name': 'packed_mgrs', 'datatype': 'bytes', 'bitmask': True}]
+Messages.Status.System.FLIGHT.payload_def = [{'name': 'FlightMode', 'datatype': 'enum', 'bitmask': True}, {'name': 'airspeed', 'datatype': 'uint16_t', 'bitmask': True}, {'name': 'groundspeed', 'datatype': 'uint16_t', 'bitmask': True}, {'name': 'heading', 'datatype': 'int16_t', 'bitmask': True}, {'name': 'msl_alt', 'datatype': 'int16_t', 'bitmask': True}, {'name': 'packed_mgrs', 'datatype': 'bytes', 'bitmask': True}]
 Messages.Status.System.POSITION.payload_def = [{'name': 'packed_mgrs', 'datatype': 'bytes', 'bitmask': False}]
 Messages.Status.System.NAVIGATION.payload_def = []
 Messages.Status.System.FUEL.payload_def = []
@@ -134,7 +134,7 @@ Messages.Command.System.SET_FLIGHT_MODE.payload_def = []
 Messages.Command.System.SWITCH_DATALINK.payload_def = []
 Messages.Command.System.DATALINK_CONFIG.payload_def = []
 Messages.Command.System.SET_FLIGHT_PARAMETERS.payload_def = []
-Messages.Command.Mission.SET_MISSION.payload_def = [{'name': 'mission_index', 'datatype': 'int', 'bitmask': False}]
+Messages.Command.Mission.SET_MISSION.payload_def = [{'name': 'mission_index', 'datatype': 'uint8_t', 'bitmask': False}]
 Messages.Command.Mission.SET_MISSION_MODE.payload_def = []
 Messages.Command.Mission.TAKEOFF.payload_def = []
 Messages.Command.Mission.ABORT.payload_def = []
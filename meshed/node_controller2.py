@@ -83,26 +83,56 @@ async def main():
     #        datalinks.send(encoded_data, dest=command["dest"])
     #        print(f"Sent command to {command['dest']}: {command['msgid']}")
 
+    telemetry_decoder = DeltaDecoder()
+    peer_schemas = PeerSchemas()
+
     try:
         while True:
             # Receive messages from the datalinks
             msgs = datalinks.receive()
             if msgs:
+                senders = []
                 for msg in msgs:
+                    if "senderid" in msg:
+                        senders.append(get_node_from_meshid(msg["senderid"]))
+                    elif "from" in msg:
+                        senders.append(msg["from"])
+                    else:
+                        senders.append("unknown")
+
+                # Drop (or translate) frames from peers on another schema revision before decoding
+                accepted = []
+                for msg, sender in zip(msgs, senders):
+                    if peer_schemas.observe(sender, msg["data"]) not in (None, SCHEMA_FINGERPRINT):
+                        print(f"Schema mismatch with {sender}, compatible: {peer_schemas.compatible(sender)}")
+                    data = peer_schemas.filter(sender, msg["data"])
+                    if data is not None:
+                        accepted.append(({**msg, "data": data}, sender))
+                msgs = [msg for msg, _ in accepted]
+                senders = [sender for _, sender in accepted]
+
+                # Decode the whole receive buffer in one call
+                decoded, errors = decode_messages([msg["data"] for msg in msgs], delta_decoder=telemetry_decoder, peers=senders)
+                keyframe_peers = set()
+                for index, error in errors:
+                    print(f"Error decoding message: {error}")
+                    if isinstance(error, KeyframeRequired) and error.peer in nodemap:
+                        keyframe_peers.add(error.peer)
+                # Lost telemetry deltas, ask each sender once per batch for a full frame
+                for peer in keyframe_peers:
+                    request = encode_message(Messages.Data.System.QUERY_TELEMETRY, [])
+                    datalinks.send(request, dest=peer, udp=USE_UDP, meshtastic=USE_MESHTASTIC)
+
+                for msg, sender, result in zip(msgs, senders, decoded):
+                    if result is None:
+                        continue
                     try:
                         
                         print(f"\n[RECEIVED] Message at {time.time():.1f}")
-                        if "senderid" in msg:
-                            sender_meshid = msg["senderid"]
-                            sender = get_node_from_meshid(sender_meshid)
-                        elif "from" in msg:
-                            sender = msg["from"]
-                        else:
-                            sender = "unknown"
                         print(f"From: {sender}")
                         print(msg)
 
-                        msgid, data = decode_message(msg["data"])
+                        msgid, data = result
                         print("MSG ID:", msgid)
 
                         if "packed_mgrs" in data:
@@ -117,7 +147,7 @@ async def main():
                             activemodes = [modemap[i] for i in modes]
                             print('Modes:', [inavutil.modesID.get(i) for i in activemodes])
                     except Exception as e:
-                        print(f"Error decoding message: {e}")
+                        print(f"Error processing message: {e}")
 
             await asyncio.sleep(1)
     except KeyboardInterrupt:
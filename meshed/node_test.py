@@ -67,11 +67,11 @@ async def receive_loop(datalinks):
         messages = datalinks.receive()
         for msg in messages:
             try:
-                msg_enum, payload = decode_message(msg["data"])
+                msg_enum, payload = decode_message(msg["data"], lazy=True)
                 if msg_enum == Messages.Testing.System.TEXTMSG:
                     print(f"{msg['from']}: {payload['textdata'].decode('utf-8')}")
                 elif msg_enum.category == Messages.Command:
-                    print(f"Command payload: {payload}")
+                    print(f"Command payload: {payload.to_dict()}")
                 else:
                     print(f"[RECEIVED] Unhandled message type: {msg_enum}")
             except Exception as e:
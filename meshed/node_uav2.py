@@ -70,6 +70,8 @@ MULTICAST_PORT = 5550
 
 PRELOAD_MODES = [27, 10, 12, 38, 0, 1, 53, 11, 31, 47]
 SEND_INTERVAL = 5
+KEYFRAME_INTERVAL = 12  # full telemetry frame every minute at SEND_INTERVAL
+HEARTBEAT_INTERVAL = 6  # heartbeat with our schema fingerprint every 30 s
 #PRELOAD_MODES = [27, 10, 12, 38]
 
 
@@ -98,6 +100,9 @@ async def main():
     mydrone = UAVControl(device=TELEMETRY_PORT, baudrate=115200, platform="AIRPLANE")
     mydrone.msp_receiver = False
     mini_modes = PRELOAD_MODES.copy()
+    telemetry_encoder = DeltaEncoder(keyframe_interval=KEYFRAME_INTERVAL)
+    heartbeat = encode_message(Messages.Heartbeat.System.HEARTBEAT, Messages.Heartbeat.System.HEARTBEAT.payload(schema_fingerprint=SCHEMA_FINGERPRINT))
+    loop_count = 0
 
     try:
         await mydrone.connect()
@@ -111,6 +116,10 @@ async def main():
         print('Modes bitmap:', mini_modes)
 
         while True:
+            if loop_count % HEARTBEAT_INTERVAL == 0:
+                datalinks.send(heartbeat, dest="gcs1", udp=USE_UDP)
+            loop_count += 1
+
             # Collect telemetry
             analog = mydrone.get_analog()
             modes = mydrone.get_board_modes()
@@ -141,8 +150,8 @@ async def main():
                 packed_mgrs=pos
             )
 
-            # Send telemetry
-            encoded_message = encode_message(msg_enum, payload)
+            # Send telemetry, delta coded against the last frame sent to gcs1
+            encoded_message = telemetry_encoder.encode("gcs1", msg_enum, payload)
             datalinks.send(encoded_message, dest="gcs1", udp=USE_UDP)
             print(f"[SENT] Telemetry message, length: {len(encoded_message)} bytes")
 
@@ -150,10 +159,13 @@ async def main():
             messages = datalinks.receive()
             for msg in messages:
                 try:
-                    category, subcategory, message, payload = decode_message(msg["data"])
-                    print(f"[RECEIVED] Message from {msg['from']}: {category}.{subcategory}.{message}")
+                    rx_enum, payload = decode_message(msg["data"])
+                    print(f"[RECEIVED] Message from {msg['from']}: {message_str_from_id(messageid(rx_enum))}")
 
-                    if category == Messages.Command.value:
+                    if rx_enum == Messages.Data.System.QUERY_TELEMETRY:
+                        # Receiver lost our deltas, next telemetry frame is a keyframe
+                        telemetry_encoder.request_keyframe(msg["from"])
+                    elif messageid(rx_enum)[0] == Messages.Command.value_cat:
                         print(f"Command payload: {payload}")
                         # Handle commands here
 
@@ -1,76 +1,175 @@
 import struct
+import sys
 import time
 import json
+import zlib
+from collections import OrderedDict
+from itertools import islice
 from typing import List, Dict, Tuple, Optional, Any
 from enum import Enum, IntEnum, auto, IntFlag
 import msgpack
 from message_structure import Messages, MessageCategory
+from message_codecs import ENCODERS, DECODERS, PACKERS, UNPACKERS, RECORDS, PayloadRecord, SCHEMA_FINGERPRINT
+from fingerprint import schema_fingerprint
+from compression_dictionary import COMPRESSION_DICTIONARY
 from payload_enums import *
 import struct
 import crcmod
 
-type_mapping = {
-    "int": int,
-    "float": float,
-    "string": str,
-    "bool": bool,
-    "enum": IntEnum,
-    "bytes": bytes,
-}
-
-bin_type_map = {
-    "enum": "B",
-    "uint8_t": "B",
-    "uint16_t": "H",
-    "uint32_t": "I",
-    "uint64_t": "Q",
-    "int8_t": "b",
-    "int16_t": "h",
-    "int32_t": "i",
-    "int64_t": "q",
-    "float": "f",
-    "double": "d",
-    "char": "c",
-    "bool": "?"
-}
-
 PROTOCOL_VERSION = 1  # Major version; can extend later
 MAX_MESH_PACKET_SIZE = 220  # Total packet size (bytes)
 SYNC_BYTE = 0xFA
 crc16 = crcmod.predefined.mkCrcFun('crc-ccitt-false')
+
+class EnvelopeFlag(IntFlag):
+    # Message envelope forms:
+    #   [category, subcategory, msgtype, payload]          msgpack array, long id
+    #   [category, subcategory, msgtype, flags, payload]   msgpack array, long id, flags set
+    #   <message_id:2> [flags] payload                     compact: big-endian 16-bit id,
+    #                                                      then msgpack fixint flags if set,
+    #                                                      then the msgpack payload
+    # The compact id never starts with a msgpack fixarray byte (0x90-0x9f) since
+    # category 9 is not given a compact id, so decode tells them apart by the first byte.
+    BINARY          = 1 << 0  # payload is the message's struct layout (+ msgpack tail)
+    KEYFRAME        = 1 << 1  # payload is [seq, *fields], see DeltaEncoder
+    DELTA           = 1 << 2  # payload is [seq, field bitmask, *changed fields]
+    COMPRESSED      = 1 << 3  # payload is raw deflate (preset dictionary) of the encoded payload
     
 # --- UDP Packet Structure Definition ---
 #[SYNC_BYTE, payload length, checksum, source id, destination id, payload]
 
-def encode_udp_packet(source: str, destination: str, payload: bytes) -> bytes:
-    s = bytes(source,'utf-8')
-    d = bytes(destination,'utf-8')
-    checksum = crc16(s + d + payload)
+# Node names seen on the wire, raw bytes <-> interned str, so the rx path does
+# not decode UTF-8 per packet. Bounded in case of garbage names with valid CRCs.
+MAX_NODE_NAMES = 1024
+_node_names: Dict[bytes, str] = {}
+_node_name_bytes: Dict[str, bytes] = {}
+
+def node_name_from_bytes(raw) -> str:
+    """Returns the interned node name for raw name bytes."""
+    try:
+        return _node_names[raw]
+    except KeyError:
+        if len(_node_names) >= MAX_NODE_NAMES:
+            _node_names.clear()
+        name = _node_names[raw] = sys.intern(raw.decode('utf-8'))
+        return name
+
+def node_name_to_bytes(name: str) -> bytes:
+    try:
+        return _node_name_bytes[name]
+    except KeyError:
+        if len(_node_name_bytes) >= MAX_NODE_NAMES:
+            _node_name_bytes.clear()
+        raw = _node_name_bytes[name] = bytes(name, 'utf-8')
+        return raw
+
+# msgpack uint and bin headers of the envelope fields, used by the stream decoder
+_be_uint = {0xcc: struct.Struct(">B"), 0xcd: struct.Struct(">H"), 0xce: struct.Struct(">I"), 0xcf: struct.Struct(">Q")}
+_bin_len = {0xc4: struct.Struct(">B"), 0xc5: struct.Struct(">H"), 0xc6: struct.Struct(">I")}
+
+# Source and destination are either node names (UTF-8 bytes) or numeric node ids
+# (nodes.json meshid, msgpack uint). The CRC covers the name bytes or the id as
+# 4 big-endian bytes. Decode accepts both forms so nodes can migrate one by one.
+_node_id = struct.Struct(">I")
+
+class NodeIndex:
+    """Bidirectional node name <-> numeric id index built once from the nodemap."""
+    def __init__(self, nodemap: Dict[str, Dict]):
+        self.ids: Dict[str, int] = {}
+        self.names: Dict[int, str] = {}
+        self.id_bytes: Dict[int, bytes] = {}
+        for name, info in nodemap.items():
+            node_id = info.get("meshid")
+            if node_id is None:
+                continue
+            if not 0 <= node_id <= 0xFFFFFFFF:
+                raise ValueError(f"Node id {node_id} of {name} does not fit 32 bits")
+            if node_id in self.names:
+                raise ValueError(f"Duplicate node id {node_id} for {name} and {self.names[node_id]}")
+            name = sys.intern(name)
+            self.ids[name] = node_id
+            self.names[node_id] = name
+            self.id_bytes[node_id] = _node_id.pack(node_id)
+
+    def encode(self, node):
+        """Returns (wire value, CRC bytes) for a node name or id."""
+        if isinstance(node, int):
+            return node, self.id_bytes.get(node) or _node_id.pack(node)
+        node_id = self.ids.get(node)
+        if node_id is None:
+            raw = node_name_to_bytes(node)  # not in the nodemap, fall back to the name
+            return raw, raw
+        return node_id, self.id_bytes[node_id]
+
+    def decode(self, value):
+        """Returns (node name, or id if unknown, CRC bytes) for a wire value."""
+        if isinstance(value, int):
+            raw = self.id_bytes.get(value)
+            if raw is None:
+                return value, _wire_node_id_bytes(value)
+            return self.names[value], raw
+        return node_name_from_bytes(value), value
+
+def _encode_node(node, node_index):
+    if node_index is not None:
+        return node_index.encode(node)
+    if isinstance(node, int):
+        return node, _node_id.pack(node)
+    raw = node_name_to_bytes(node)
+    return raw, raw
+
+def _wire_node_id_bytes(value: int) -> bytes:
+    if not 0 <= value <= 0xFFFFFFFF:
+        raise ValueError(f"Protocol Error: Node id {value} does not fit 32 bits")
+    return _node_id.pack(value)
+
+def _decode_node(value, node_index):
+    if isinstance(value, bool) or not isinstance(value, (int, bytes)):
+        raise ValueError(f"Protocol Error: Invalid node {value!r}")
+    if node_index is not None:
+        return node_index.decode(value)
+    if isinstance(value, int):
+        return value, _wire_node_id_bytes(value)
+    return node_name_from_bytes(value), value
+
+def encode_udp_packet(source, destination, payload: bytes, node_index: Optional[NodeIndex] = None) -> bytes:
+    """
+    Source and destination are node names or ids. With a node_index, names
+    found in it are sent as their numeric id, so the header size doesn't
+    depend on name length.
+    """
+    s, s_crc = _encode_node(source, node_index)
+    d, d_crc = _encode_node(destination, node_index)
+    checksum = crc16(payload, crc16(d_crc, crc16(s_crc)))
     plen = len(payload)
     packet = msgpack.packb([SYNC_BYTE, plen, checksum, s, d, payload])
     return packet
 
-def decode_udp_packet(packet: bytes) -> dict:
-    data = msgpack.unpackb(packet, use_list=True)
-    if len(data) != 6:  # Minimum: StartByte, Length, Version, BinaryFlags, Routing, Checksum
+def decode_udp_packet(packet, node_index: Optional[NodeIndex] = None) -> list:
+    """
+    Decodes a UDP packet from bytes, bytearray or memoryview.
+    Returns [source, destination, payload]; numeric node ids are resolved to
+    names through node_index and left as ints if unknown.
+    """
+    data = msgpack.unpackb(packet, use_list=False)
+    if len(data) != 6:  # SYNC_BYTE, payload length, checksum, source, destination, payload
         raise ValueError("Protocol Error: Packet length mismatch.")
-        #return None
-    else:
-        syncbyte, length, checksum, source, destination, payload = data
+    syncbyte, length, checksum, source, destination, payload = data
 
     if syncbyte != SYNC_BYTE:
         raise ValueError("Protocol Error: Sync byte mismatch")
-        
-    plen = len(payload)
-    if plen!=length:
+
+    if len(payload) != length:
         raise ValueError("Protocol Error: Length mismatch")
 
-    # Verify checksum
-    calc_checksum = crc16(source + destination + payload)
+    # Verify checksum, incrementally over the three fields
+    source, s_crc = _decode_node(source, node_index)
+    destination, d_crc = _decode_node(destination, node_index)
+    calc_checksum = crc16(payload, crc16(d_crc, crc16(s_crc)))
     if calc_checksum != checksum:
         raise ValueError("Protocol Error: Checksum mismatch.")
 
-    return [source.decode('utf-8'), destination.decode('utf-8'), payload]
+    return [source, destination, payload]
 
 class MessageDefinitions:
     def __init__(self):
@@ -78,173 +177,924 @@ class MessageDefinitions:
         with open("message_definitions.json") as f:
             self.messages = json.load(f)
 
+# --- Message ID Registry ---
+# Built once at import from the generated Messages tree so encode/decode never
+# has to walk the enum classes: enum member <-> (category, subcategory, msgtype).
+MESSAGE_IDS: Dict[Enum, Tuple[int, int, int]] = {}
+MESSAGE_ENUMS: Dict[Tuple[int, int, int], Enum] = {}
+MESSAGE_NAMES: Dict[Tuple[int, int, int], str] = {}
+# Same ids packed into 16 bits (4-bit category, 6-bit subcategory, 6-bit msgtype)
+COMPACT_IDS: Dict[Enum, int] = {}
+COMPACT_ENUMS: Dict[int, Enum] = {}
+COMPACT_RESERVED_CATEGORY = 9  # its ids would start with a msgpack fixarray byte
+# Messages whose payload is compressed by default (if that makes it smaller)
+COMPRESSED_MESSAGES = {"Testing.System.TEXTMSG", "Testing.System.BINMSG"}
+_compact_header = struct.Struct(">H")
+# Plain int copies of the EnvelopeFlag bits: & with an IntFlag builds a new
+# flag object, which costs more than the rest of a small frame's decode
+_BINARY = int(EnvelopeFlag.BINARY)
+_KEYFRAME = int(EnvelopeFlag.KEYFRAME)
+_DELTA = int(EnvelopeFlag.DELTA)
+_COMPRESSED = int(EnvelopeFlag.COMPRESSED)
+_DELTA_FLAGS = _KEYFRAME | _DELTA
+_ENVELOPE_FLAGS = _BINARY | _KEYFRAME | _DELTA | _COMPRESSED
+
+def encode_message_id(category: int, msg_type: int, subtype: int) -> int:
+    """
+    Encode a 16-bit MessageID from:
+      - category: 4 bits (0-15)
+      - msg_type: 6 bits (0-63)
+      - subtype: 6 bits (0-63)
+    """
+    if not (0 <= category < 16):
+        raise ValueError("Category must be in range 0-15")
+    if not (0 <= msg_type < 64):
+        raise ValueError("Message type must be in range 0-63")
+    if not (0 <= subtype < 64):
+        raise ValueError("Subtype must be in range 0-63")
+    return (category << 12) | (msg_type << 6) | subtype
+
+def decode_message_id(message_id: int):
+    """
+    Decode a 16-bit MessageID into a tuple (category, msg_type, subtype).
+    """
+    category = (message_id >> 12) & 0xF
+    msg_type = (message_id >> 6) & 0x3F
+    subtype = message_id & 0x3F
+    return category, msg_type, subtype
+
+def register_message(msg_enum, category_value: int, subcategory_value: int):
+    """Adds a message enum member to the registry and returns its id tuple."""
+    msg_id = (category_value, subcategory_value, msg_enum.value)
+    if msg_id in MESSAGE_ENUMS and MESSAGE_ENUMS[msg_id] is not msg_enum:
+        raise ValueError(f"Protocol Error: Duplicate message id {msg_id} for {msg_enum}")
+    MESSAGE_IDS[msg_enum] = msg_id
+    MESSAGE_ENUMS[msg_id] = msg_enum
+    name = f"{msg_enum.__class__.__qualname__[len('Messages.'):]}.{msg_enum.name}"
+    MESSAGE_NAMES[msg_id] = name
+    try:
+        compact_id = encode_message_id(*msg_id)
+    except ValueError:
+        compact_id = None  # doesn't fit 4/6/6 bits, only the long form is available
+    if category_value == COMPACT_RESERVED_CATEGORY:
+        compact_id = None
+    if compact_id is not None:
+        COMPACT_IDS[msg_enum] = compact_id
+        COMPACT_ENUMS[compact_id] = msg_enum
+    if name not in ENCODERS or name not in DECODERS:
+        raise ValueError(f"Protocol Error: No generated codec for {name}, re-run gen_definitions.py")
+    msg_enum.payload_encoder = ENCODERS[name]
+    msg_enum.payload_decoder = DECODERS[name]
+    msg_enum.payload_packer = PACKERS.get(name)
+    msg_enum.payload_unpacker = UNPACKERS.get(name)
+    msg_enum.record_class = RECORDS[name]
+    msg_enum.record_class.msg_enum = msg_enum
+    # Fields with the bitmask column set are only sent when changed in delta frames
+    msg_enum.delta_fields = tuple(i for i, field in enumerate(msg_enum.payload_def) if field["bitmask"])
+    msg_enum.compress = name in COMPRESSED_MESSAGES
+    # Field name -> index and per-field conversion, for MessageView
+    msg_enum.field_index = {}
+    converters = []
+    for i, field in enumerate(msg_enum.payload_def):
+        if field["name"].startswith("PayloadEnum_"):
+            key = field["name"][len("PayloadEnum_"):]
+            converters.append(_enum_converter(getattr(PayloadEnum, field["datatype"] or field["name"])))
+        else:
+            key = field["name"]
+            converters.append(None)
+        msg_enum.field_index[key] = i
+    msg_enum.field_converters = tuple(converters)
+    # Field lookups resolved once here instead of through msg_enum on every read
+    msg_enum.view_class = type(f"{name.replace('.', '_')}View", (MessageView,), {
+        "__slots__": (),
+        "msg_enum": msg_enum,
+        "field_index": msg_enum.field_index,
+        "field_converters": msg_enum.field_converters,
+    })
+    return msg_id
+
+def _enum_converter(enum_class):
+    def convert(value):
+        try:
+            return enum_class(value)
+        except ValueError:
+            raise ValueError(f"Protocol Error: Invalid value {value} for enum {enum_class.__name__}") from None
+    return convert
+
+def build_message_registry():
+    """(Re)builds the registry from Messages and attaches the payload method."""
+    MESSAGE_IDS.clear()
+    MESSAGE_ENUMS.clear()
+    MESSAGE_NAMES.clear()
+    COMPACT_IDS.clear()
+    COMPACT_ENUMS.clear()
+    PayloadRecord.encoder = staticmethod(encode_message)
+    for category_enum in MessageCategory:
+        category_class = getattr(Messages, category_enum.name)
+        for subcategory_class in vars(category_class).values():
+            if isinstance(subcategory_class, type) and issubclass(subcategory_class, Enum):
+                setattr(subcategory_class, 'payload', create_payload)
+                for msg_enum in subcategory_class:
+                    register_message(msg_enum, category_enum.value, subcategory_class.value_subcat)
+
+def _message_lookup_error(category_value, subcategory_value, message_value):
+    """Builds the specific error for an id that is not in the registry (slow path only)."""
+    try:
+        category_name = MessageCategory(category_value).name
+    except ValueError:
+        return ValueError(f"Protocol Error: Invalid category value: {category_value}")
+    category_class = getattr(Messages, category_name)
+    for subcategory_name, subcategory_class in vars(category_class).items():
+        if getattr(subcategory_class, 'value_subcat', None) == subcategory_value:
+            return ValueError(f"Protocol Error: No message found with value {message_value} in {category_name}.{subcategory_name}")
+    return ValueError(f"Protocol Error: No subcategory found with value {subcategory_value} in category {category_name}")
+
 def messageid(msg):
     """Extracts category, subcategory, and message values from a message enum."""
-    enum_class = msg.__class__
-    qualname = enum_class.__qualname__
-    parts = qualname.split('.')
-    if len(parts) != 3 or parts[0] != 'Messages':
-        raise ValueError("Invalid message enum")
-    category_name = parts[1]
-    subcategory_name = parts[2]
-    category_enum = getattr(MessageCategory, category_name)
-    category_value = category_enum.value
-    category_class = getattr(Messages, category_name)
-    subcategory_class = getattr(category_class, subcategory_name)
-    subcategory_value = subcategory_class.value_subcat
-    message_value = msg.value
-    return (category_value, subcategory_value, message_value)
+    try:
+        return MESSAGE_IDS[msg]
+    except (KeyError, TypeError):
+        raise ValueError("Invalid message enum") from None
 
 def message_str_from_id(msg_id):
-    category_value, subcategory_value, message_value = msg_id
     try:
-        category_enum = MessageCategory(category_value)
-        category_name = category_enum.name
-    except ValueError as e:
-        raise ValueError(f"Protocol Error: Invalid category value: {category_value}")
-    
-    category_class = getattr(Messages, category_name)
-    subcategory_name = None
-    for attr in dir(category_class):
-        if not attr.startswith('_'):
-            subcategory_class = getattr(category_class, attr)
-            if hasattr(subcategory_class, 'value_subcat') and isinstance(subcategory_class.value_subcat, int):
-                if subcategory_class.value_subcat == subcategory_value:
-                    subcategory_name = attr
-                    break
-    if subcategory_name is None:
-        raise ValueError(f"Protocol Error: No subcategory found with value {subcategory_value} in category {category_name}")
-    
-    message_enum = getattr(category_class, subcategory_name)
-    message_name = None
-    for member in message_enum:
-        if member.value == message_value:
-            message_name = member.name
-            break
-    if message_name is None:
-        raise ValueError(f"Protocol Error: No message found with value {message_value} in {category_name}.{subcategory_name}")
-    
-    return f"{category_name}.{subcategory_name}.{message_name}"
+        return MESSAGE_NAMES[tuple(msg_id)]
+    except KeyError:
+        raise _message_lookup_error(*msg_id) from None
 
 
 def get_message_enum(category_value, subcategory_value, message_value):
     try:
-        category_enum = MessageCategory(category_value)
-        category_name = category_enum.name
-    except ValueError as e:
-        raise ValueError(f"Protocol Error: Invalid category value: {category_value}")
+        return MESSAGE_ENUMS[(category_value, subcategory_value, message_value)]
+    except (KeyError, TypeError):
+        raise _message_lookup_error(category_value, subcategory_value, message_value) from None
 
-    category_class = getattr(Messages, category_name)
-    for attr in dir(category_class):
-        if not attr.startswith('_'):
-            subcategory_class = getattr(category_class, attr)
-            if hasattr(subcategory_class, 'value_subcat') and subcategory_class.value_subcat == subcategory_value:
-                break
-    else:
-        raise ValueError(f"Protocol Error: No subcategory found with value {subcategory_value} in category {category_name}")
 
+def get_compact_message_enum(message_id):
     try:
-        enum_member = subcategory_class(message_value)
-    except ValueError as e:
-        raise ValueError(f"Protocol Error: No message found with value {message_value} in {category_name}.{subcategory_class.__name__}")
-
-    return enum_member
+        return COMPACT_ENUMS[message_id]
+    except KeyError:
+        raise _message_lookup_error(*decode_message_id(message_id)) from None
 
 
 def create_payload(self, **kwargs):
-    if not hasattr(self, 'payload_def'):
+    """Validates kwargs against the message definition and returns the payload list."""
+    encoder = getattr(self, 'payload_encoder', None)
+    if encoder is None:
         raise ValueError(f"Protocol Error: No payload definition for {self}")
+    return encoder(kwargs)
+
+# --- Compression ---
+# Raw deflate with the preset dictionary from compression_dictionary.py, built
+# by gen_definitions.py from compression_samples.txt. Short repetitive strings
+# only compress well against a dictionary, not on their own.
+# A 4 KiB window and small memLevel keep setup cheap for short messages; the
+# decoder uses the full window so this can change without breaking receivers.
+MAX_DECOMPRESSED_SIZE = 256 * 1024
+_compressor = zlib.compressobj(9, zlib.DEFLATED, -12, 4, zlib.Z_DEFAULT_STRATEGY, COMPRESSION_DICTIONARY)
+
+def compress_payload(data) -> bytes:
+    compressor = _compressor.copy()  # dictionary already loaded
+    return compressor.compress(data) + compressor.flush()
+
+def decompress_payload(data) -> bytes:
+    decompressor = zlib.decompressobj(-15, COMPRESSION_DICTIONARY)
+    try:
+        result = decompressor.decompress(data, MAX_DECOMPRESSED_SIZE)
+    except zlib.error as e:
+        raise ValueError(f"Protocol Error: Invalid compressed payload: {e}") from None
+    if decompressor.unconsumed_tail:
+        raise ValueError(f"Protocol Error: Compressed payload exceeds {MAX_DECOMPRESSED_SIZE} bytes")
+    if not decompressor.eof:
+        raise ValueError("Protocol Error: Truncated compressed payload")
+    return result
+
+def _pack_envelope(msg_enum, payload, binary, compact, packb=msgpack.packb, compress=None):
+    """Encodes one message into any of the forms listed on EnvelopeFlag."""
+    flags = 0
+    if binary and msg_enum.payload_packer is not None:
+        flags |= _BINARY
+        payload = msg_enum.payload_packer(payload)
+    if compact:
+        try:
+            header = _compact_header.pack(COMPACT_IDS[msg_enum])
+        except KeyError:
+            raise ValueError(f"Protocol Error: No compact message id for {msg_enum}") from None
+    else:
+        header = None
+    envelope = _build_envelope(msg_enum, header, flags, payload, packb)
+    if compress is None:
+        compress = msg_enum.compress
+    if compress:
+        packed = compress_payload(payload if flags & _BINARY else packb(payload))
+        compressed = _build_envelope(msg_enum, header, flags | _COMPRESSED, packed, packb)
+        if len(compressed) < len(envelope):
+            return compressed
+    return envelope
 
-    field_defs = {}
-    for field in self.payload_def:
-        field_name = field["name"]
-        if field_name.startswith("PayloadEnum_"):
-            key_name = field_name[len("PayloadEnum_"):]
-            enum_name = field.get("datatype", field_name)
-            field_defs[key_name] = {"type": enum_name, "is_enum": True}
+def _build_envelope(msg_enum, header, flags, payload, packb):
+    if header is not None:
+        if flags:
+            return header + packb(flags) + packb(payload)
+        return header + packb(payload)
+    category, subcategory, msgtype = messageid(msg_enum)
+    if flags:
+        return packb([category, subcategory, msgtype, flags, payload])
+    return packb([category, subcategory, msgtype, payload])
+
+def encode_message(msg_enum, payload, binary=False, compact=False, compress=None):
+    """
+    Encodes a payload list (from Messages.*.payload()) into a message envelope.
+    With binary=True, messages that have a struct layout send their fixed-size
+    fields packed with struct instead of msgpack; others fall back to msgpack.
+    With compact=True the id is sent as a raw 16-bit header instead of three
+    msgpack ints in an array, 2 bytes less per message.
+    compress defaults to the message type's setting (COMPRESSED_MESSAGES); the
+    payload is only sent compressed when that is smaller.
+    """
+    return _pack_envelope(msg_enum, payload, binary, compact, compress=compress)
+
+def _unpack_envelope(data):
+    """Returns (enum_member, payload, flags) for an encoded message of any form."""
+    if not data:
+        raise ValueError("Protocol Error: Empty message envelope")
+    if 0x90 <= data[0] <= 0x9f:
+        envelope = msgpack.unpackb(data, use_list=True)
+        n = len(envelope)
+        if n == 4:
+            category, subcategory, msgtype, payload_list = envelope
+            return get_message_enum(category, subcategory, msgtype), payload_list, 0
+        if n == 5:
+            category, subcategory, msgtype, flags, payload_list = envelope
+            enum_member = get_message_enum(category, subcategory, msgtype)
         else:
-            key_name = field_name
-            field_defs[key_name] = {"type": field.get("datatype"), "is_enum": False}
-
-    required_keys = set(field_defs.keys())
-    provided_keys = set(kwargs.keys())
-    if required_keys != provided_keys:
-        missing = required_keys - provided_keys
-        extra = provided_keys - required_keys
-        if missing:
-            raise ValueError(f"Protocol Error: Missing required fields: {missing}")
-        if extra:
-            raise ValueError(f"Protocol Error: Extra fields provided: {extra}")
-
-    plist = []
-    for field in self.payload_def:
-        field_name = field["name"]
-        key = field_name[len("PayloadEnum_"):] if field_name.startswith("PayloadEnum_") else field_name
-        value = kwargs[key]
-        field_info = field_defs[key]
-
-        if field_info["is_enum"]:
+            raise ValueError(f"Protocol Error: Invalid message envelope length {n}")
+    else:
+        if len(data) < 3:
+            raise ValueError("Protocol Error: Invalid message envelope")
+        enum_member = get_compact_message_enum(_compact_header.unpack_from(data)[0])
+        if data[2] >= 0x80:  # no msgpack positive fixint flags
+            return enum_member, msgpack.unpackb(data[2:], use_list=True), 0
+        flags = data[2]
+        payload_list = msgpack.unpackb(data[3:], use_list=True)
+    if flags:
+        if type(flags) is not int or flags & ~_ENVELOPE_FLAGS:
+            raise ValueError(f"Protocol Error: Invalid envelope flags {flags!r} for {enum_member}")
+        if flags & _COMPRESSED:
+            if not isinstance(payload_list, bytes):
+                raise ValueError(f"Protocol Error: Invalid compressed payload for {enum_member}")
+            payload_list = decompress_payload(payload_list)
+            if not flags & _BINARY:
+                payload_list = msgpack.unpackb(payload_list, use_list=True)
+    elif type(flags) is not int:
+        raise ValueError(f"Protocol Error: Invalid envelope flags {flags!r} for {enum_member}")
+    return enum_member, payload_list, flags
+
+def decode_message(data, lazy=False, record=False):
+    """
+    Returns (enum_member, payload). payload is a dict, with lazy=True a
+    MessageView that converts fields only when they are read, or with
+    record=True an instance of the message's generated PayloadRecord class.
+    """
+    enum_member, payload_list, flags = _unpack_envelope(data)
+    if flags and flags & _DELTA_FLAGS:
+        raise ValueError(f"Protocol Error: Delta coded {enum_member} needs a DeltaDecoder")
+    return enum_member, _decode_payload(enum_member, payload_list, flags, lazy, record)
+
+def _decode_payload(enum_member, payload_list, flags, lazy=False, record=False):
+    if flags and flags & _BINARY:
+        if enum_member.payload_unpacker is None:
+            raise ValueError(f"Protocol Error: No binary layout for {enum_member}")
+        try:
+            payload_list = enum_member.payload_unpacker(payload_list)
+        except struct.error as e:
+            raise ValueError(f"Protocol Error: Invalid binary payload for {enum_member}: {e}") from None
+    if record:
+        return enum_member.record_class.from_list(payload_list)
+    if lazy:
+        return enum_member.view_class(payload_list)
+    return enum_member.payload_decoder(payload_list)
+
+class MessageView:
+    """
+    Lazily decoded payload: holds the unpacked payload list and converts a field
+    (enum fields) only the first time it is read. Reads like the dict from
+    decode_message(); to_dict() returns exactly that dict. The length is checked
+    up front, invalid enum values only raise when the field is read.
+    Each message has its own subclass (msg_enum.view_class) carrying its field
+    index and converters.
+    """
+    __slots__ = ("_values", "_converted")
+    msg_enum = None
+    field_index: Dict[str, int] = {}
+    field_converters: tuple = ()
+
+    def __init__(self, payload_list):
+        if len(payload_list) != len(self.field_index):
+            raise ValueError(f"Protocol Error: Payload list length {len(payload_list)} does not match definition {len(self.field_index)}")
+        self._values = payload_list
+        self._converted = 0  # bit per field already converted in _values
+
+    def _value(self, index):
+        converter = self.field_converters[index]
+        if converter is None or self._converted >> index & 1:
+            return self._values[index]
+        if not isinstance(self._values, list):
+            self._values = list(self._values)
+        value = self._values[index] = converter(self._values[index])
+        self._converted |= 1 << index
+        return value
+
+    def __getitem__(self, key):
+        index = self.field_index[key]
+        if self.field_converters[index] is None:
+            return self._values[index]
+        return self._value(index)
+
+    def get(self, key, default=None):
+        index = self.field_index.get(key)
+        return default if index is None else self._value(index)
+
+    def __contains__(self, key):
+        return key in self.field_index
+
+    def __iter__(self):
+        return iter(self.field_index)
+
+    def __len__(self):
+        return len(self._values)
+
+    def keys(self):
+        return self.field_index.keys()
+
+    def items(self):
+        return ((key, self._value(index)) for key, index in self.field_index.items())
+
+    def to_dict(self) -> dict:
+        return {key: self._value(index) for key, index in self.field_index.items()}
+
+    def __eq__(self, other):
+        if isinstance(other, MessageView):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    def __repr__(self):
+        return f"MessageView({self.msg_enum}, {self.to_dict()})"
+
+# --- Delta Coding ---
+# Periodic telemetry is sent as a keyframe every keyframe_interval frames and
+# as deltas in between: a field bitmask plus only the fields that changed.
+# Fields without the bitmask column set in the definitions are always sent.
+# Frames carry a 7-bit sequence number so the receiver can detect a gap, drop
+# its state and ask for a keyframe (Data.System.QUERY_TELEMETRY).
+DELTA_SEQ_MASK = 0x7F  # keeps seq a 1-byte msgpack fixint
+
+class KeyframeRequired(ValueError):
+    """Raised by DeltaDecoder when a delta can't be applied; request a keyframe from peer."""
+    def __init__(self, peer, msg_enum, reason):
+        super().__init__(f"Protocol Error: Keyframe required for {msg_enum} from {peer}: {reason}")
+        self.peer = peer
+        self.msg_enum = msg_enum
+
+class DeltaEncoder:
+    """Per-peer sender state for delta coded messages."""
+    def __init__(self, keyframe_interval: int = 10):
+        self.keyframe_interval = keyframe_interval
+        self._state: Dict[Tuple[Any, Enum], list] = {}  # (peer, msg_enum) -> [seq, fields, frames since keyframe]
+
+    def request_keyframe(self, peer, msg_enum=None):
+        """Makes the next frame to peer (for msg_enum, or for all messages) a keyframe."""
+        for key in list(self._state):
+            if key[0] == peer and (msg_enum is None or key[1] == msg_enum):
+                del self._state[key]
+
+    def encode(self, peer, msg_enum, payload, compact=False) -> bytes:
+        """Encodes a payload list from Messages.*.payload() for peer as a keyframe or delta."""
+        key = (peer, msg_enum)
+        state = self._state.get(key)
+        if state is None or state[2] >= self.keyframe_interval or not msg_enum.delta_fields:
+            seq = 0 if state is None else (state[0] + 1) & DELTA_SEQ_MASK
+            self._state[key] = [seq, list(payload), 0]
+            return self._pack(msg_enum, _KEYFRAME, [seq, *payload], compact)
+
+        seq = (state[0] + 1) & DELTA_SEQ_MASK
+        last = state[1]
+        mask = 0
+        changed = []
+        delta_fields = msg_enum.delta_fields
+        for i, value in enumerate(payload):
+            if i not in delta_fields or value != last[i]:
+                mask |= 1 << i
+                changed.append(value)
+        state[0] = seq
+        state[1] = list(payload)
+        state[2] += 1
+        return self._pack(msg_enum, _DELTA, [seq, mask, *changed], compact)
+
+    @staticmethod
+    def _pack(msg_enum, flags, payload, compact):
+        if compact:
             try:
-                enum_class = getattr(PayloadEnum, field_info["type"])
-                if not isinstance(value, enum_class):
-                    raise TypeError(f"Protocol Error: Field '{key}' expects an instance of {field_info['type']}, got {type(value).__name__}")
-            except AttributeError as e:
-                raise ValueError(f"Protocol Error: Enum class {field_info['type']} not found in PayloadEnum")
+                header = _compact_header.pack(COMPACT_IDS[msg_enum])
+            except KeyError:
+                raise ValueError(f"Protocol Error: No compact message id for {msg_enum}") from None
+            return header + msgpack.packb(flags) + msgpack.packb(payload)
+        return msgpack.packb([*messageid(msg_enum), flags, payload])
+
+class DeltaDecoder:
+    """Per-peer receiver state for delta coded messages; other messages decode as usual."""
+    def __init__(self):
+        self._state: Dict[Tuple[Any, Enum], list] = {}  # (peer, msg_enum) -> [seq, fields]
+
+    def reset(self, peer=None):
+        if peer is None:
+            self._state.clear()
         else:
-            expected_type = type_mapping.get(field_info["type"])
-            if expected_type is None:
-                raise ValueError(f"Protocol Error: Unknown datatype '{field_info['type']}' for field '{key}'")
-            if not isinstance(value, expected_type):
-                raise TypeError(f"Protocol Error: Field '{key}' expects {expected_type.__name__}, got {type(value).__name__}")
+            for key in [key for key in self._state if key[0] == peer]:
+                del self._state[key]
 
-        plist.append(value)
+    def decode(self, peer, data, lazy=False, record=False):
+        """decode_message() for a frame from peer. Raises KeyframeRequired on a gap."""
+        enum_member, payload_list, flags = _unpack_envelope(data)
+        if not flags & _DELTA_FLAGS:
+            return enum_member, _decode_payload(enum_member, payload_list, flags, lazy, record)
+        if flags & (_BINARY | _COMPRESSED) or flags & _DELTA_FLAGS == _DELTA_FLAGS:
+            raise ValueError(f"Protocol Error: Invalid delta coding flags {flags} for {enum_member}")
+        header = 1 if flags & _KEYFRAME else 2  # [seq, ...] or [seq, mask, ...]
+        if (not isinstance(payload_list, list) or len(payload_list) < header
+                or any(type(value) is not int for value in payload_list[:header])):
+            raise ValueError(f"Protocol Error: Malformed delta coded payload for {enum_member}")
+        key = (peer, enum_member)
+        if flags & _KEYFRAME:
+            seq, *fields = payload_list
+            payload = _decode_payload(enum_member, fields.copy() if lazy else fields, flags, lazy, record)  # validates before storing
+            self._state[key] = [seq, fields]
+            return enum_member, payload
 
-    return plist
+        state = self._state.get(key)
+        if state is None:
+            raise KeyframeRequired(peer, enum_member, "no keyframe received")
+        seq, mask = payload_list[0], payload_list[1]
+        if seq != (state[0] + 1) & DELTA_SEQ_MASK:
+            del self._state[key]
+            raise KeyframeRequired(peer, enum_member, f"sequence gap {state[0]} -> {seq}")
+        fields = state[1].copy()
+        changed = iter(payload_list[2:])
+        try:
+            for i in range(len(fields)):
+                if mask & (1 << i):
+                    fields[i] = next(changed)
+        except StopIteration:
+            del self._state[key]
+            raise KeyframeRequired(peer, enum_member, "truncated delta") from None
+        payload = _decode_payload(enum_member, fields.copy() if lazy else fields, flags, lazy, record)
+        state[0] = seq
+        state[1] = fields
+        return enum_member, payload
 
-def encode_message(msg_enum, payload):
-    category, subcategory, msgtype = messageid(msg_enum)
-    return msgpack.packb([category, subcategory, msgtype, payload])
-
-def decode_message(data):
-    category, subcategory, msgtype, payload_list = msgpack.unpackb(data, use_list=True)
-    enum_member = get_message_enum(category, subcategory, msgtype)
-    if not hasattr(enum_member, 'payload_def'):
-        raise ValueError(f"Protocol Error: No payload definition for {enum_member}")
-
-    payload_def = enum_member.payload_def
-
-    payload_def = enum_member.payload_def
-    if len(payload_def) != len(payload_list):
-        raise ValueError(f"Protocol Error: Payload list length {len(payload_list)} does not match definition {len(payload_def)}")
-
-    payload_dict = {}
-    for field, value in zip(payload_def, payload_list):
-        field_name = field["name"]
-        key = field_name[len("PayloadEnum_"):] if field_name.startswith("PayloadEnum_") else field_name
-        if field_name.startswith("PayloadEnum_"):
-            datatype = field.get("datatype")
-            if datatype:
-                try:
-                    enum_class = getattr(PayloadEnum, datatype)
-                    value = enum_class(value)
-                except ValueError as e:
-                    raise ValueError(f"Protocol Error: Invalid value {value} for enum {datatype}")
-                except AttributeError as e:
-                    raise ValueError(f"Protocol Error: Enum class {datatype} not found in PayloadEnum")
-
-        payload_dict[key] = value
-
-    return enum_member, payload_dict
-
-# Attach the payload method
-for category_name in dir(Messages):
-    if not category_name.startswith('_'):
-        category = getattr(Messages, category_name)
-        for subcategory_name in dir(category):
-            if not subcategory_name.startswith('_'):
-                subcategory = getattr(category, subcategory_name)
-                if isinstance(subcategory, type) and issubclass(subcategory, Enum):
-                    setattr(subcategory, 'payload', create_payload)
+# --- Batch API ---
+# One call per receive buffer / send queue; errors are reported per frame
+# instead of aborting the batch.
+
+def encode_messages(messages, binary=False, compact=False):
+    """
+    Encodes a list of (msg_enum, payload) pairs. payload is either a payload list
+    from Messages.*.payload() or a dict of fields, which is validated here.
+
+    Returns (frames, errors): frames[i] is the encoded message or None if it
+    failed, errors is a list of (index, exception).
+    """
+    packb = msgpack.Packer().pack
+    frames = []
+    errors = []
+    for index, (msg_enum, payload) in enumerate(messages):
+        try:
+            if isinstance(payload, dict):
+                payload = msg_enum.payload_encoder(payload)
+            frames.append(_pack_envelope(msg_enum, payload, binary, compact, packb))
+        except Exception as e:
+            frames.append(None)
+            errors.append((index, e))
+    return frames, errors
+
+def decode_messages(frames, group=False, delta_decoder=None, peers=None, lazy=False, record=False):
+    """
+    Decodes a list of encoded messages. Delta coded frames need a DeltaDecoder
+    and peers, the sender of each frame. With lazy=True payloads are MessageViews,
+    with record=True PayloadRecords (see decode_message).
+
+    Returns (results, errors). results[i] is (enum_member, payload_dict) or None
+    if frame i failed; with group=True results is instead a dict of
+    enum_member -> [(index, payload_dict), ...]. errors is a list of (index, exception).
+    """
+    unpackb = msgpack.unpackb
+    message_enums = MESSAGE_ENUMS
+    results = {} if group else []
+    errors = []
+    for index, data in enumerate(frames):
+        try:
+            enum_member = None
+            if delta_decoder is not None:
+                enum_member, payload = delta_decoder.decode(peers[index], data, lazy, record)
+            elif data and data[0] == 0x94:
+                # Plain long-id envelope fast path, everything else goes through decode_message
+                envelope = unpackb(data)
+                enum_member = message_enums.get(tuple(envelope[:3]))
+                if enum_member is not None:
+                    if record:
+                        payload = enum_member.record_class.from_list(envelope[3])
+                    elif lazy:
+                        payload = enum_member.view_class(envelope[3])
+                    else:
+                        payload = enum_member.payload_decoder(envelope[3])
+            if enum_member is None:
+                enum_member, payload = decode_message(data, lazy, record)
+        except Exception as e:
+            errors.append((index, e))
+            if not group:
+                results.append(None)
+            continue
+        if group:
+            if enum_member in results:
+                results[enum_member].append((index, payload))
+            else:
+                results[enum_member] = [(index, payload)]
+        else:
+            results.append((enum_member, payload))
+    return results, errors
+
+# --- Schema Compatibility ---
+# Message ids follow the CSV order, so nodes generated from different CSV
+# revisions disagree on them. Heartbeats carry SCHEMA_FINGERPRINT (HEARTBEAT
+# must stay the first message of the first category so its id never changes)
+# and PeerSchemas decides per peer, with one dict lookup per frame, whether its
+# frames are decoded as is, dropped, or have their id translated first.
+_heartbeat_prefixes = ()  # long and compact id prefixes, set after the registry is built
+
+def is_heartbeat(data) -> bool:
+    return data[:4] in _heartbeat_prefixes or data[:2] in _heartbeat_prefixes
+
+def heartbeat_fingerprint(data) -> Optional[int]:
+    """
+    Schema fingerprint in a heartbeat frame from any schema revision, None if
+    data is not a heartbeat or carries no fingerprint (older revisions).
+    """
+    if not is_heartbeat(data):
+        return None
+    try:
+        enum_member, payload, flags = _unpack_envelope(data)
+    except ValueError:
+        return None
+    if flags & _BINARY:
+        return struct.unpack_from("<I", payload)[0] if len(payload) >= 4 else None
+    if isinstance(payload, list) and payload and isinstance(payload[0], int):
+        return payload[0]
+    return None
+
+class PeerSchemas:
+    """
+    Per-peer schema compatibility cache, fed with every received frame through
+    observe(). filter() returns the frame to decode, a translated copy, or None
+    to drop it. Peers that have not sent a heartbeat yet pass unless strict.
+    """
+    def __init__(self, strict: bool = False):
+        self.strict = strict
+        self.fingerprints: Dict[Any, Optional[int]] = {}
+        self.states: Dict[Any, Any] = {}  # peer -> True (same schema), translation table, or None (drop)
+        self.translations: Dict[int, Dict[Tuple[int, int, int], Enum]] = {}  # fingerprint -> foreign id -> local enum
+
+    def add_translation(self, message_dict: dict) -> int:
+        """
+        Registers a translation from another revision's message_definitions.json
+        content: its message ids map to ours by name where the fields are identical.
+        Returns that revision's fingerprint.
+        """
+        fingerprint = schema_fingerprint(message_dict)
+        local = {name: MESSAGE_ENUMS[msg_id] for msg_id, name in MESSAGE_NAMES.items()}
+        table = {}
+        for category_value, (category, subcategories) in enumerate(message_dict.items(), start=1):
+            for subcategory_value, (subcategory, messages) in enumerate(subcategories.items(), start=1):
+                for msgtype, (message, fields) in enumerate(messages.items(), start=1):
+                    msg_enum = local.get(f"{category}.{subcategory}.{message}")
+                    if msg_enum is not None and msg_enum.payload_def == fields:
+                        table[(category_value, subcategory_value, msgtype)] = msg_enum
+        self.translations[fingerprint] = table
+        for peer, peer_fingerprint in self.fingerprints.items():
+            if peer_fingerprint == fingerprint:
+                self.states[peer] = table
+        return fingerprint
+
+    def observe(self, peer, data) -> Optional[int]:
+        """Updates peer's state if data is a heartbeat; returns the fingerprint it carried."""
+        if not is_heartbeat(data):
+            return None
+        fingerprint = heartbeat_fingerprint(data)
+        if self.fingerprints.get(peer, -1) != fingerprint or peer not in self.states:
+            self.fingerprints[peer] = fingerprint
+            if fingerprint == SCHEMA_FINGERPRINT:
+                self.states[peer] = True
+            else:
+                self.states[peer] = self.translations.get(fingerprint)
+        return fingerprint
+
+    def compatible(self, peer) -> Optional[bool]:
+        """True/False once a heartbeat was seen from peer (translated counts as compatible), else None."""
+        if peer not in self.states:
+            return None
+        return self.states[peer] is not None
+
+    def filter(self, peer, data):
+        state = self.states.get(peer, self)
+        if state is True:
+            return data
+        if state is self:
+            return None if self.strict else data
+        if state is None:
+            return None
+        return self._translate(data, state)
+
+    @staticmethod
+    def _translate(data, table):
+        if 0x90 <= data[0] <= 0x9f:
+            envelope = msgpack.unpackb(data)
+            msg_enum = table.get(tuple(envelope[:3]))
+            if msg_enum is None:
+                return None
+            envelope[:3] = messageid(msg_enum)
+            return msgpack.packb(envelope)
+        msg_enum = table.get(decode_message_id(_compact_header.unpack_from(data)[0]))
+        if msg_enum is None or msg_enum not in COMPACT_IDS:
+            return None
+        return _compact_header.pack(COMPACT_IDS[msg_enum]) + data[2:]
+
+# --- Frame Bundling ---
+# Several encoded messages for the same destination share one packet of up to
+# MAX_MESH_PACKET_SIZE: a msgpack array [-1, frame, frame, ...]. Its first two
+# bytes (fixarray, 0xff) never start a message envelope, so receivers tell the
+# two apart from the data itself. A single queued frame is sent as is.
+BUNDLE_MARKER = -1
+BUNDLE_MAX_FRAMES = 14  # keeps the bundle a fixarray
+_BUNDLE_OVERHEAD = 2  # fixarray byte + marker
+
+def _bundled_size(frame) -> int:
+    return len(frame) + (2 if len(frame) < 0x100 else 3)  # bin8/bin16 header
+
+def encode_bundle(frames: list) -> bytes:
+    if len(frames) == 1:
+        return frames[0]
+    if len(frames) > BUNDLE_MAX_FRAMES:
+        raise ValueError(f"Protocol Error: Bundle of {len(frames)} frames exceeds {BUNDLE_MAX_FRAMES}")
+    return msgpack.packb([BUNDLE_MARKER, *frames])
+
+def is_bundle(data) -> bool:
+    return len(data) > 1 and 0x90 <= data[0] <= 0x9f and data[1] == 0xff
+
+def unbundle(data) -> list:
+    """Returns the frames carried by a received packet, [data] if it is not a bundle."""
+    if not is_bundle(data):
+        return [data]
+    items = msgpack.unpackb(data)
+    frames = items[1:]
+    if not frames or not all(isinstance(frame, bytes) for frame in frames):
+        raise ValueError("Protocol Error: Malformed bundle")
+    return frames
+
+class FrameBundler:
+    """
+    Queues encoded frames per key (destination and link) and packs them into
+    bundles of at most max_size bytes. add() returns whatever is ready to be
+    sent because the queue filled up; the caller flushes on its own deadline.
+    """
+    def __init__(self, max_size: int = MAX_MESH_PACKET_SIZE, max_frames: int = BUNDLE_MAX_FRAMES):
+        self.max_size = max_size
+        self.max_frames = min(max_frames, BUNDLE_MAX_FRAMES)
+        self.pending: Dict[Any, list] = {}
+        self.sizes: Dict[Any, int] = {}
+
+    def add(self, key, frame) -> list:
+        ready = []
+        size = _bundled_size(frame)
+        if _BUNDLE_OVERHEAD + size > self.max_size:
+            # Too large to share a packet; flush first to keep the order
+            if key in self.pending:
+                ready.append(self.flush(key))
+            ready.append(frame)
+            return ready
+        frames = self.pending.get(key)
+        if frames is not None and (self.sizes[key] + size > self.max_size or len(frames) >= self.max_frames):
+            ready.append(self.flush(key))
+            frames = None
+        if frames is None:
+            self.pending[key] = [frame]
+            self.sizes[key] = _BUNDLE_OVERHEAD + size
+        else:
+            frames.append(frame)
+            self.sizes[key] += size
+        if self.sizes[key] == self.max_size or len(self.pending[key]) >= self.max_frames:
+            ready.append(self.flush(key))
+        return ready
+
+    def flush(self, key) -> Optional[bytes]:
+        frames = self.pending.pop(key, None)
+        self.sizes.pop(key, None)
+        return encode_bundle(frames) if frames else None
+
+# --- Fragmentation ---
+# Messages larger than MAX_MESH_PACKET_SIZE are split into fragments
+# [-2, transfer_id, index, count, chunk]. The receiver asks for missing ones
+# with [-3, transfer_id, [index, ...]] and the sender resends only those.
+# Like bundles, both start with a fixarray and a negative fixint.
+FRAGMENT_MARKER = -2
+NACK_MARKER = -3
+FRAGMENT_OVERHEAD = 14  # fixarray, marker, uint16 id, uint16 index and count, bin8 header
+FRAGMENT_CHUNK_SIZE = MAX_MESH_PACKET_SIZE - FRAGMENT_OVERHEAD
+MAX_FRAGMENTS = 0xFFFF
+MAX_NACK_INDICES = (MAX_MESH_PACKET_SIZE - 8) // 3
+
+def is_fragment(data) -> bool:
+    return len(data) > 1 and data[0] == 0x95 and data[1] == 0xfe
+
+def is_nack(data) -> bool:
+    return len(data) > 1 and data[0] == 0x93 and data[1] == 0xfd
+
+class Fragmenter:
+    """
+    Sender side: splits large frames and keeps the last transfers for
+    re-requests, which only their destination (any peer for dest=None, e.g.
+    multicast) may make.
+    """
+    def __init__(self, chunk_size: int = FRAGMENT_CHUNK_SIZE, history: int = 8):
+        self.chunk_size = chunk_size
+        self.history = history
+        self.next_id = 0
+        self.sent: "OrderedDict[Tuple[Any, int], list]" = OrderedDict()  # (dest, transfer_id) -> fragments
+
+    def fragment(self, data, dest=None) -> list:
+        """Returns the fragments for data, [data] if it fits one packet."""
+        if len(data) <= MAX_MESH_PACKET_SIZE:
+            return [data]
+        count = -(-len(data) // self.chunk_size)
+        if count > MAX_FRAGMENTS:
+            raise ValueError(f"Protocol Error: {len(data)} bytes need more than {MAX_FRAGMENTS} fragments")
+        transfer_id = self.next_id
+        self.next_id = (self.next_id + 1) & 0xFFFF
+        view = memoryview(data)
+        fragments = [
+            msgpack.packb([FRAGMENT_MARKER, transfer_id, index, count, view[offset:offset + self.chunk_size]])
+            for index, offset in enumerate(range(0, len(data), self.chunk_size))
+        ]
+        self.sent[(dest, transfer_id)] = fragments
+        self.sent.move_to_end((dest, transfer_id))
+        while len(self.sent) > self.history:
+            self.sent.popitem(last=False)
+        return fragments
+
+    def resend(self, peer, nack) -> list:
+        """
+        Fragments requested by a NACK frame from peer; empty if the transfer is
+        no longer kept or was not sent to peer.
+        """
+        try:
+            _, transfer_id, indices = msgpack.unpackb(nack)
+            fragments = self.sent.get((peer, transfer_id))
+            if fragments is None:
+                fragments = self.sent.get((None, transfer_id))
+        except Exception:
+            raise ValueError("Protocol Error: Malformed NACK") from None
+        if fragments is None or not isinstance(indices, list):
+            return []
+        return [fragments[index] for index in indices if type(index) is int and 0 <= index < len(fragments)]
+
+# Reassembly memory charged per transfer on top of its chunk bytes, so forged
+# fragments announcing a large count or carrying tiny chunks can't hold memory
+# for free
+TRANSFER_OVERHEAD = 256
+FRAGMENT_SLOT_SIZE = 8  # per announced fragment
+
+class _Transfer:
+    __slots__ = ("count", "chunks", "size", "updated", "nacks")
+
+    def __init__(self, count, now):
+        self.count = count
+        self.chunks = {}  # index -> chunk, filled as fragments arrive
+        self.size = TRANSFER_OVERHEAD + FRAGMENT_SLOT_SIZE * count
+        self.updated = now
+        self.nacks = 0
+
+def _parse_fragment(data):
+    try:
+        fragment = msgpack.unpackb(data)
+    except Exception:
+        raise ValueError("Protocol Error: Malformed fragment") from None
+    if not isinstance(fragment, list) or len(fragment) != 5:
+        raise ValueError("Protocol Error: Malformed fragment")
+    marker, transfer_id, index, count, chunk = fragment
+    for value in (transfer_id, index, count):
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ValueError("Protocol Error: Malformed fragment")
+    if (marker != FRAGMENT_MARKER or not 0 <= transfer_id <= 0xFFFF or not 0 <= index < count <= MAX_FRAGMENTS
+            or not isinstance(chunk, bytes) or not 0 < len(chunk) <= MAX_MESH_PACKET_SIZE):
+        raise ValueError("Protocol Error: Malformed fragment")
+    return transfer_id, index, count, chunk
+
+class Reassembler:
+    """
+    Receiver side: collects fragments per (peer, transfer_id). Each fragment is
+    O(1); transfers are kept in update order so expiry and eviction pop from
+    the front. At most max_bytes are buffered, counting chunk bytes plus
+    TRANSFER_OVERHEAD and FRAGMENT_SLOT_SIZE per announced fragment for every
+    transfer, and each peer has at most max_transfers in progress; the oldest
+    transfers are dropped first.
+    """
+    def __init__(self, max_bytes: int = 256 * 1024, timeout: float = 30.0, nack_after: float = 1.0, max_nacks: int = 3,
+                 max_transfers: int = 8):
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.nack_after = nack_after
+        self.max_nacks = max_nacks
+        self.max_transfers = max_transfers
+        self.transfers: "OrderedDict[Tuple[Any, int], _Transfer]" = OrderedDict()
+        self.peer_transfers: Dict[Any, "OrderedDict[int, None]"] = {}  # peer -> its transfer ids, in update order
+        self.buffered = 0
+
+    def add(self, peer, data, now: Optional[float] = None) -> Optional[bytes]:
+        """Stores a fragment from peer; returns the reassembled frame once complete."""
+        if now is None:
+            now = time.monotonic()
+        transfer_id, index, count, chunk = _parse_fragment(data)
+        self.expire(now)
+        key = (peer, transfer_id)
+        transfer = self.transfers.get(key)
+        if transfer is None:
+            peer_ids = self.peer_transfers.get(peer)
+            if peer_ids is None:
+                peer_ids = self.peer_transfers[peer] = OrderedDict()
+            elif len(peer_ids) >= self.max_transfers:
+                self._drop((peer, next(iter(peer_ids))))
+            transfer = self.transfers[key] = _Transfer(count, now)
+            peer_ids[transfer_id] = None
+            self.buffered += transfer.size
+        elif transfer.count != count:
+            raise ValueError("Protocol Error: Fragment count mismatch")
+        else:
+            self.transfers.move_to_end(key)
+            self.peer_transfers[peer].move_to_end(transfer_id)
+            transfer.updated = now
+        if index in transfer.chunks:
+            return None  # duplicate
+        transfer.chunks[index] = chunk
+        transfer.size += len(chunk)
+        self.buffered += len(chunk)
+        if len(transfer.chunks) == count:
+            self._drop(key)
+            chunks = transfer.chunks
+            return b"".join([chunks[i] for i in range(count)])
+        while self.buffered > self.max_bytes:
+            self._drop(next(iter(self.transfers)))
+        return None
+
+    def _drop(self, key):
+        self.buffered -= self.transfers.pop(key).size
+        peer, transfer_id = key
+        peer_ids = self.peer_transfers[peer]
+        del peer_ids[transfer_id]
+        if not peer_ids:
+            del self.peer_transfers[peer]
+
+    def expire(self, now: Optional[float] = None):
+        if now is None:
+            now = time.monotonic()
+        while self.transfers:
+            key, transfer = next(iter(self.transfers.items()))
+            if now - transfer.updated < self.timeout:
+                break
+            self._drop(key)
+
+    def nacks(self, now: Optional[float] = None) -> list:
+        """
+        Returns [(peer, nack_frame)] for transfers with no fragment for nack_after
+        seconds, at most max_nacks times each. Call periodically.
+        """
+        if now is None:
+            now = time.monotonic()
+        self.expire(now)
+        requests = []
+        for (peer, transfer_id), transfer in self.transfers.items():
+            if now - transfer.updated < self.nack_after * (transfer.nacks + 1) or transfer.nacks >= self.max_nacks:
+                continue
+            chunks = transfer.chunks
+            missing = list(islice((i for i in range(transfer.count) if i not in chunks), MAX_NACK_INDICES))
+            transfer.nacks += 1
+            requests.append((peer, msgpack.packb([NACK_MARKER, transfer_id, missing])))
+        return requests
+
+# Build the message id registry and attach the payload method
+build_message_registry()
+_heartbeat_prefixes = (
+    bytes([0x94, *messageid(Messages.Heartbeat.System.HEARTBEAT)]),
+    bytes([0x95, *messageid(Messages.Heartbeat.System.HEARTBEAT)]),
+    _compact_header.pack(COMPACT_IDS[Messages.Heartbeat.System.HEARTBEAT]),
+)
 
 # Usage Example
 if __name__ == "__main__":
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# Packets over byte-stream links (serial radios, UART to a companion computer):
+# the same envelope as UDP, encode_udp_packet(), written back to back. Every
+# packet starts with 0x96 0xcc 0xfa (fixarray of 6, uint8 SYNC_BYTE), which
+# StreamDecoder searches for with bytes.find() to (re)synchronise.
+import asyncio
+from typing import Optional
+from protocol import SYNC_BYTE, NodeIndex, decode_udp_packet, encode_udp_packet, _be_uint, _bin_len
+
+SYNC_PREFIX = bytes([0x96, 0xcc, SYNC_BYTE])
+# Anything announcing more is treated as corruption. A corrupt length below it
+# only delays the packets behind it until that many bytes arrived (then the CRC
+# fails and decoding resumes right after the bad prefix), so keep it modest.
+MAX_STREAM_PAYLOAD = 4096
+MAX_NODE_FIELD = 0xFF
+
+class _Incomplete(Exception):
+    pass
+
+def _skip_uint(buf, offset: int, limit: int) -> tuple:
+    if offset >= len(buf):
+        raise _Incomplete
+    tag = buf[offset]
+    if tag < 0x80:
+        return tag, offset + 1
+    fmt = _be_uint.get(tag)
+    if fmt is None:
+        raise ValueError(f"Protocol Error: Expected unsigned int at offset {offset}")
+    if offset + 1 + fmt.size > len(buf):
+        raise _Incomplete
+    value = fmt.unpack_from(buf, offset + 1)[0]
+    if value > limit:
+        raise ValueError(f"Protocol Error: Value {value} at offset {offset} out of range")
+    return value, offset + 1 + fmt.size
+
+def _skip_bin(buf, offset: int, limit: int) -> int:
+    if offset >= len(buf):
+        raise _Incomplete
+    fmt = _bin_len.get(buf[offset])
+    if fmt is None:
+        raise ValueError(f"Protocol Error: Expected bytes at offset {offset}")
+    if offset + 1 + fmt.size > len(buf):
+        raise _Incomplete
+    length = fmt.unpack_from(buf, offset + 1)[0]
+    if length > limit:
+        raise ValueError(f"Protocol Error: Field of {length} bytes at offset {offset} too long")
+    return offset + 1 + fmt.size + length
+
+def _skip_node(buf, offset: int) -> int:
+    if offset < len(buf) and buf[offset] in _bin_len:
+        return _skip_bin(buf, offset, MAX_NODE_FIELD)
+    return _skip_uint(buf, offset, 0xFFFFFFFF)[1]
+
+def _packet_end(buf, start: int, max_payload: int) -> int:
+    """End offset of the packet starting at the sync prefix at start."""
+    offset = start + len(SYNC_PREFIX)
+    length, offset = _skip_uint(buf, offset, max_payload)
+    _, offset = _skip_uint(buf, offset, 0xFFFF)  # CRC16
+    offset = _skip_node(buf, offset)
+    offset = _skip_node(buf, offset)
+    end = _skip_bin(buf, offset, max_payload)
+    if end > len(buf):
+        raise _Incomplete
+    return end
+
+class StreamDecoder:
+    """
+    Incremental decoder for a byte stream of UDP envelopes. feed() takes any
+    chunk of received bytes and returns the complete packets in it as
+    [source, destination, payload]. Garbage, truncated and corrupt packets are
+    skipped by resynchronising on the next sync prefix; the work per chunk is
+    find() plus a few field reads per packet, never a loop over bytes.
+    """
+    def __init__(self, node_index: Optional[NodeIndex] = None, max_payload: int = MAX_STREAM_PAYLOAD):
+        self.node_index = node_index
+        self.max_payload = max_payload
+        self.buffer = bytearray()
+        self.dropped_bytes = 0
+        self.bad_packets = 0
+
+    def feed(self, data) -> list:
+        buf = self.buffer
+        buf += data
+        packets = []
+        pos = 0
+        while True:
+            start = buf.find(SYNC_PREFIX, pos)
+            if start < 0:
+                # Keep a possible partial prefix at the end
+                keep = len(SYNC_PREFIX) - 1
+                self.dropped_bytes += max(len(buf) - pos - keep, 0)
+                pos = max(len(buf) - keep, pos)
+                break
+            self.dropped_bytes += start - pos
+            try:
+                end = _packet_end(buf, start, self.max_payload)
+            except _Incomplete:
+                pos = start
+                break
+            except ValueError:
+                # Not a real packet start, look for the next prefix
+                self.bad_packets += 1
+                self.dropped_bytes += 1
+                pos = start + 1
+                continue
+            try:
+                packets.append(decode_udp_packet(bytes(buf[start:end]), node_index=self.node_index))
+            except ValueError:
+                self.bad_packets += 1
+                self.dropped_bytes += 1
+                pos = start + 1
+                continue
+            pos = end
+        del buf[:pos]
+        return packets
+
+async def read_packets(reader: asyncio.StreamReader, decoder: Optional[StreamDecoder] = None, chunk_size: int = 4096):
+    """Async generator of [source, destination, payload] from a stream reader, until EOF."""
+    if decoder is None:
+        decoder = StreamDecoder()
+    while True:
+        data = await reader.read(chunk_size)
+        if not data:
+            return
+        for packet in decoder.feed(data):
+            yield packet
+
+async def open_fd_reader(fd: int) -> asyncio.StreamReader:
+    """StreamReader over a file descriptor (serial device, pty master)."""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), open(fd, "rb", buffering=0, closefd=False))
+    return reader
+
+if __name__ == "__main__":
+    # Loopback over a local pty pair, written in odd sized chunks: a clean
+    # stream, then one with garbage, corrupted and truncated packets in between.
+    # Exits non-zero if any packet is lost, corrupted or miscounted.
+    import os
+    import random
+    import sys
+    import tty
+    from message_structure import Messages
+    from protocol import encode_message
+
+    rng = random.Random(15)
+
+    async def loopback(stream: bytes) -> tuple:
+        master, slave = os.openpty()
+        tty.setraw(slave)
+        reader = await open_fd_reader(master)
+
+        async def write():
+            offset = 0
+            while offset < len(stream):
+                size = rng.randrange(1, 300)
+                os.write(slave, stream[offset:offset + size])
+                offset += size
+                await asyncio.sleep(0)
+            await asyncio.sleep(0.2)
+            os.close(slave)
+
+        decoder = StreamDecoder()
+        received = []
+        writer = asyncio.create_task(write())
+        try:
+            async for source, destination, payload in read_packets(reader, decoder):
+                received.append(payload)
+        except OSError:
+            pass  # EIO on the master once the slave side is closed
+        await writer
+        os.close(master)
+        return received, decoder
+
+    async def main() -> bool:
+        payloads = [encode_message(Messages.Testing.System.TEXTMSG, [f"status {i}".encode()]) for i in range(200)]
+        packets = [encode_udp_packet("drone1", "gcs1", payload) for payload in payloads]
+        ok = True
+
+        received, decoder = await loopback(b"".join(packets))
+        clean = received == payloads and decoder.bad_packets == 0 and decoder.dropped_bytes == 0
+        print(f"clean: {len(received)}/{len(payloads)} packets received, {decoder.bad_packets} bad, "
+              f"{decoder.dropped_bytes} bytes skipped {'OK' if clean else 'FAIL'}")
+        ok &= clean
+
+        stream = bytearray()
+        expected = []
+        damaged = 0
+        for i, packet in enumerate(packets):
+            if i % 25 == 0:
+                stream += bytes(rng.randrange(256) for _ in range(rng.randrange(1, 40)))
+            if i % 50 == 7:
+                corrupt = bytearray(packet)
+                corrupt[-2] ^= 0xFF
+                stream += corrupt
+                damaged += 1
+            elif i % 50 == 33:
+                stream += packet[:len(packet) // 2]
+                damaged += 1
+            else:
+                stream += packet
+                expected.append(payloads[i])
+        received, decoder = await loopback(bytes(stream))
+        # Every damaged packet fails at least once; garbage may add more
+        noisy = received == expected and decoder.bad_packets >= damaged and decoder.dropped_bytes > 0
+        print(f"noisy: {len(received)}/{len(expected)} packets received, {decoder.bad_packets} bad "
+              f"(>= {damaged} expected), {decoder.dropped_bytes} bytes skipped {'OK' if noisy else 'FAIL'}")
+        ok &= noisy
+        return ok
+
+    sys.exit(0 if asyncio.run(main()) else 1)